@@ -1,6 +1,7 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Import ValidationError from file_utils to maintain consistency
@@ -158,6 +159,111 @@ def remove_dots(
         )
 
 
+def to_year_keys(values: pd.Series) -> pd.Series:
+    """
+    Convert a column of years to int16 year keys.
+
+    Integer columns are cast directly and numeric strings are parsed with
+    pd.to_numeric; only other values, such as full dates, go through the
+    datetime parser.
+
+    Args:
+        values (pd.Series): Years as integers, strings or datetimes.
+
+    Returns:
+        pd.Series: int16 years.
+
+    Raises:
+        ValueError: If a year is missing or cannot be parsed.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = values.dt.year
+    elif not pd.api.types.is_integer_dtype(values):
+        try:
+            values = pd.to_numeric(values)
+        except (ValueError, TypeError):
+            values = pd.to_datetime(values).dt.year
+    if values.isna().any():
+        raise ValueError(f"Column '{values.name}' has missing years")
+    return values.astype("int16")
+
+
+def year_keys_to_datetime(values: pd.Series) -> pd.Series:
+    """
+    Convert int16 year keys to datetime64 values on January 1st.
+
+    Args:
+        values (pd.Series): Integer years.
+
+    Returns:
+        pd.Series: datetime64[ns] column, as parse_dates gives for years.
+    """
+    years = values.to_numpy(dtype=np.int64) - 1970
+    return pd.Series(
+        years.astype("datetime64[Y]").astype("datetime64[ns]"),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def split_dimension(
+    df: pd.DataFrame, columns: List[str], id_column: str
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Move columns that repeat per entity into a dimension table.
+
+    Every distinct combination of the columns (missing values included)
+    becomes one dimension row, and its position in the dimension is the
+    integer id stored in the fact table, where the first of the columns
+    was. join_dimension restores the original frame.
+
+    Args:
+        df (pd.DataFrame): Dataset repeating the columns on every row.
+        columns (List[str]): Columns describing the entity.
+        id_column (str): Name of the id column added to the fact table.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The fact table, without the
+            columns, and the dimension table, one row per id.
+    """
+    ids = (
+        df.groupby(columns, dropna=False, sort=False, observed=True)
+        .ngroup()
+        .to_numpy()
+    )
+    ids = ids.astype(np.min_scalar_type(max(len(df) - 1, 0)))
+    _, first_rows = np.unique(ids, return_index=True)
+    dimension = df[columns].iloc[first_rows].reset_index(drop=True)
+
+    position = min(df.columns.get_loc(column) for column in columns)
+    fact = df.drop(columns=columns)
+    fact.insert(position, id_column, ids)
+    return fact, dimension
+
+
+def join_dimension(
+    df: pd.DataFrame, dimension: pd.DataFrame, id_column: str
+) -> pd.DataFrame:
+    """
+    Replace an id column by the dimension columns it points to.
+
+    Args:
+        df (pd.DataFrame): Fact table from split_dimension; it is not
+            modified.
+        dimension (pd.DataFrame): Dimension table, one row per id.
+        id_column (str): Id column of the fact table.
+
+    Returns:
+        pd.DataFrame: Dataset with the dimension columns where the id was.
+    """
+    position = df.columns.get_loc(id_column)
+    rows = dimension.iloc[df[id_column].to_numpy()]
+    rows.index = df.index
+    return pd.concat(
+        [df.iloc[:, :position], rows, df.iloc[:, position + 1 :]], axis=1
+    )
+
+
 def log_null_values(df: pd.DataFrame) -> None:
     """
     Log the count of null values per column, if any.
@@ -4,7 +4,6 @@ from pathlib import Path
 from typing import Any, Dict, Union
 import logging
 
-import joblib
 import yaml
 
 logger = logging.getLogger("FileUtils")
@@ -99,6 +98,8 @@ def load_pickle_file(file_path: str) -> Any:
     if not path.is_file():
         raise FileNotFoundError(f"Expected file not found: {file_path}")
 
+    import joblib
+
     return joblib.load(file_path)
 
 
@@ -110,6 +111,8 @@ def save_pickle_file(data: Any, file_path: str) -> None:
         data (Any): Data to save.
         file_path (Path): Path where the data should be saved.
     """
+    import joblib
+
     create_directory(file_path)
     joblib.dump(data, file_path)
 
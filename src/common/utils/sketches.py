@@ -0,0 +1,403 @@
+"""
+Mergeable probabilistic sketches for single-pass statistics.
+
+These sketches summarise columns that do not fit in memory. Every sketch
+can be updated chunk by chunk and merged with another sketch of the same
+configuration, so partial results computed over row groups, files or
+partitions combine into one summary.
+"""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Hash the non-null values of a Series into 64-bit integers.
+
+    Categorical values are hashed by their category label, so the same
+    value produces the same hash regardless of the category codes used in
+    each chunk.
+
+    Args:
+        values (pd.Series): Values to hash.
+
+    Returns:
+        np.ndarray: uint64 hash per non-null value.
+    """
+    non_null = values[values.notna()]
+    return pd.util.hash_pandas_object(non_null, index=False).to_numpy()
+
+
+def mix64(keys: np.ndarray) -> np.ndarray:
+    """
+    splitmix64 finalizer over an array of uint64 keys.
+
+    Args:
+        keys (np.ndarray): uint64 keys.
+
+    Returns:
+        np.ndarray: Well-mixed uint64 keys, one per input key.
+    """
+    with np.errstate(over="ignore"):
+        keys = keys + np.uint64(0x9E3779B97F4A7C15)
+        keys = (keys ^ (keys >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        keys = (keys ^ (keys >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return keys ^ (keys >> np.uint64(31))
+
+
+def float_bit_keys(
+    values: np.ndarray, nulls: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    64-bit keys of float values; equal values share a key.
+
+    +0.0 folds -0.0 into 0.0, and every NaN gets the same bit pattern.
+
+    Args:
+        values (np.ndarray): float64 values.
+        nulls (Optional[np.ndarray]): NaN mask of the values, computed if
+            not given.
+
+    Returns:
+        np.ndarray: uint64 key per value.
+    """
+    if nulls is None:
+        nulls = np.isnan(values)
+    if not nulls.any():
+        return (values + 0.0).view(np.uint64)
+    return np.where(nulls, np.nan, values + 0.0).view(np.uint64)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count sketch.
+
+    Uses ``2 ** precision`` registers; the relative standard error of the
+    estimate is ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    def __init__(self, precision: int = 14):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            precision (int): Number of hash bits used to select a register.
+                Must be between 11 and 18.
+
+        Raises:
+            ValueError: If precision is out of range.
+        """
+        if not 11 <= precision <= 18:
+            raise ValueError("precision must be between 11 and 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of the distinct-count estimate."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add the non-null values of a Series to the sketch.
+
+        Args:
+            values (pd.Series): Values to count.
+        """
+        self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Add precomputed 64-bit hashes to the sketch.
+
+        Args:
+            hashes (np.ndarray): uint64 hashes.
+        """
+        if hashes.size == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        tail_bits = 64 - self.precision
+        index = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        # tail < 2**53, so the float conversion in frexp is exact
+        _, bit_length = np.frexp(tail.astype(np.float64))
+        rank = (tail_bits - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other (HyperLogLog): Sketch built with the same precision.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        """
+        Estimate the number of distinct values added so far.
+
+        Returns:
+            float: Estimated distinct count.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.exp2(-self.registers.astype(float)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return m * math.log(m / zeros)
+        return float(raw)
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch over numeric values.
+
+    Keeps a hierarchy of compactors where an item at level ``h`` stands for
+    ``2 ** h`` input values. The normalized rank error is roughly
+    ``2.296 / k ** 0.9723`` (about 1.3% for the default ``k=200``).
+    """
+
+    _MIN_CAPACITY = 8
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k (int): Capacity of the top compactor; controls accuracy.
+            seed (Optional[int]): Seed for the compaction coin flips.
+        """
+        self.k = k
+        self.count = 0
+        self.min_value = math.inf
+        self.max_value = -math.inf
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Approximate normalized rank error of quantile estimates."""
+        return 2.296 / self.k**0.9723
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add the non-null values of a numeric Series to the sketch.
+
+        Args:
+            values (pd.Series): Numeric values.
+        """
+        array = pd.to_numeric(values, errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        array = array[~np.isnan(array)]
+        if array.size == 0:
+            return
+        self.count += array.size
+        self.min_value = min(self.min_value, float(array.min()))
+        self.max_value = max(self.max_value, float(array.max()))
+        self.levels[0] = np.concatenate([self.levels[0], array])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other (KLLSketch): Sketch to merge.
+        """
+        if other.count == 0:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for height, items in enumerate(other.levels):
+            self.levels[height] = np.concatenate([self.levels[height], items])
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the value at quantile ``q``.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float: Estimated quantile, or NaN if the sketch is empty.
+        """
+        return float(self.quantiles([q])[0])
+
+    def quantiles(self, qs: List[float]) -> np.ndarray:
+        """
+        Estimate several quantiles at once.
+
+        Args:
+            qs (List[float]): Quantiles between 0 and 1.
+
+        Returns:
+            np.ndarray: Estimated values, NaN if the sketch is empty.
+        """
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level), 2**height, dtype=np.float64)
+                for height, level in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        targets = np.asarray(qs, dtype=np.float64) * cumulative[-1]
+        positions = np.searchsorted(cumulative, targets, side="left")
+        result = items[np.minimum(positions, len(items) - 1)]
+        # Extremes are tracked exactly
+        result = np.where(np.asarray(qs) <= 0, self.min_value, result)
+        return np.where(np.asarray(qs) >= 1, self.max_value, result)
+
+    def _capacity(self, height: int) -> int:
+        """Capacity of the compactor at the given height."""
+        depth = len(self.levels) - height - 1
+        return max(self._MIN_CAPACITY, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        """Compact every level that exceeds its capacity."""
+        height = 0
+        while height < len(self.levels):
+            level = self.levels[height]
+            if len(level) > self._capacity(height):
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                level = np.sort(level)
+                # An odd leftover item stays at this level
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                pairs = level[: len(level) - len(keep)]
+                offset = int(self._rng.integers(0, 2))
+                promoted = pairs[offset::2]
+                self.levels[height] = keep
+                self.levels[height + 1] = np.concatenate(
+                    [self.levels[height + 1], promoted]
+                )
+            height += 1
+
+
+class SpaceSaving:
+    """
+    Space-saving top-k sketch of the most frequent values.
+
+    Monitors at most ``capacity`` values with an overestimated count and
+    the largest possible overestimate of each. Any value seen more than
+    ``N / capacity`` times is monitored, and no count is off by more than
+    ``N / capacity``, where ``N`` is the number of values added.
+    """
+
+    def __init__(self, capacity: int = 100):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            capacity (int): Number of monitored values.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.count = 0
+        # Upper bound on the count of any value that is not monitored
+        self.floor = 0
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+
+    @property
+    def max_error(self) -> int:
+        """Largest possible overestimate of any monitored count."""
+        return int(self.errors.max()) if len(self.errors) else 0
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add the non-null values of a Series to the sketch.
+
+        The values of a chunk are counted exactly first, so the error
+        only comes from merging the chunk into the monitored values.
+
+        Args:
+            values (pd.Series): Values to count.
+        """
+        counts = values.value_counts(sort=False)
+        counts = counts[counts > 0]
+        if isinstance(counts.index, pd.CategoricalIndex):
+            counts.index = counts.index.astype(counts.index.categories.dtype)
+        self.update_counts(counts)
+
+    def update_counts(self, counts: pd.Series) -> None:
+        """
+        Add exact counts of values, indexed by value.
+
+        Args:
+            counts (pd.Series): Count of each distinct value.
+        """
+        chunk = SpaceSaving(self.capacity)
+        chunk.counts = counts.astype(np.int64)
+        chunk.errors = pd.Series(0, index=counts.index, dtype=np.int64)
+        chunk.count = int(counts.sum())
+        self.merge(chunk)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """
+        Merge another sketch into this one.
+
+        A value missing from one sketch is counted with that sketch's
+        floor, the most it can have been seen there.
+
+        Args:
+            other (SpaceSaving): Sketch to merge.
+        """
+        values = self.counts.index.append(other.counts.index).unique()
+        counts = self.counts.reindex(values, fill_value=self.floor)
+        counts += other.counts.reindex(values, fill_value=other.floor)
+        errors = self.errors.reindex(values, fill_value=self.floor)
+        errors += other.errors.reindex(values, fill_value=other.floor)
+
+        floor = self.floor + other.floor
+        if len(counts) > self.capacity:
+            order = np.argsort(-counts.to_numpy(), kind="stable")
+            floor = max(floor, int(counts.iat[order[self.capacity]]))
+            counts = counts.iloc[order[: self.capacity]]
+            errors = errors.iloc[order[: self.capacity]]
+        self.counts = counts
+        self.errors = errors
+        self.floor = floor
+        self.count += other.count
+
+    def top(self, n: int = 1) -> pd.DataFrame:
+        """
+        Most frequent values with their count bounds.
+
+        Args:
+            n (int): Number of values to return.
+
+        Returns:
+            pd.DataFrame: 'count' (upper bound) and 'min_count' (lower
+                bound) of the n values with the highest counts, indexed by
+                value.
+        """
+        order = np.argsort(-self.counts.to_numpy(), kind="stable")[:n]
+        counts = self.counts.iloc[order]
+        return pd.DataFrame(
+            {"count": counts, "min_count": counts - self.errors.iloc[order]}
+        )
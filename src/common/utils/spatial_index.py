@@ -0,0 +1,280 @@
+"""
+Grid index over station coordinates for nearest-station queries.
+
+Coordinates are stored as 3-D unit vectors, so the straight-line (chord)
+distance between two points orders them exactly like their great-circle
+distance, with no map projection error. The vectors are bucketed into
+cubic grid cells; a query scans the rings of cells around its own cell
+until no unscanned cell can hold a closer station.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Signed cell coordinates are packed into one int64 key, 21 bits per axis
+_AXIS_BITS = 21
+_AXIS_OFFSET = 1 << (_AXIS_BITS - 1)
+
+
+def unit_vectors(longitude: np.ndarray, latitude: np.ndarray) -> np.ndarray:
+    """
+    Convert coordinates in degrees to 3-D unit vectors.
+
+    Args:
+        longitude (np.ndarray): Longitudes in degrees.
+        latitude (np.ndarray): Latitudes in degrees.
+
+    Returns:
+        np.ndarray: Array of shape (n, 3).
+    """
+    lon = np.radians(np.asarray(longitude, dtype=np.float64))
+    lat = np.radians(np.asarray(latitude, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack(
+        (cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat))
+    )
+
+
+def chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """Great-circle distance in km of chord lengths on the unit sphere."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+def km_to_chord(distance_km: float) -> float:
+    """Chord length on the unit sphere of a great-circle distance in km."""
+    return float(2 * np.sin(min(distance_km / EARTH_RADIUS_KM, np.pi) / 2))
+
+
+class StationIndex:
+    """
+    Nearest-station index over a set of station coordinates.
+
+    Stations are sorted by grid cell, so the stations of a cell are one
+    contiguous slice found with np.searchsorted. Queries are answered
+    together: every ring of cells is scanned for all unresolved queries
+    at once, and a query is resolved once its best distance is within
+    the radius already covered. With cells about as large as the typical
+    distance between stations, most queries finish in the first ring.
+    """
+
+    def __init__(
+        self,
+        longitude: np.ndarray,
+        latitude: np.ndarray,
+        cell_km: float = 10.0,
+    ):
+        """
+        Build the index.
+
+        Args:
+            longitude (np.ndarray): Station longitudes in degrees.
+            latitude (np.ndarray): Station latitudes in degrees.
+            cell_km (float): Edge of a grid cell, in km.
+
+        Raises:
+            ValueError: If a coordinate is missing or cell_km is not
+                positive, or too small for the cell keys.
+        """
+        if cell_km <= 0:
+            raise ValueError("cell_km must be positive")
+        points = unit_vectors(longitude, latitude)
+        if np.isnan(points).any():
+            raise ValueError("Station coordinates must not be missing")
+
+        self.cell_size = cell_km / EARTH_RADIUS_KM
+        if 2 / self.cell_size >= _AXIS_OFFSET:
+            raise ValueError(
+                f"cell_km must be at least "
+                f"{2 * EARTH_RADIUS_KM / _AXIS_OFFSET:.3f} km"
+            )
+        self.size = len(points)
+        keys = self._cell_keys(self._cells(points))
+        # Station positions sorted by cell key
+        self.order = np.argsort(keys, kind="stable")
+        self.points = points[self.order]
+        self.cell_keys, self.cell_starts = np.unique(
+            keys[self.order], return_index=True
+        )
+        self.cell_ends = np.append(self.cell_starts[1:], self.size)
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        longitude_column: str = "Longitude",
+        latitude_column: str = "Latitude",
+        cell_km: float = 10.0,
+    ) -> "StationIndex":
+        """
+        Build the index over the coordinates of a DataFrame's rows.
+
+        Args:
+            df (pd.DataFrame): One row per station, without missing
+                coordinates.
+            longitude_column (str): Longitude column.
+            latitude_column (str): Latitude column.
+            cell_km (float): Edge of a grid cell, in km.
+
+        Returns:
+            StationIndex: Index whose positions are the rows of df.
+        """
+        return cls(
+            df[longitude_column].to_numpy(dtype=np.float64),
+            df[latitude_column].to_numpy(dtype=np.float64),
+            cell_km=cell_km,
+        )
+
+    def nearest(
+        self,
+        longitude: np.ndarray,
+        latitude: np.ndarray,
+        max_distance_km: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest station of every query point.
+
+        Args:
+            longitude (np.ndarray): Query longitudes in degrees.
+            latitude (np.ndarray): Query latitudes in degrees.
+            max_distance_km (Optional[float]): Ignore stations farther
+                than this distance.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Position of the nearest station
+                (-1 if none, or the query has missing coordinates) and its
+                great-circle distance in km (inf if none).
+        """
+        queries = unit_vectors(longitude, latitude)
+        best = np.full(len(queries), np.inf)
+        best_station = np.full(len(queries), -1, dtype=np.int64)
+        limit = (
+            km_to_chord(max_distance_km)
+            if max_distance_km is not None
+            else np.inf
+        )
+        if not self.size:
+            return best_station, best
+
+        pending = np.flatnonzero(~np.isnan(queries).any(axis=1))
+        query_keys = self._cell_keys(self._cells(queries[pending]))
+        ring = 0
+        while len(pending):
+            if (2 * ring + 1) ** 3 > self.size:
+                # Far from every station: the scanned block would have
+                # more cells than there are stations, so compare with all
+                # stations instead
+                self._scan_all(pending, queries, best, best_station)
+                break
+            self._scan_ring(
+                ring, pending, query_keys, queries, best, best_station
+            )
+            # Stations outside the scanned rings are farther than
+            # ring * cell_size from the query
+            covered = ring * self.cell_size
+            unresolved = (best[pending] > covered) & (covered < limit)
+            pending = pending[unresolved]
+            query_keys = query_keys[unresolved]
+            ring += 1
+
+        found = np.isfinite(best) & (best <= limit)
+        positions = np.where(found, self.order[best_station], -1)
+        return positions, np.where(found, chord_to_km(best), np.inf)
+
+    def _scan_ring(
+        self,
+        ring: int,
+        pending: np.ndarray,
+        query_keys: np.ndarray,
+        queries: np.ndarray,
+        best: np.ndarray,
+        best_station: np.ndarray,
+    ) -> None:
+        """
+        Compare the pending queries with the stations of one ring of cells
+        around them, updating their best distance in place.
+        """
+        # Packed keys are linear in the cell coordinates, so the key of a
+        # neighbouring cell is the query's key plus the offset's key
+        offsets = self._ring_offsets(ring)
+        cell_keys = (
+            query_keys[:, None] + self._cell_keys(offsets)[None, :]
+        ).ravel()
+        slots = np.searchsorted(self.cell_keys, cell_keys)
+        slots = np.minimum(slots, len(self.cell_keys) - 1)
+        occupied = self.cell_keys[slots] == cell_keys
+        if not occupied.any():
+            return
+
+        # One (query, station) pair per station of every occupied cell
+        query_of_cell = np.repeat(pending, len(offsets))[occupied]
+        starts = self.cell_starts[slots[occupied]]
+        counts = self.cell_ends[slots[occupied]] - starts
+        pair_queries = np.repeat(query_of_cell, counts)
+        pair_stations = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        pair_stations += np.arange(len(pair_stations))
+
+        distances = np.linalg.norm(
+            queries[pair_queries] - self.points[pair_stations], axis=1
+        )
+        # Closest pair of every query: sort by distance, keep the first
+        order = np.argsort(distances, kind="stable")
+        unique_queries, first = np.unique(
+            pair_queries[order], return_index=True
+        )
+        nearest = order[first]
+        closer = distances[nearest] < best[unique_queries]
+        best[unique_queries[closer]] = distances[nearest[closer]]
+        best_station[unique_queries[closer]] = pair_stations[nearest[closer]]
+
+    def _scan_all(
+        self,
+        pending: np.ndarray,
+        queries: np.ndarray,
+        best: np.ndarray,
+        best_station: np.ndarray,
+    ) -> None:
+        """
+        Compare the pending queries with every station, in blocks of
+        about a million pairs.
+        """
+        n_blocks = max(1, len(pending) * self.size // 1_000_000)
+        for block in np.array_split(pending, n_blocks):
+            # The nearest unit vector has the largest dot product, found
+            # with one matrix product; its exact distance is computed after
+            nearest = (queries[block] @ self.points.T).argmax(axis=1)
+            distances = np.linalg.norm(
+                queries[block] - self.points[nearest], axis=1
+            )
+            closer = distances < best[block]
+            best[block[closer]] = distances[closer]
+            best_station[block[closer]] = nearest[closer]
+
+    def _cells(self, points: np.ndarray) -> np.ndarray:
+        """Integer grid cell of every point."""
+        return np.floor(points / self.cell_size).astype(np.int64)
+
+    @staticmethod
+    def _cell_keys(cells: np.ndarray) -> np.ndarray:
+        """
+        Pack (n, 3) cell coordinates into int64 keys.
+
+        Keys are sums, not bitwise ors, so offsets can be added to them.
+        """
+        return (
+            (cells[:, 0] << (2 * _AXIS_BITS))
+            + (cells[:, 1] << _AXIS_BITS)
+            + cells[:, 2]
+        )
+
+    @staticmethod
+    def _ring_offsets(ring: int) -> np.ndarray:
+        """Cell offsets at Chebyshev distance 'ring', shape (m, 3)."""
+        steps = np.arange(-ring, ring + 1)
+        offsets = np.stack(
+            np.meshgrid(steps, steps, steps, indexing="ij"), axis=-1
+        ).reshape(-1, 3)
+        return offsets[np.abs(offsets).max(axis=1) == ring]
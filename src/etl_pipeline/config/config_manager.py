@@ -12,6 +12,12 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+from etl_pipeline.config.feature_schema import (
+    DEFAULT_FEATURE_TYPES_PATH,
+    FeatureSchema,
+    load_feature_schema,
+)
+
 
 class ConfigManager:
     """
@@ -34,6 +40,7 @@ class ConfigManager:
         self.env = env or os.getenv("ETL_ENV", "development")
         self.config_path = config_path or Path(__file__).parent
         self.config = self._load_config()
+        self.feature_types_path = DEFAULT_FEATURE_TYPES_PATH
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _load_config(self) -> Dict[str, Any]:
@@ -122,6 +129,20 @@ class ConfigManager:
         """Get logging configuration."""
         return self.get("logging", {})
 
+    def get_feature_schema(self) -> FeatureSchema:
+        """
+        Get the feature schema from feature_types.yaml.
+
+        The schema is parsed once per process and reloaded only when the
+        file modification time changes.
+        """
+        try:
+            return load_feature_schema(self.feature_types_path)
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to load feature schema: {str(e)}"
+            )
+
     def get_pipeline_steps(self) -> List[Dict[str, Any]]:
         """Get enabled pipeline steps configuration."""
         steps = self.get("pipeline.steps", [])
@@ -0,0 +1,88 @@
+"""
+Typed view of common/feature_types.yaml.
+
+The schema is parsed once per process and memoized by file path. Every
+lookup compares the file modification time with the cached one, so a
+long-running process picks up edits to the YAML without a restart.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from common.utils.file_utils import load_yaml_config
+
+DEFAULT_FEATURE_TYPES_PATH = (
+    Path(__file__).parent.parent.parent / "common" / "feature_types.yaml"
+)
+
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    """Column dtypes and feature groups declared in feature_types.yaml."""
+
+    var_dtypes: Dict[str, str] = field(default_factory=dict)
+    categories: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    numerical_features: Tuple[str, ...] = ()
+    date_features: Tuple[str, ...] = ()
+    drop_colnames: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, feature_config: Dict[str, Any]) -> "FeatureSchema":
+        """
+        Build the schema from the parsed YAML content.
+
+        Args:
+            feature_config (Dict[str, Any]): Parsed feature_types.yaml.
+
+        Returns:
+            FeatureSchema: Schema of the 'preprocess' section.
+        """
+        preprocess = (feature_config or {}).get("preprocess", {}) or {}
+        return cls(
+            var_dtypes=dict(preprocess.get("var_dtypes") or {}),
+            categories={
+                feature["name"]: tuple(feature.get("categories") or ())
+                for feature in preprocess.get("categorical_features") or []
+            },
+            numerical_features=tuple(
+                preprocess.get("numerical_features") or ()
+            ),
+            date_features=tuple(preprocess.get("date_features") or ()),
+            drop_colnames=tuple(preprocess.get("drop_colnames") or ()),
+        )
+
+
+_cache: Dict[Path, Tuple[int, FeatureSchema]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_feature_schema(
+    path: Optional[Union[str, Path]] = None,
+) -> FeatureSchema:
+    """
+    Return the memoized schema, reloading it if the file has changed.
+
+    Args:
+        path (Optional[Union[str, Path]]): feature_types.yaml location.
+            Defaults to the file shipped in the common package.
+
+    Returns:
+        FeatureSchema: Parsed schema.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    schema_path = Path(path or DEFAULT_FEATURE_TYPES_PATH).resolve()
+    if not schema_path.is_file():
+        raise FileNotFoundError(f"Expected file not found: {schema_path}")
+    mtime = schema_path.stat().st_mtime_ns
+
+    with _cache_lock:
+        cached = _cache.get(schema_path)
+        if cached is None or cached[0] != mtime:
+            schema = FeatureSchema.from_dict(load_yaml_config(schema_path))
+            _cache[schema_path] = (mtime, schema)
+            return schema
+        return cached[1]
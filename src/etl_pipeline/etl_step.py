@@ -4,9 +4,10 @@ Base classes for extraction steps.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ETLStep(ABC):
@@ -19,7 +20,7 @@ class ETLStep(ABC):
 
     @abstractmethod
     def execute(
-        self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
+        self, dataframes: Dict[str, "pd.DataFrame"], context: Dict[str, Any]
     ) -> None:
         """Execute the ETL step."""
         pass
@@ -2,6 +2,27 @@
 Extract module - Contains all data extraction related classes.
 """
 
-from .data_extraction_step import DataExtractionStep
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["DataExtractionStep"]
+if TYPE_CHECKING:
+    from .data_extraction_step import DataExtractionStep
+    from .source_frame_cache import SourceFrameCache
+
+# Imported on first access, like etl_pipeline.transform
+_MODULES = {
+    "DataExtractionStep": ".data_extraction_step",
+    "SourceFrameCache": ".source_frame_cache",
+}
+
+__all__ = [
+    "DataExtractionStep",
+    "SourceFrameCache",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested class from its module."""
+    if name in _MODULES:
+        return getattr(import_module(_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,8 @@
 Data extraction step for all data sources.
 """
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 import pandas as pd
 from etl_pipeline.extract.data_extractors import (
@@ -10,6 +11,7 @@ from etl_pipeline.extract.data_extractors import (
     HealthDataExtractor,
     SocioeconomicDataExtractor,
 )
+from etl_pipeline.extract.source_frame_cache import SourceFrameCache
 
 from etl_pipeline import ETLStep
 
@@ -19,11 +21,17 @@ class DataExtractionStep(ETLStep):
     ETL step responsible for extracting raw datasets from all data sources.
     """
 
-    def __init__(self):
+    def __init__(self, source_cache: Optional[SourceFrameCache] = None):
         """
         Initialize the data extraction step.
+
+        Args:
+            source_cache (Optional[SourceFrameCache]): Cache that keeps the
+                extracted datasets in memory between runs. Without it every
+                run reads the raw files.
         """
         super().__init__(__name__)
+        self.source_cache = source_cache
 
     def execute(
         self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
@@ -50,6 +58,29 @@ class DataExtractionStep(ETLStep):
             )
         data_path = context["data_path"]
 
+        if self.source_cache is None:
+            self._extract_sources(data_path, dataframes)
+        else:
+            dataframes.update(
+                self.source_cache.get(
+                    data_path,
+                    lambda frames: self._extract_sources(data_path, frames),
+                )
+            )
+
+        self.log_success(f"Extracted {len(dataframes)} datasets")
+
+    def _extract_sources(
+        self, data_path: Path, dataframes: Dict[str, pd.DataFrame]
+    ) -> None:
+        """
+        Run every extractor against the raw files in data_path.
+
+        Args:
+            data_path (Path): Main data directory.
+            dataframes (Dict[str, pd.DataFrame]): Dictionary to store the
+                extracted datasets.
+        """
         # Air Quality Data
         self.logger.info("Extracting air quality data...")
         AirQualityDataExtractor(data_path).extract(dataframes)
@@ -61,5 +92,3 @@ class DataExtractionStep(ETLStep):
         # Socioeconomic Data
         self.logger.info("Extracting socioeconomic data...")
         SocioeconomicDataExtractor(data_path).extract(dataframes)
-
-        self.log_success(f"Extracted {len(dataframes)} datasets")
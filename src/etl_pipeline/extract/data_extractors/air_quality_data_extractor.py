@@ -41,6 +41,10 @@ class AirQualityDataExtractor(BaseExtractor):
         self._format = self.config.get(
             "data_sources.air_quality.format", "csv"
         )
+        self._date_columns = ["Year"]
+        self._int_year_keys = self.config.get(
+            "processing.int_year_keys", False
+        )
 
     def extract(self, dataframes: Dict[str, pd.DataFrame]) -> None:
         """
@@ -80,8 +84,11 @@ class AirQualityDataExtractor(BaseExtractor):
 
         try:
             df: pd.DataFrame = pd.read_csv(  # type: ignore
-                file_path, usecols=self._cols_to_use, parse_dates=["Year"]
+                file_path,
+                usecols=self._cols_to_use,
+                parse_dates=self._parse_dates(),
             )
+            self._to_year_keys(df)
             self._log_dataframe_info(df)
             return df
         except Exception as e:
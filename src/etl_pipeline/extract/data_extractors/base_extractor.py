@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pandas as pd
 
@@ -11,6 +11,7 @@ from common.utils.dataframe_utils import (
     log_info,
     log_memory_usage,
     log_null_values,
+    to_year_keys,
 )
 
 
@@ -29,6 +30,10 @@ class BaseExtractor(ABC):
         self.data_path = data_path
         self.raw_folder = "raw"
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Year columns of the raw files, and whether they are read as
+        # int16 year keys ('processing.int_year_keys') instead of dates
+        self._date_columns: List[str] = []
+        self._int_year_keys = False
 
     @abstractmethod
     def extract(self, dataframes: Dict[str, pd.DataFrame]) -> None:
@@ -59,3 +64,28 @@ class BaseExtractor(ABC):
         log_empty_rows(df)
         log_info(df)
         log_memory_usage(df)
+
+    def _parse_dates(self) -> Optional[List[str]]:
+        """
+        The parse_dates argument of read_csv for the year columns.
+
+        Returns:
+            Optional[List[str]]: None when years are read as integer keys.
+        """
+        return None if self._int_year_keys else self._date_columns
+
+    def _to_year_keys(self, df: pd.DataFrame) -> None:
+        """
+        Convert the year columns to int16 year keys, when enabled.
+
+        Plain integer years skip the datetime parser entirely; the pipeline
+        only compares and merges on the year number.
+
+        Args:
+            df: DataFrame to convert in place.
+        """
+        if not self._int_year_keys:
+            return
+        for column in self._date_columns:
+            if column in df.columns:
+                df[column] = to_year_keys(df[column])
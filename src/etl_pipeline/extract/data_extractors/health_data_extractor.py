@@ -16,12 +16,8 @@ class HealthDataExtractor(BaseExtractor):
     Loads and returns two separate DataFrames from raw CSV files.
     """
 
-    _COLUMN_DTYPES: Dict[str, str] = {
-        "Causa de muerte": "category",
-        "Sexo": "category",
-        "Provincias": "category",
-        "Total": "float64",
-    }
+    # Totals are parsed by read_csv with the thousands separator
+    _RESPIRATORY_DTYPES: Dict[str, str] = {"Total": "float64"}
 
     def __init__(self, data_path: Path):
         """
@@ -54,6 +50,9 @@ class HealthDataExtractor(BaseExtractor):
         self._respiratory_decimal = self.config.get(
             "data_sources.health.respiratory_decimal", ","
         )
+        self._respiratory_thousands = self.config.get(
+            "data_sources.health.respiratory_thousands", "."
+        )
         self._life_expectancy_separator = self.config.get(
             "data_sources.health.life_expectancy_separator", ";"
         )
@@ -66,6 +65,9 @@ class HealthDataExtractor(BaseExtractor):
         self._date_columns = self.config.get(
             "data_sources.health.date_columns", ["Periodo"]
         )
+        self._int_year_keys = self.config.get(
+            "processing.int_year_keys", False
+        )
 
     def extract(self, dataframes: Dict[str, pd.DataFrame]) -> None:
         """
@@ -119,19 +121,23 @@ class HealthDataExtractor(BaseExtractor):
         try:
             respiratory_df = pd.read_csv(  # type: ignore
                 respiratory_file,
-                parse_dates=self._date_columns,
+                parse_dates=self._parse_dates(),
                 decimal=self._respiratory_decimal,
+                thousands=self._respiratory_thousands,
+                dtype=self._RESPIRATORY_DTYPES,
                 sep=self._respiratory_separator,
             )
 
             life_expectancy_df = pd.read_csv(  # type: ignore
                 life_expectancy_file,
-                parse_dates=self._date_columns,
+                parse_dates=self._parse_dates(),
                 decimal=self._life_expectancy_decimal,
                 sep=self._life_expectancy_separator,
                 encoding=self._life_expectancy_encoding,
             )
 
+            self._to_year_keys(respiratory_df)
+            self._to_year_keys(life_expectancy_df)
             self._log_dataframe_info(respiratory_df)
             self._log_dataframe_info(life_expectancy_df)
 
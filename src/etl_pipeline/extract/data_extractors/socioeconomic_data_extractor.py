@@ -15,6 +15,9 @@ class SocioeconomicDataExtractor(BaseExtractor):
     Loads and returns raw data from two CSV sources.
     """
 
+    # Totals are parsed by read_csv with the thousands separator
+    _POPULATION_DTYPES: Dict[str, str] = {"Total": "int64"}
+
     def __init__(self, data_path: Path):
         """
         Initialize the extractor with the path to the data directory.
@@ -57,12 +60,18 @@ class SocioeconomicDataExtractor(BaseExtractor):
         self._population_decimal = self.config.get(
             "data_sources.socioeconomic.population_decimal", ","
         )
+        self._population_thousands = self.config.get(
+            "data_sources.socioeconomic.population_thousands", "."
+        )
         self._population_encoding = self.config.get(
             "data_sources.socioeconomic.population_encoding", "latin1"
         )
         self._date_columns = self.config.get(
             "data_sources.socioeconomic.date_columns", ["Periodo"]
         )
+        self._int_year_keys = self.config.get(
+            "processing.int_year_keys", False
+        )
 
     def extract(self, dataframes: Dict[str, pd.DataFrame]) -> None:
         """
@@ -130,13 +139,16 @@ class SocioeconomicDataExtractor(BaseExtractor):
 
             population_21_df = pd.read_csv(  # type: ignore
                 population_21_file,
-                parse_dates=self._date_columns,
+                parse_dates=self._parse_dates(),
                 sep=self._population_separator,
                 decimal=self._population_decimal,
+                thousands=self._population_thousands,
+                dtype=self._POPULATION_DTYPES,
                 encoding=self._population_encoding,
             )
 
 
+            self._to_year_keys(population_21_df)
             self._log_dataframe_info(gdp_df)
             self._log_dataframe_info(population_21_df)
 
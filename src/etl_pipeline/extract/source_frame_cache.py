@@ -0,0 +1,81 @@
+"""
+In-process cache of the extracted source datasets.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pandas as pd
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+class SourceFrameCache:
+    """
+    Keeps the raw DataFrames extracted from a data directory in memory.
+
+    Entries are keyed by data directory and invalidated when any file
+    under its '<source>/raw' folders is added, removed or modified. Callers
+    receive deep copies, because the pipeline steps modify the extracted
+    frames in place.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty cache.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._entries: Dict[
+            Path, Tuple[Signature, Dict[str, pd.DataFrame]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        data_path: Path,
+        loader: Callable[[Dict[str, pd.DataFrame]], None],
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Return the extracted datasets, running the loader on a cache miss.
+
+        Args:
+            data_path (Path): Data directory the datasets are read from.
+            loader (Callable[[Dict[str, pd.DataFrame]], None]): Function
+                that fills a dictionary with the extracted datasets.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Copies of the cached datasets.
+        """
+        key = Path(data_path).resolve()
+        signature = self._signature(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                self.logger.info(f"Loading source datasets from: {key}")
+                frames: Dict[str, pd.DataFrame] = {}
+                loader(frames)
+                entry = (signature, frames)
+                self._entries[key] = entry
+            else:
+                self.logger.info("Reusing cached source datasets")
+
+        return {name: df.copy() for name, df in entry[1].items()}
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _signature(self, data_path: Path) -> Signature:
+        """Path, modification time and size of every raw source file."""
+        return tuple(
+            sorted(
+                (str(path), stat.st_mtime_ns, stat.st_size)
+                for path in data_path.glob("*/raw/**/*")
+                if path.is_file()
+                for stat in (path.stat(),)
+            )
+        )
@@ -3,7 +3,27 @@
 Load module - Contains all data loading and export related classes.
 """
 
-from .data_export_step import DataExportStep
-from .data_quality_report_step import DataQualityReportStep
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["DataExportStep", "DataQualityReportStep"]
+if TYPE_CHECKING:
+    from .data_export_step import DataExportStep
+    from .data_quality_report_step import DataQualityReportStep
+
+# Imported on first access, like etl_pipeline.transform
+_MODULES = {
+    "DataExportStep": ".data_export_step",
+    "DataQualityReportStep": ".data_quality_report_step",
+}
+
+__all__ = [
+    "DataExportStep",
+    "DataQualityReportStep",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested class from its module."""
+    if name in _MODULES:
+        return getattr(import_module(_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
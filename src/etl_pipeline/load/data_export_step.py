@@ -1,8 +1,29 @@
-from typing import Any, Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 import pandas as pd
 
+from common.utils.dataframe_utils import (
+    join_dimension,
+    year_keys_to_datetime,
+)
 from etl_pipeline import ETLStep
+from etl_pipeline.config.feature_schema import load_feature_schema
+from etl_pipeline.load.data_exporters import (
+    BaseExporter,
+    CompactSchema,
+    CsvExporter,
+    DuckDBExporter,
+    IncrementalParquetExporter,
+    ParquetExporter,
+    PartitionedParquetExporter,
+    SqliteExporter,
+)
+
+# Formats of the province-year table; the others are laid out or indexed
+# for the station-level dataset
+_PROVINCE_YEAR_FORMATS = ("csv", "parquet")
 
 
 class DataExportStep(ETLStep):
@@ -10,13 +31,45 @@ class DataExportStep(ETLStep):
     ETL step responsible for exporting the dataset into multiple file formats.
 
     Requires:
-        - 'output_df' in the dataframes dictionary as the DataFrame to export.
+        - 'output_df' in the dataframes dictionary as the DataFrame to
+          export, or 'output_chunks' in the context as an iterable (e.g. a
+          generator) of cleaned DataFrame chunks.
         - 'data_path' in the context dictionary as the base path for
           output files.
         - 'export_format' in the context dictionary as a list of formats
           to export.
 
-    Supported export formats include 'csv' and 'parquet'.
+    Supported export formats include 'csv', 'parquet',
+    'partitioned_parquet' (Hive-style year=/province= Parquet dataset),
+    'incremental_parquet' (the same layout, updated in place by rewriting
+    only changed partitions; the diff is stored in context['export_stats']),
+    and 'sqlite' and 'duckdb' (embedded database files indexed on
+    province, year and air pollutant; duckdb is an optional dependency).
+    Format settings are read from the 'output' configuration section.
+    Several formats are written concurrently on a thread pool; the CSV and
+    Parquet writers release the GIL for most of their work.
+
+    With 'output.compact_schema.enabled', the full dataset is exported
+    with the narrowed dtypes of CompactSchema (float32, int16/int32,
+    dictionary strings) and the size savings are stored in
+    context['export_schema_report']. The 'output_df' frame is unchanged.
+
+    Chunks are appended to open writers as they arrive and released
+    before the next one is requested, so a streamed export holds about
+    one chunk in memory instead of the full dataset.
+
+    The 'province_year_df' table of ProvinceYearAggregationStep, when
+    present, is also written in the requested csv and parquet formats to
+    'output/province_year/'; the paths are stored in
+    context['province_year_paths'].
+
+    With 'processing.int_year_keys', the int16 'year' keys are exported as
+    datetime64 values, so the output schema does not depend on the option.
+
+    When DataTransformationStep moved the station metadata to the
+    'stations' dimension table, its columns are joined back in place of
+    'station_id' before export. The joined dataset replaces 'output_df'
+    (and 'stations' is removed), so the later steps see the full dataset.
     """
 
     def __init__(self):
@@ -25,6 +78,57 @@ class DataExportStep(ETLStep):
         """
         super().__init__(__name__)
 
+        # Try to load configuration, fall back to defaults if not available
+        try:
+            from etl_pipeline.config.config_manager import get_config
+
+            config = get_config()
+            self.output_config = config.get_output_config()
+            self.int_year_keys = config.get_processing_config().get(
+                "int_year_keys", False
+            )
+            feature_schema = config.get_feature_schema()
+        except ImportError:
+            self.logger.warning(
+                "Configuration manager not available, using default "
+                "export settings"
+            )
+            self.output_config = {}
+            self.int_year_keys = False
+            feature_schema = load_feature_schema()
+
+        compact_options = self.output_config.get("compact_schema", {})
+        self.compact_schema = (
+            CompactSchema(feature_schema, compact_options)
+            if compact_options.get("enabled", False)
+            else None
+        )
+
+        parquet_options = self.output_config.get("parquet", {})
+        partitioned_options = self.output_config.get("partitioned_parquet", {})
+        self.exporters: Dict[str, BaseExporter] = {
+            "csv": CsvExporter(self.output_config.get("csv", {})),
+            "parquet": ParquetExporter(parquet_options),
+            "partitioned_parquet": PartitionedParquetExporter(
+                {**parquet_options, **partitioned_options}
+            ),
+            # Not the partitioned directory: that export replaces the
+            # whole dataset, manifest included
+            "incremental_parquet": IncrementalParquetExporter(
+                {
+                    **parquet_options,
+                    **{
+                        key: value
+                        for key, value in partitioned_options.items()
+                        if key != "directory"
+                    },
+                    **self.output_config.get("incremental_parquet", {}),
+                }
+            ),
+            "sqlite": SqliteExporter(self.output_config.get("database", {})),
+            "duckdb": DuckDBExporter(self.output_config.get("database", {})),
+        }
+
     def execute(
         self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
     ) -> None:
@@ -34,53 +138,276 @@ class DataExportStep(ETLStep):
         Args:
             dataframes (Dict[str, pd.DataFrame]): Dictionary containing
                 dataframes,
-                must include 'output_df'.
+                must include 'output_df' unless the context has
+                'output_chunks'.
             context (Dict[str, Any]): Dictionary with execution context,
                 must include
-                'data_path' and 'export_format'.
+                'data_path' and 'export_format'. May include
+                'output_chunks' to stream the dataset chunk by chunk.
 
         Raises:
             ValueError: If 'output_df' is missing or empty.
+            ValueError: If 'output_chunks' yields no rows.
+            ValueError: If two requested formats write the same target.
             ValueError: If 'data_path' or 'export_format' are missing in
                 the context.
         """
         self.log_start()
-        self._validate_arguments(dataframes, context)
+        output_chunks = context.get("output_chunks")
+        self._validate_arguments(
+            dataframes, context, streaming=output_chunks is not None
+        )
+
+        stations = dataframes.pop("stations", None)
+        if stations is not None:
+            if output_chunks is not None:
+                output_chunks = (
+                    join_dimension(chunk, stations, "station_id")
+                    for chunk in output_chunks
+                )
+            else:
+                dataframes["output_df"] = join_dimension(
+                    dataframes["output_df"], stations, "station_id"
+                )
 
-        output_df: pd.DataFrame = dataframes["output_df"]
         export_formats: List[str] = context["export_format"]
         output_dir = context["data_path"] / "output"
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        exported_files: Dict[str, str] = {}
-        output_file_path = ""
-
+        exporters: Dict[str, BaseExporter] = {}
         for format_type in export_formats:
-            if format_type == "csv":
-                output_file_path = output_dir / "dataset.csv"
-                output_df.to_csv(output_file_path, index=False)
-            elif format_type == "parquet":
-                output_file_path = output_dir / "dataset.parquet"
-                output_df.to_parquet(output_file_path)
-            else:
+            exporter = self.exporters.get(format_type)
+            if exporter is None:
                 self.logger.warning(
                     f"Unsupported export format: {format_type}"
                 )
                 continue
+            exporters[format_type] = exporter
+
+        targets: Dict[str, str] = {}
+        for format_type, exporter in exporters.items():
+            other = targets.setdefault(exporter.filename, format_type)
+            if other != format_type:
+                raise ValueError(
+                    f"The '{other}' and '{format_type}' export formats both "
+                    f"write '{exporter.filename}'; configure different "
+                    f"output names."
+                )
+
+        max_workers = min(
+            len(exporters) or 1, self.output_config.get("max_workers", 4)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if output_chunks is not None:
+                output_df = None
+                if self.int_year_keys:
+                    output_chunks = map(self._year_dates, output_chunks)
+                if self.compact_schema is not None:
+                    output_chunks = self._compact_chunks(
+                        output_chunks, context
+                    )
+                exported, output_shape = self._export_chunks(
+                    output_chunks, exporters, output_dir, executor
+                )
+            else:
+                output_df = dataframes["output_df"]
+                output_shape = output_df.shape
+                export_df = self._year_dates(output_df)
+                if self.compact_schema is not None:
+                    export_df, context["export_schema_report"] = (
+                        self.compact_schema.apply(export_df)
+                    )
+                futures: Dict[str, Future[Path]] = {
+                    format_type: executor.submit(
+                        exporter.export, export_df, output_dir
+                    )
+                    for format_type, exporter in exporters.items()
+                }
+                exported = {
+                    format_type: future.result()
+                    for format_type, future in futures.items()
+                }
 
-            exported_files[format_type] = str(output_file_path)
+        if "province_year_df" in dataframes:
+            context["province_year_paths"] = self._export_province_year(
+                dataframes["province_year_df"], exporters, output_dir
+            )
+
+        # Results are kept in the requested order, so the last format
+        # still sets 'output_file_path'
+        output_file_path = ""
+        for format_type, output_file_path in exported.items():
             self.logger.info(
                 f"Exported dataset to {format_type}: {output_file_path}"
             )
 
-        self.log_success(
-            f"Export completed in {len(exported_files)} format(s)"
-        )
+        report = context.get("export_schema_report")
+        if self.compact_schema is not None and report:
+            self.logger.info(
+                f"Compact export schema narrowed "
+                f"{len(report['dtypes'])} column(s): "
+                f"{report['bytes_before'] / 1e6:.2f} MB -> "
+                f"{report['bytes_after'] / 1e6:.2f} MB in memory "
+                f"({report['saved_pct']}% saved)"
+            )
+        self.log_success(f"Export completed in {len(exported)} format(s)")
         context["output_file_path"] = output_file_path
         context["output_file"] = output_df
+        context["output_shape"] = output_shape
+        context["export_stats"] = {
+            format_type: exporter.stats
+            for format_type, exporter in exporters.items()
+            if exporter.stats
+        }
+
+    def _export_province_year(
+        self,
+        table: pd.DataFrame,
+        exporters: Dict[str, BaseExporter],
+        output_dir: Path,
+    ) -> Dict[str, Path]:
+        """
+        Export the table of ProvinceYearAggregationStep.
+
+        It is written in the requested single-file formats (csv, parquet)
+        to the 'output.province_year_directory' subdirectory.
+
+        Args:
+            table (pd.DataFrame): Province-year table.
+            exporters (Dict[str, BaseExporter]): Exporters of the run.
+            output_dir (Path): Output directory of the dataset.
+
+        Returns:
+            Dict[str, Path]: Written file per format.
+        """
+        directory = output_dir / self.output_config.get(
+            "province_year_directory", "province_year"
+        )
+        directory.mkdir(parents=True, exist_ok=True)
+        table = self._year_dates(table)
+        paths: Dict[str, Path] = {}
+        for format_type, exporter in exporters.items():
+            if format_type not in _PROVINCE_YEAR_FORMATS:
+                continue
+            paths[format_type] = exporter.export(table, directory)
+            self.logger.info(
+                f"Exported province-year table to {format_type}: "
+                f"{paths[format_type]}"
+            )
+        return paths
+
+    def _year_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert integer 'year' keys to datetime64 for export.
+
+        Args:
+            df (pd.DataFrame): Cleaned dataset or chunk; it is not modified.
+
+        Returns:
+            pd.DataFrame: Dataset with a datetime 'year' column.
+        """
+        if not self.int_year_keys or "year" not in df.columns:
+            return df
+        if not pd.api.types.is_integer_dtype(df["year"]):
+            return df
+        df = df.copy(deep=False)
+        df["year"] = year_keys_to_datetime(df["year"])
+        return df
+
+    def _compact_chunks(
+        self, chunks: Iterable[pd.DataFrame], context: Dict[str, Any]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Narrow every chunk to the compact dtypes chosen for the first one.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Cleaned chunks of the dataset.
+            context (Dict[str, Any]): Execution context; receives the
+                combined 'export_schema_report'.
+
+        Yields:
+            pd.DataFrame: Compacted chunks.
+        """
+        report = None
+        for chunk in chunks:
+            compact, chunk_report = self.compact_schema.apply(
+                chunk,
+                report["dtypes"] if report else None,
+                streamed=report is None,
+            )
+            if report is None:
+                report = context["export_schema_report"] = chunk_report
+            else:
+                self.compact_schema.add_report(report, chunk_report)
+            del chunk
+            yield compact
+
+    def _export_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        exporters: Dict[str, BaseExporter],
+        output_dir: Path,
+        executor: ThreadPoolExecutor,
+    ) -> Tuple[Dict[str, Path], Tuple[int, int]]:
+        """
+        Stream chunks into every export format at once.
+
+        Each chunk is appended to all open writers concurrently and
+        released before the next chunk is requested. On any error the
+        partial outputs are deleted and previous exports are kept.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Cleaned chunks of the dataset.
+            exporters (Dict[str, BaseExporter]): Exporters by format.
+            output_dir (Path): Directory that receives the output.
+            executor (ThreadPoolExecutor): Pool the writes run on.
+
+        Returns:
+            Tuple[Dict[str, Path], Tuple[int, int]]: Written paths by
+                format, and the shape of the exported dataset.
+
+        Raises:
+            ValueError: If the chunks contain no rows.
+        """
+        streams = {}
+        rows, columns = 0, 0
+        try:
+            for format_type, exporter in exporters.items():
+                streams[format_type] = exporter.open(output_dir)
+
+            for chunk in chunks:
+                for future in [
+                    executor.submit(stream.write, chunk)
+                    for stream in streams.values()
+                ]:
+                    future.result()
+                rows += len(chunk)
+                columns = chunk.shape[1]
+                self.logger.debug(f"Exported chunk of {len(chunk)} rows")
+                # Drop the reference before the generator builds the next
+                # chunk, so only one chunk is alive at a time
+                del chunk
+
+            if not rows:
+                raise ValueError(
+                    "'output_chunks' yielded no rows; nothing to export."
+                )
+        except Exception:
+            for stream in streams.values():
+                stream.abort()
+            raise
+
+        exported = {
+            format_type: stream.close()
+            for format_type, stream in streams.items()
+        }
+        return exported, (rows, columns)
 
     def _validate_arguments(
-        self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
+        self,
+        dataframes: Dict[str, pd.DataFrame],
+        context: Dict[str, Any],
+        streaming: bool = False,
     ) -> None:
         """
         Validate presence and correctness of required arguments before export.
@@ -89,23 +416,26 @@ class DataExportStep(ETLStep):
             dataframes (Dict[str, pd.DataFrame]): Dictionary containing
                 dataframes.
             context (Dict[str, Any]): Execution context.
+            streaming (bool): Whether the dataset comes from
+                'output_chunks', in which case 'output_df' is not needed.
 
         Raises:
             ValueError: If 'output_df' is missing or empty.
             ValueError: If 'data_path' or 'export_format' are missing in
                 context.
         """
-        if "output_df" not in dataframes:
-            raise ValueError(
-                "'output_df' is missing in the dataframes dictionary. "
-                "Ensure the feature engineering step has been executed "
-                "before export."
-            )
-        if dataframes["output_df"].empty:
-            raise ValueError(
-                "The input DataFrame 'output_df' is empty; nothing to "
-                "export."
-            )
+        if not streaming:
+            if "output_df" not in dataframes:
+                raise ValueError(
+                    "'output_df' is missing in the dataframes dictionary. "
+                    "Ensure the feature engineering step has been executed "
+                    "before export."
+                )
+            if dataframes["output_df"].empty:
+                raise ValueError(
+                    "The input DataFrame 'output_df' is empty; nothing to "
+                    "export."
+                )
 
         if not context.get("data_path"):
             raise ValueError(
@@ -0,0 +1,21 @@
+from .base_exporter import BaseExporter
+from .compact_schema import CompactSchema
+from .csv_exporter import CsvExporter
+from .database_exporter import DatabaseExporter
+from .duckdb_exporter import DuckDBExporter
+from .incremental_parquet_exporter import IncrementalParquetExporter
+from .parquet_exporter import ParquetExporter
+from .partitioned_parquet_exporter import PartitionedParquetExporter
+from .sqlite_exporter import SqliteExporter
+
+__all__ = [
+    "BaseExporter",
+    "CompactSchema",
+    "CsvExporter",
+    "DatabaseExporter",
+    "DuckDBExporter",
+    "IncrementalParquetExporter",
+    "ParquetExporter",
+    "PartitionedParquetExporter",
+    "SqliteExporter",
+]
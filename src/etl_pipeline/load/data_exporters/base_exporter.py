@@ -0,0 +1,253 @@
+import logging
+import os
+import shutil
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+
+class BaseExporter(ABC):
+    """
+    Abstract base class for dataset exporters.
+
+    Each exporter writes the final dataset in one output format below the
+    output directory. Output is written to a hidden temporary path first
+    and renamed into place, so readers never see a partially written file.
+
+    Exporters write through three hooks, _open, _write_chunk and _close,
+    so a dataset can also be streamed chunk by chunk with open() without
+    ever being held in memory as a whole.
+    """
+
+    def __init__(self, options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the exporter.
+
+        Args:
+            options (Optional[Dict[str, Any]]): Format-specific settings,
+                usually a sub-section of the 'output' configuration.
+        """
+        self.options: Dict[str, Any] = dict(options or {})
+        # Details of the last export that callers may report
+        self.stats: Dict[str, Any] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    @abstractmethod
+    def filename(self) -> str:
+        """Name of the file or directory written in the output directory."""
+        pass
+
+    @abstractmethod
+    def _open(self, path: Path) -> Any:
+        """
+        Open a writer on the given path.
+
+        Args:
+            path (Path): Temporary file or directory to write.
+
+        Returns:
+            Any: Writer state passed to _write_chunk and _close.
+        """
+        pass
+
+    @abstractmethod
+    def _write_chunk(self, handle: Any, chunk: pd.DataFrame) -> None:
+        """
+        Append a chunk of rows to an open writer.
+
+        Args:
+            handle (Any): Writer state returned by _open.
+            chunk (pd.DataFrame): Rows to append.
+        """
+        pass
+
+    @abstractmethod
+    def _close(self, handle: Any) -> None:
+        """
+        Flush and close an open writer.
+
+        Args:
+            handle (Any): Writer state returned by _open.
+        """
+        pass
+
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        """
+        Write the whole dataset to the given path.
+
+        Args:
+            df (pd.DataFrame): Dataset to export.
+            path (Path): Temporary file or directory to write.
+        """
+        handle = self._open(path)
+        try:
+            self._write_chunk(handle, df)
+        finally:
+            self._close(handle)
+
+    def open(self, output_dir: Path) -> "ExportStream":
+        """
+        Start a streamed export into the output directory.
+
+        Args:
+            output_dir (Path): Directory that receives the output.
+
+        Returns:
+            ExportStream: Stream that accepts chunks until closed.
+        """
+        return ExportStream(self, output_dir)
+
+    def export_chunks(
+        self, chunks: Iterable[pd.DataFrame], output_dir: Path
+    ) -> Path:
+        """
+        Write a sequence of chunks atomically, one chunk at a time.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Chunks of the dataset, all
+                with the same columns.
+            output_dir (Path): Directory that receives the output.
+
+        Returns:
+            Path: Written file or dataset directory.
+        """
+        stream = self.open(output_dir)
+        try:
+            for chunk in chunks:
+                stream.write(chunk)
+        except Exception:
+            stream.abort()
+            raise
+        return stream.close()
+
+    def export(self, df: pd.DataFrame, output_dir: Path) -> Path:
+        """
+        Write the dataset atomically and log the write throughput.
+
+        Args:
+            df (pd.DataFrame): Dataset to export.
+            output_dir (Path): Directory that receives the output.
+
+        Returns:
+            Path: Written file or dataset directory.
+        """
+        target = output_dir / self.filename
+        temp_path = self._temp_path(output_dir)
+
+        start = time.perf_counter()
+        try:
+            self._write(df, temp_path)
+            self._replace(temp_path, target)
+        finally:
+            self._remove(temp_path)
+        self._log_written(target, time.perf_counter() - start)
+        return target
+
+    def _temp_path(self, output_dir: Path) -> Path:
+        """Hidden, unique path the output is written to before renaming."""
+        return output_dir / f".{self.filename}.{uuid.uuid4().hex}.tmp"
+
+    def _log_written(self, target: Path, elapsed: float) -> None:
+        """Log the size and throughput of a finished export."""
+        size = self._size(target)
+        self.logger.info(
+            f"Wrote {size / 1e6:.2f} MB to {target} in {elapsed:.2f}s "
+            f"({size / 1e6 / max(elapsed, 1e-9):.1f} MB/s)"
+        )
+
+    def _replace(self, source: Path, target: Path) -> None:
+        """Move the written output to its final path."""
+        if source.is_dir() and target.exists():
+            # Directories cannot be replaced in one rename: move the old
+            # dataset aside first and delete it once the new one is live
+            backup = target.with_name(f".{target.name}.{uuid.uuid4().hex}")
+            os.replace(target, backup)
+            os.replace(source, target)
+            self._remove(backup)
+        else:
+            os.replace(source, target)
+
+    def _remove(self, path: Path) -> None:
+        """Delete a file or directory if it exists."""
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists():
+            path.unlink()
+
+    def _size(self, path: Path) -> int:
+        """Size in bytes of a file, or of all files below a directory."""
+        if path.is_dir():
+            return sum(
+                p.stat().st_size for p in path.rglob("*") if p.is_file()
+            )
+        return path.stat().st_size
+
+
+class ExportStream:
+    """
+    Streamed export of one format, created by BaseExporter.open().
+
+    Chunks are appended to the exporter's open writer as they arrive.
+    close() renames the output into place; abort() deletes it.
+    """
+
+    def __init__(self, exporter: BaseExporter, output_dir: Path):
+        """
+        Open the exporter's writer on a temporary path.
+
+        Args:
+            exporter (BaseExporter): Exporter that writes the chunks.
+            output_dir (Path): Directory that receives the output.
+        """
+        self.exporter = exporter
+        self.target = output_dir / exporter.filename
+        self.temp_path = exporter._temp_path(output_dir)
+        self.rows = 0
+        self._start = time.perf_counter()
+        self._handle = exporter._open(self.temp_path)
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """
+        Append a chunk of rows.
+
+        Args:
+            chunk (pd.DataFrame): Rows to append.
+        """
+        self.exporter._write_chunk(self._handle, chunk)
+        self.rows += len(chunk)
+
+    def close(self) -> Path:
+        """
+        Finish the export and move it to its final path.
+
+        Returns:
+            Path: Written file or dataset directory.
+
+        Raises:
+            ValueError: If no rows were written.
+        """
+        try:
+            self.exporter._close(self._handle)
+            if not self.rows:
+                raise ValueError("No rows were written; nothing to export.")
+            self.exporter._replace(self.temp_path, self.target)
+        finally:
+            self.exporter._remove(self.temp_path)
+        self.exporter._log_written(
+            self.target, time.perf_counter() - self._start
+        )
+        return self.target
+
+    def abort(self) -> None:
+        """Close the writer and delete the partial output."""
+        try:
+            self.exporter._close(self._handle)
+        except Exception:
+            pass
+        finally:
+            self.exporter._remove(self.temp_path)
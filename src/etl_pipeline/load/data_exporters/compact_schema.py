@@ -0,0 +1,206 @@
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from etl_pipeline.config.feature_schema import FeatureSchema
+
+_INT_DTYPES = ("int16", "int32")
+_FLOAT32 = np.finfo(np.float32)
+
+
+class CompactSchema:
+    """
+    Narrows the exported columns to the smallest dtype that holds them.
+
+    Target dtypes are derived from feature_types.yaml, matched on the
+    standardized column names of the cleaned dataset:
+    - float64 columns become float32 when every value survives the round
+      trip within 'float32_tolerance', a relative error (0, the default,
+      only allows exact round trips). Columns declared int64 that hold
+      floats, because of missing values, must round-trip exactly.
+    - int64 columns become int16 or int32, the smallest whose range holds
+      the column's minimum and maximum.
+    - string columns become categoricals (dictionary-encoded in Parquet)
+      when at most 'dictionary_max_ratio' of their values are distinct.
+    Columns failing a check keep their dtype; columns missing from the
+    schema, categoricals and dates are left unchanged.
+
+    Streamed chunks must share one schema, but a later chunk may hold
+    values the first one did not. Streamed exports therefore keep the
+    declared numeric dtypes and only dictionary-encode strings, which any
+    later chunk can be cast to.
+    """
+
+    def __init__(
+        self,
+        schema: FeatureSchema,
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the compact schema.
+
+        Args:
+            schema (FeatureSchema): Declared column dtypes.
+            options (Optional[Dict[str, Any]]): The 'output.compact_schema'
+                configuration section.
+        """
+        self.options: Dict[str, Any] = dict(options or {})
+        self.declared_dtypes = {
+            name.lower().replace(" ", "_"): dtype
+            for name, dtype in schema.var_dtypes.items()
+        }
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def apply(
+        self,
+        df: pd.DataFrame,
+        dtypes: Optional[Dict[str, str]] = None,
+        streamed: bool = False,
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Return the dataset with compact dtypes and a size report.
+
+        Args:
+            df (pd.DataFrame): Cleaned dataset; it is not modified.
+            dtypes (Optional[Dict[str, str]]): dtypes chosen for the first
+                chunk of a streamed dataset, from its report's 'dtypes'.
+            streamed (bool): Whether df is the first chunk of a streamed
+                dataset, whose dtypes later chunks must fit.
+
+        Returns:
+            Tuple[pd.DataFrame, Dict[str, Any]]: Compacted dataset, and
+                per-column dtype changes with the in-memory bytes before
+                and after.
+        """
+        targets: Dict[str, str] = {}
+        skipped: Dict[str, str] = {}
+        for column in df.columns:
+            declared = self.declared_dtypes.get(column.lower())
+            if declared is None:
+                continue
+            if dtypes is not None:
+                # Later chunks of a stream take the first chunk's dtypes
+                target, reason = dtypes.get(column), None
+            elif streamed and declared != "string":
+                continue
+            else:
+                target, reason = self._target_dtype(df[column], declared)
+            if target is None and reason:
+                skipped[column] = reason
+                self.logger.warning(
+                    f"Keeping {df[column].dtype} for '{column}': {reason}"
+                )
+            if target is not None:
+                targets[column] = target
+
+        compact = df.astype(targets) if targets else df
+        before = df[list(targets)].memory_usage(index=False, deep=True)
+        after = compact[list(targets)].memory_usage(index=False, deep=True)
+        total_before = int(df.memory_usage(index=False, deep=True).sum())
+        total_after = total_before - int(before.sum() - after.sum())
+        report = {
+            "columns": {
+                column: {
+                    "from": str(df[column].dtype),
+                    "to": target,
+                    "bytes_before": int(before[column]),
+                    "bytes_after": int(after[column]),
+                }
+                for column, target in targets.items()
+            },
+            "dtypes": targets,
+            "skipped": skipped,
+            "bytes_before": total_before,
+            "bytes_after": total_after,
+            "saved_pct": self._saved_pct(total_before, total_after),
+        }
+        self.logger.debug(
+            f"Compact export schema: {len(targets)} column(s) narrowed, "
+            f"{total_before / 1e6:.2f} MB -> {total_after / 1e6:.2f} MB "
+            f"in memory ({report['saved_pct']}% saved)"
+        )
+        return compact, report
+
+    def add_report(
+        self, total: Dict[str, Any], report: Dict[str, Any]
+    ) -> None:
+        """
+        Add the byte counts of a chunk's report to a running report.
+
+        Args:
+            total (Dict[str, Any]): Report of the first chunk, updated in
+                place.
+            report (Dict[str, Any]): Report of a later chunk.
+        """
+        for column, sizes in report["columns"].items():
+            for key in ("bytes_before", "bytes_after"):
+                total["columns"][column][key] += sizes[key]
+        total["bytes_before"] += report["bytes_before"]
+        total["bytes_after"] += report["bytes_after"]
+        total["saved_pct"] = self._saved_pct(
+            total["bytes_before"], total["bytes_after"]
+        )
+
+    def _saved_pct(self, bytes_before: int, bytes_after: int) -> float:
+        """Share of the bytes saved, in percent."""
+        return round(100 * (1 - bytes_after / max(bytes_before, 1)), 1)
+
+    def _target_dtype(
+        self, values: pd.Series, declared: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Pick the compact dtype of one column.
+
+        Args:
+            values (pd.Series): Column values.
+            declared (str): dtype declared in feature_types.yaml.
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: Target dtype, or None and
+                the reason the column keeps its dtype (None if there is
+                nothing to narrow).
+        """
+        dtype = values.dtype
+        if declared in ("float64", "int64") and dtype == np.float64:
+            finite = values.to_numpy()
+            finite = finite[np.isfinite(finite)]
+            magnitudes = np.abs(finite)
+            if finite.size and magnitudes.max() > _FLOAT32.max:
+                return None, "values exceed the float32 range"
+            if (
+                (magnitudes > 0) & (magnitudes < _FLOAT32.smallest_normal)
+            ).any():
+                return None, "values below the float32 precision"
+            # Integers must survive exactly, measurements within the
+            # configured relative tolerance
+            tolerance = (
+                0.0
+                if declared == "int64"
+                else self.options.get("float32_tolerance", 0.0)
+            )
+            error = np.abs(finite.astype(np.float32) - finite)
+            if (error > tolerance * magnitudes).any():
+                return None, "float32 round trip changes values"
+            return "float32", None
+
+        if declared == "int64" and dtype == np.int64:
+            if values.empty:
+                return "int16", None
+            low, high = values.min(), values.max()
+            for target in _INT_DTYPES:
+                info = np.iinfo(target)
+                if info.min <= low and high <= info.max:
+                    return target, None
+            return None, "values exceed the int32 range"
+
+        if declared == "string" and (
+            dtype == object or isinstance(dtype, pd.StringDtype)
+        ):
+            max_ratio = self.options.get("dictionary_max_ratio", 0.5)
+            if values.nunique() > max_ratio * len(values):
+                return None, "too many distinct values to dictionary-encode"
+            return "category", None
+
+        return None, None
@@ -0,0 +1,126 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+
+from .base_exporter import BaseExporter
+
+_EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+class CsvExporter(BaseExporter):
+    """
+    Writes the dataset to a single, optionally compressed, CSV file.
+
+    Supported options:
+    - engine: 'pandas' (default) or 'pyarrow'. The pyarrow writer is
+      multi-threaded and releases the GIL; it quotes every string value,
+      which parses to the same data.
+    - compression: none (default), gzip or zstd. Adds a '.gz' or '.zst'
+      suffix to the file name. Both engines stream into a pyarrow
+      compressed output stream, so the uncompressed CSV is never held in
+      memory or written to disk. Uncompressed output from the pandas
+      engine does not need pyarrow.
+
+    Streamed chunks are appended to the open file; the header is written
+    with the first chunk only.
+    """
+
+    @property
+    def filename(self) -> str:
+        """CSV file name, with the extension of the compression codec."""
+        compression = self.options.get("compression", "none")
+        if compression not in _EXTENSIONS:
+            raise ValueError(
+                f"Unsupported CSV compression: '{compression}'. "
+                f"Supported: {list(_EXTENSIONS)}"
+            )
+        return f"dataset.csv{_EXTENSIONS[compression]}"
+
+    def _open(self, path: Path) -> Dict[str, Any]:
+        """
+        Open the CSV file, through a compressed stream if configured.
+
+        Args:
+            path (Path): File to write.
+
+        Returns:
+            Dict[str, Any]: Output stream and the lazily created writer.
+        """
+        compression = self.options.get("compression", "none")
+        if compression == "none":
+            sink = open(path, "wb")
+        else:
+            import pyarrow as pa
+
+            sink = pa.CompressedOutputStream(str(path), compression)
+        return {"sink": sink, "writer": None, "schema": None}
+
+    def _write_chunk(
+        self, handle: Dict[str, Any], chunk: pd.DataFrame
+    ) -> None:
+        """
+        Append rows to the CSV file; the header is written once.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+            chunk (pd.DataFrame): Rows to append.
+        """
+        if self.options.get("engine", "pandas") == "pyarrow":
+            import pyarrow.csv as pa_csv
+
+            table = self._to_arrow(chunk)
+            if handle["writer"] is None:
+                handle["schema"] = table.schema
+                handle["writer"] = pa_csv.CSVWriter(
+                    handle["sink"], table.schema
+                )
+            handle["writer"].write_table(table.cast(handle["schema"]))
+        else:
+            chunk.to_csv(
+                handle["sink"],
+                index=False,
+                header=handle["schema"] is None,
+                mode="wb",
+            )
+            handle["schema"] = list(chunk.columns)
+
+    def _close(self, handle: Dict[str, Any]) -> None:
+        """
+        Flush the CSV writer and close the output stream.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+        """
+        try:
+            if handle["writer"] is not None:
+                handle["writer"].close()
+        finally:
+            handle["sink"].close()
+
+    def _to_arrow(self, df: pd.DataFrame) -> Any:
+        """
+        Convert the dataset to an Arrow table the CSV writer accepts.
+
+        Categoricals are written as their values, and datetime columns
+        holding only dates are written as dates, like DataFrame.to_csv.
+        """
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        fields = []
+        for field, column in zip(table.schema, df.columns):
+            field_type = field.type
+            if pa.types.is_dictionary(field_type):
+                field_type = field_type.value_type
+            if pa.types.is_timestamp(field_type) and self._is_date_only(
+                df[column]
+            ):
+                field_type = pa.date32()
+            fields.append(pa.field(field.name, field_type))
+        return table.cast(pa.schema(fields))
+
+    def _is_date_only(self, values: pd.Series) -> bool:
+        """Whether a datetime column has no time-of-day component."""
+        values = values.dropna()
+        return bool((values == values.dt.normalize()).all())
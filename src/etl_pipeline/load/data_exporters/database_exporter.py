@@ -0,0 +1,126 @@
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from .base_exporter import BaseExporter
+
+
+class DatabaseExporter(BaseExporter):
+    """
+    Base class for exporters that load the dataset into an embedded
+    database file.
+
+    Rows are appended to one table, and indexes are built once all rows
+    are loaded, which is much faster than maintaining them per insert.
+    Point and range lookups on the indexed columns then avoid parsing the
+    full dataset.
+
+    Supported options:
+    - table: table name. Default 'dataset'.
+    - index_columns: columns to index, each on its own and together in a
+      composite index. Columns missing from the dataset are skipped.
+      Default [province, year, air_pollutant].
+    """
+
+    @abstractmethod
+    def _connect(self, path: str) -> Any:
+        """
+        Open a connection to a new database file.
+
+        Args:
+            path (str): Database file to create.
+
+        Returns:
+            Any: DB-API connection.
+        """
+        pass
+
+    @abstractmethod
+    def _append(
+        self, connection: Any, chunk: pd.DataFrame, create: bool
+    ) -> None:
+        """
+        Insert rows into the dataset table.
+
+        Args:
+            connection (Any): Open connection.
+            chunk (pd.DataFrame): Rows to insert.
+            create (bool): Whether the table must be created first.
+        """
+        pass
+
+    @property
+    def table(self) -> str:
+        """Name of the dataset table."""
+        return self.options.get("table", "dataset")
+
+    def _open(self, path: Path) -> Dict[str, Any]:
+        """
+        Create the database file.
+
+        Args:
+            path (Path): Database file to create.
+
+        Returns:
+            Dict[str, Any]: Connection and the columns of the table.
+        """
+        return {"connection": self._connect(str(path)), "columns": None}
+
+    def _write_chunk(
+        self, handle: Dict[str, Any], chunk: pd.DataFrame
+    ) -> None:
+        """
+        Insert a chunk of rows, creating the table with the first one.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+            chunk (pd.DataFrame): Rows to insert.
+        """
+        self._append(
+            handle["connection"], chunk, create=handle["columns"] is None
+        )
+        handle["columns"] = list(chunk.columns)
+
+    def _close(self, handle: Dict[str, Any]) -> None:
+        """
+        Build the indexes and close the database.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+        """
+        connection = handle["connection"]
+        try:
+            if handle["columns"] is not None:
+                for statement in self._index_statements(handle["columns"]):
+                    connection.execute(statement)
+                connection.commit()
+        finally:
+            connection.close()
+
+    def _index_statements(self, columns: List[str]) -> List[str]:
+        """CREATE INDEX statements for the configured index columns."""
+        index_columns = [
+            col
+            for col in self.options.get(
+                "index_columns", ["province", "year", "air_pollutant"]
+            )
+            if col in columns
+        ]
+        groups = [[col] for col in index_columns]
+        if len(index_columns) > 1:
+            groups.append(index_columns)
+        statements = []
+        for group in groups:
+            name = self._quote(f"idx_{self.table}_{'_'.join(group)}")
+            indexed = ", ".join(self._quote(col) for col in group)
+            statements.append(
+                f"CREATE INDEX {name} ON {self._quote(self.table)} "
+                f"({indexed})"
+            )
+        return statements
+
+    def _quote(self, identifier: str) -> str:
+        """Quote a table, column or index name."""
+        return '"' + identifier.replace('"', '""') + '"'
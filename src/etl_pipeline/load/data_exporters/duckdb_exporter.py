@@ -0,0 +1,69 @@
+from typing import Any
+
+import pandas as pd
+
+from .database_exporter import DatabaseExporter
+
+
+class DuckDBExporter(DatabaseExporter):
+    """
+    Writes the dataset into a DuckDB database file.
+
+    DuckDB stores the table in compressed columnar form and reads it
+    directly into pandas, e.g.
+    duckdb.connect(path).sql("SELECT ... WHERE province = 'madrid'").df().
+    Requires the optional 'duckdb' package.
+
+    Supports the DatabaseExporter options, plus:
+    - filename: database file name. Default 'dataset.duckdb'.
+    """
+
+    @property
+    def filename(self) -> str:
+        """Name of the database file."""
+        return self.options.get("filename", "dataset.duckdb")
+
+    def _connect(self, path: str) -> Any:
+        """
+        Open a new DuckDB database.
+
+        Args:
+            path (str): Database file to create.
+
+        Returns:
+            Any: Open DuckDB connection.
+
+        Raises:
+            ImportError: If duckdb is not installed.
+        """
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError(
+                "The 'duckdb' export format requires the duckdb package. "
+                "Install it with: pip install duckdb"
+            ) from e
+        return duckdb.connect(path)
+
+    def _append(
+        self, connection: Any, chunk: pd.DataFrame, create: bool
+    ) -> None:
+        """
+        Insert rows into the dataset table, scanning the chunk in place.
+
+        Args:
+            connection (Any): Open connection.
+            chunk (pd.DataFrame): Rows to insert.
+            create (bool): Whether the table must be created first.
+        """
+        connection.register("_chunk", chunk)
+        try:
+            table = self._quote(self.table)
+            if create:
+                connection.execute(
+                    f"CREATE TABLE {table} AS SELECT * FROM _chunk"
+                )
+            else:
+                connection.execute(f"INSERT INTO {table} SELECT * FROM _chunk")
+        finally:
+            connection.unregister("_chunk")
@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+
+from .base_exporter import BaseExporter
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Writes the dataset to a single Parquet file.
+
+    Supported options:
+    - compression: codec name (snappy, zstd, gzip, none). Default snappy.
+    - compression_level: codec level, if the codec supports one.
+    - row_group_size: maximum rows per row group.
+    - use_dictionary: dictionary-encode columns. Default True.
+
+    Streamed chunks are appended to one open file as new row groups.
+    """
+
+    filename = "dataset.parquet"
+
+    def _open(self, path: Path) -> Dict[str, Any]:
+        """
+        Prepare a Parquet writer; it is opened with the first chunk's schema.
+
+        Args:
+            path (Path): File to write.
+
+        Returns:
+            Dict[str, Any]: Target path and the lazily created writer.
+        """
+        return {"path": path, "writer": None}
+
+    def _write_chunk(
+        self, handle: Dict[str, Any], chunk: pd.DataFrame
+    ) -> None:
+        """
+        Append rows to the Parquet file as one or more row groups.
+
+        Later chunks are converted to the schema of the first one, so
+        categoricals with differing categories share one column type.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+            chunk (pd.DataFrame): Rows to append.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = handle["writer"]
+        table = pa.Table.from_pandas(
+            chunk,
+            schema=writer.schema if writer is not None else None,
+            preserve_index=False,
+        )
+        if writer is None:
+            writer = handle["writer"] = pq.ParquetWriter(
+                str(handle["path"]), table.schema, **self._writer_options()
+            )
+        writer.write_table(
+            table, row_group_size=self.options.get("row_group_size")
+        )
+
+    def _close(self, handle: Dict[str, Any]) -> None:
+        """
+        Write the Parquet footer and close the file.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+        """
+        if handle["writer"] is not None:
+            handle["writer"].close()
+
+    def _writer_options(self) -> Dict[str, Any]:
+        """Codec and encoding options shared by the Parquet writers."""
+        compression = self.options.get("compression", "snappy")
+        return {
+            "compression": None if compression == "none" else compression,
+            "compression_level": self.options.get("compression_level"),
+            "use_dictionary": self.options.get("use_dictionary", True),
+        }
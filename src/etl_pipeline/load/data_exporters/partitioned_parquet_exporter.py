@@ -0,0 +1,148 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .parquet_exporter import ParquetExporter
+
+
+class PartitionedParquetExporter(ParquetExporter):
+    """
+    Writes the dataset as a Hive-style partitioned Parquet dataset.
+
+    Files are laid out as 'dataset/year=<year>/province=<province>/' so
+    readers can prune partitions, e.g.
+    pd.read_parquet(path, filters=[("province", "==", "Madrid")]).
+    Partition values are URI-encoded in the directory names ('/' becomes
+    '%2F'). A datetime partition column is partitioned by calendar year.
+
+    Supports the ParquetExporter options, plus:
+    - directory: dataset directory name. Default 'dataset'.
+    - partition_cols: partition columns in order. Default [year, province].
+    - max_partitions: upper bound of partitions written. Default 4096.
+
+    Streamed chunks add one file per chunk to each partition they touch.
+    """
+
+    @property
+    def filename(self) -> str:
+        """Name of the dataset directory."""
+        return self.options.get("directory", "dataset")
+
+    @property
+    def partition_cols(self) -> List[str]:
+        """Partition columns, outermost first."""
+        return self.options.get("partition_cols", ["year", "province"])
+
+    def _check_partition_cols(self, df: pd.DataFrame) -> None:
+        """Raise KeyError if a partition column is missing."""
+        missing = [col for col in self.partition_cols if col not in df]
+        if missing:
+            raise KeyError(f"Missing partition columns: {missing}")
+
+    def _open(self, path: Path) -> Dict[str, Any]:
+        """
+        Prepare the dataset directory.
+
+        Args:
+            path (Path): Dataset directory to create.
+
+        Returns:
+            Dict[str, Any]: Dataset directory, chunk count and schema.
+        """
+        return {"path": path, "chunks": 0, "schema": None}
+
+    def _write_chunk(
+        self, handle: Dict[str, Any], chunk: pd.DataFrame
+    ) -> None:
+        """
+        Write a chunk into the partition directories of the dataset.
+
+        Each chunk adds its own 'part-<chunk>-<i>.parquet' file to every
+        partition it has rows for. Later chunks are converted to the
+        schema of the first one, so all files share one schema.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+            chunk (pd.DataFrame): Rows to write.
+
+        Raises:
+            KeyError: If a partition column is missing from the chunk.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        partition_cols = self.partition_cols
+        self._check_partition_cols(chunk)
+
+        table = pa.Table.from_pandas(
+            self._sorted_by_partition(chunk, partition_cols),
+            schema=handle["schema"],
+            preserve_index=False,
+        )
+        handle["schema"] = table.schema
+        options = self._writer_options()
+        row_group_size = self.options.get("row_group_size")
+        max_partitions = self.options.get("max_partitions", 4096)
+        parquet_format = ds.ParquetFileFormat()
+        ds.write_dataset(
+            table,
+            handle["path"],
+            format=parquet_format,
+            partitioning=ds.partitioning(
+                table.select(partition_cols).schema, flavor="hive"
+            ),
+            file_options=parquet_format.make_write_options(
+                compression=options["compression"],
+                compression_level=options["compression_level"],
+                use_dictionary=options["use_dictionary"],
+            ),
+            max_rows_per_group=row_group_size or 1024 * 1024,
+            min_rows_per_group=0,
+            basename_template=f"part-{handle['chunks']}-{{i}}.parquet",
+            # Later chunks add files next to the ones already written
+            existing_data_behavior="overwrite_or_ignore",
+            # years x provinces exceeds pyarrow's default of 1024
+            max_partitions=max_partitions,
+            max_open_files=max_partitions,
+        )
+        handle["chunks"] += 1
+        self.logger.info(
+            f"Wrote {table.num_rows} rows partitioned by {partition_cols}"
+        )
+
+    def _close(self, handle: Dict[str, Any]) -> None:
+        """
+        Nothing to flush; every chunk is written as complete files.
+
+        Args:
+            handle (Dict[str, Any]): Writer state returned by _open.
+        """
+        pass
+
+    def _sorted_by_partition(
+        self, df: pd.DataFrame, partition_cols: List[str]
+    ) -> pd.DataFrame:
+        """
+        Sort rows by partition key, using the calendar year of datetimes.
+
+        pyarrow splits unsorted input into one small batch per partition
+        and input batch; sorted input is written several times faster and
+        yields one full row group per partition file.
+        """
+        keys = {
+            col: (
+                df[col].dt.year.astype("int16")
+                if pd.api.types.is_datetime64_any_dtype(df[col])
+                else df[col]
+            )
+            for col in partition_cols
+        }
+        order = np.lexsort(
+            [
+                pd.factorize(keys[col], sort=True)[0]
+                for col in reversed(partition_cols)
+            ]
+        )
+        return df.assign(**keys).take(order)
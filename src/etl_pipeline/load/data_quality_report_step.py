@@ -3,19 +3,42 @@ from typing import Any, Dict
 
 import pandas as pd
 
-# from load.data_reporters import AirQualityDataReporter
-from pandas.core.indexes.base import Index
-
 from etl_pipeline import ETLStep
+from etl_pipeline.load.data_reporters import (
+    ApproximateQualityStatistics,
+    QualityStatistics,
+)
 
 
 class DataQualityReportStep(ETLStep):
     """Step to generate and persist a data quality report for the cleaned
-    dataset."""
+    dataset.
+
+    context["report_mode"], or 'output.quality_report.mode', selects how
+    the statistics are computed:
+    - "exact" (default): one vectorized pass over the whole dataset.
+    - "approximate": mergeable sketches updated one chunk of
+      'output.quality_report.chunk_size' rows at a time; the report adds
+      an 'approximation' section with the error bounds.
+
+    When the dataset was streamed to the export from
+    context["output_chunks"], there is no 'output_df' to report on and
+    the step is skipped.
+    """
 
     def __init__(self):
         super().__init__(__name__)
 
+        # Try to load configuration, fall back to defaults if not available
+        try:
+            from etl_pipeline.config.config_manager import get_config
+
+            self.report_config: Dict[str, Any] = (
+                get_config().get_output_config().get("quality_report", {})
+            )
+        except ImportError:
+            self.report_config = {}
+
     def execute(
         self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
     ) -> None:
@@ -32,6 +55,12 @@ class DataQualityReportStep(ETLStep):
             ValueError: If required keys are missing in dataframes or context.
         """
         self.log_start()
+        if "output_df" not in dataframes and "output_chunks" in context:
+            self.logger.warning(
+                "Skipping the quality report: the dataset was streamed to "
+                "the export and is not held in memory."
+            )
+            return
         self._validate_args(dataframes, context)
 
         df = dataframes["output_df"]
@@ -41,7 +70,11 @@ class DataQualityReportStep(ETLStep):
         context["quality_report_path"] = str(self._report_file)
         context["reports_path"] = str(self._output_dir)
 
-        self._generate_report(df)
+        self._generate_report(
+            df,
+            context.get("report_mode")
+            or self.report_config.get("mode", "exact"),
+        )
 
     def _validate_args(
         self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
@@ -67,49 +100,36 @@ class DataQualityReportStep(ETLStep):
                 "setup."
             )
 
-    def _generate_report(self, df: pd.DataFrame) -> None:
+    def _generate_report(self, df: pd.DataFrame, mode: str = "exact") -> None:
         """
         Compile data quality metrics and save report.
 
         Args:
             df: DataFrame to analyze.
+            mode: "exact" or "approximate".
+
+        Raises:
+            ValueError: If the mode is unknown.
         """
-        report: Dict[str, Any] = {
-            "total_records": len(df),
-            "total_columns": len(df.columns),
-            "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024,
-            "duplicate_rows": df.duplicated().sum(),
-            "missing_data": self._missing_data_stats(df),
-            "data_types": (
-                df.dtypes.astype(str).value_counts().to_dict()  # type: ignore
-            ),
-            "year_statistics": self._year_statistics(df),
-        }
-
-        # Numeric column summary
-        numeric_cols: Index[str] = df.select_dtypes(include=["number"]).columns
-        if not numeric_cols.empty:
-            report["numeric_summary"] = (
-                df[numeric_cols].describe().to_dict()  # type: ignore
+        if mode == "exact":
+            report = QualityStatistics(df).report()
+        elif mode == "approximate":
+            chunk_size = self.report_config.get("chunk_size", 1_000_000)
+            statistics = ApproximateQualityStatistics.from_chunks(
+                (
+                    df.iloc[start : start + chunk_size]
+                    for start in range(0, len(df), chunk_size)
+                ),
+                hll_precision=self.report_config.get("hll_precision", 14),
+                quantile_k=self.report_config.get("quantile_k", 200),
+                top_k=self.report_config.get("top_k", 100),
+            )
+            report = statistics.report()
+        else:
+            raise ValueError(
+                f"Unknown report mode '{mode}'; use 'exact' or "
+                "'approximate'."
             )
-
-        # Categorical column summary
-        categorical_cols = df.select_dtypes(
-            include=["object", "category"]
-        ).columns
-        if not categorical_cols.empty:
-            report["categorical_summary"] = {
-                col: {
-                    "unique_values": df[col].nunique(),
-                    "most_frequent": (
-                        df[col].mode().iloc[0]
-                        if not df[col].mode().empty
-                        else None
-                    ),
-                }
-                for col in categorical_cols
-            }
-
         self._save_report(report)
 
     def _year_statistics(self, df: pd.DataFrame) -> Dict[str, Any]:
@@ -122,26 +142,7 @@ class DataQualityReportStep(ETLStep):
         Returns:
             Dict[str, Any]: Statistics including min/max year and year counts.
         """
-        if "Year" not in df.columns:
-            return {
-                "error": "Year column not found in dataset"
-            }
-        
-        # Convert Year column to datetime if it's not already
-        year_series = pd.to_datetime(df["Year"])
-        years = year_series.dt.year
-        
-        # Calculate year statistics
-        min_year = int(years.min())
-        max_year = int(years.max())
-        year_counts = years.value_counts().sort_index().to_dict()
-        
-        return {
-            "min_year": min_year,
-            "max_year": max_year,
-            "total_years": len(year_counts),
-            "year_counts": {int(year): int(count) for year, count in year_counts.items()}
-        }
+        return QualityStatistics(df).year_statistics()
 
     def _missing_data_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -153,14 +154,7 @@ class DataQualityReportStep(ETLStep):
         Returns:
             Dict[str, Any]: Summary of missing value counts and percentages.
         """
-        missing = df.isnull().sum()
-        total_cells = len(df) * len(df.columns)
-        total_missing = missing.sum()
-        return {
-            "total_missing_values": total_missing,
-            "columns_with_missing": (missing > 0).sum(),
-            "missing_percentage": (total_missing / total_cells) * 100,
-        }
+        return QualityStatistics(df).missing_data()
 
     def _save_report(self, report: Dict[str, Any]) -> None:
         """
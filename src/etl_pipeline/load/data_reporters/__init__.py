@@ -1,3 +1,9 @@
 from .air_quality_data_reporter import AirQualityDataReporter
+from .approximate_quality_statistics import ApproximateQualityStatistics
+from .quality_statistics import QualityStatistics
 
-__all__ = ["AirQualityDataReporter"]
+__all__ = [
+    "AirQualityDataReporter",
+    "ApproximateQualityStatistics",
+    "QualityStatistics",
+]
@@ -1,7 +1,6 @@
 import logging
-import matplotlib.pyplot as plt
+
 import pandas as pd
-import seaborn as sns
 
 
 class AirQualityDataReporter:
@@ -14,6 +13,10 @@ class AirQualityDataReporter:
     def report_air_pollutant_level(
         self, df: pd.DataFrame, filename: str = "air_pollution_level.png"
     ):
+        # Plotting libraries are slow to import and only needed here
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(15, 5))
         sns.lineplot(data=df, x="Year", y="Air Pollution Level")
         plt.title("Air Pollution Level")
@@ -23,6 +26,8 @@ class AirQualityDataReporter:
     def _save_plot(self, filename: str):
         import os
 
+        import matplotlib.pyplot as plt
+
         os.makedirs(self.output_dir, exist_ok=True)
         path = os.path.join(self.output_dir, filename)
         plt.savefig(path)
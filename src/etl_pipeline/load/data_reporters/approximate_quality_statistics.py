@@ -0,0 +1,353 @@
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from common.utils.sketches import (
+    HyperLogLog,
+    KLLSketch,
+    SpaceSaving,
+    hash_values,
+)
+
+from .quality_statistics import QualityStatistics
+
+_QUANTILES = (0.25, 0.5, 0.75)
+
+
+class ApproximateQualityStatistics:
+    """
+    Builds the data quality report from mergeable sketches, one chunk at a
+    time.
+
+    Statistics built over separate chunks, files or partitions merge into
+    one report:
+    - unique_values: HyperLogLog distinct counts;
+    - most_frequent: space-saving top-k counters;
+    - numeric_summary quartiles: KLL quantile sketches.
+    Record, missing, duplicate and year counts, and the numeric count,
+    mean, std, min and max are exact. Duplicate rows are counted from
+    64-bit row hashes, the only state that grows with the number of rows
+    (8 bytes per row). The 'approximation' section of the report states
+    the error bound of every estimate.
+    """
+
+    def __init__(
+        self,
+        hll_precision: int = 14,
+        quantile_k: int = 200,
+        top_k: int = 100,
+    ):
+        """
+        Initialize empty statistics.
+
+        Args:
+            hll_precision (int): Precision of the HyperLogLog sketches.
+            quantile_k (int): Accuracy parameter of the KLL sketches.
+            top_k (int): Values monitored by each space-saving sketch.
+        """
+        self.hll_precision = hll_precision
+        self.quantile_k = quantile_k
+        self.top_k = top_k
+        self.total_records = 0
+        self.memory_bytes = 0
+        self.dtypes: Dict[str, str] = {}
+        self.missing: Dict[str, int] = {}
+        self.moments: Dict[str, Dict[str, float]] = {}
+        self.quantiles: Dict[str, KLLSketch] = {}
+        self.distinct: Dict[str, HyperLogLog] = {}
+        self.frequent: Dict[str, SpaceSaving] = {}
+        self.row_hashes: List[np.ndarray] = []
+        self.year_counts: Optional[Dict[int, int]] = None
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[pd.DataFrame], **options: Any
+    ) -> "ApproximateQualityStatistics":
+        """
+        Build the statistics of a dataset given as chunks.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Chunks with the same columns.
+            **options: Sketch parameters passed to the constructor.
+
+        Returns:
+            ApproximateQualityStatistics: Statistics of all chunks.
+        """
+        statistics = cls(**options)
+        for chunk in chunks:
+            statistics.update(chunk)
+        return statistics
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Add a chunk of the dataset.
+
+        Args:
+            df (pd.DataFrame): Chunk with the same columns as the previous
+                ones.
+        """
+        if not self.dtypes:
+            self.dtypes = df.dtypes.astype(str).to_dict()
+        self.total_records += len(df)
+        self.memory_bytes += df.index.memory_usage(deep=True)
+        if len(df):
+            self.row_hashes.append(
+                pd.util.hash_pandas_object(df, index=False).to_numpy()
+            )
+
+        numeric_cols = df.select_dtypes(include=["number"]).columns
+        categorical_cols = df.select_dtypes(
+            include=["object", "category"]
+        ).columns
+        for col in df.columns:
+            values = df[col]
+            self.missing[col] = self.missing.get(col, 0) + int(
+                values.isna().sum()
+            )
+            if col in categorical_cols:
+                self._update_categorical(col, values)
+            else:
+                self.memory_bytes += values.memory_usage(
+                    index=False, deep=True
+                )
+                if col in numeric_cols:
+                    self._update_numeric(col, values)
+
+        if "Year" in df.columns:
+            self._update_years(df["Year"])
+
+    def merge(self, other: "ApproximateQualityStatistics") -> None:
+        """
+        Merge the statistics of other chunks into these ones.
+
+        Args:
+            other (ApproximateQualityStatistics): Statistics built with the
+                same sketch parameters.
+        """
+        if not self.dtypes:
+            self.dtypes = dict(other.dtypes)
+        self.total_records += other.total_records
+        self.memory_bytes += other.memory_bytes
+        self.row_hashes.extend(other.row_hashes)
+        for col, count in other.missing.items():
+            self.missing[col] = self.missing.get(col, 0) + count
+        for col, moments in other.moments.items():
+            self._merge_moments(col, moments)
+        for col, sketch in other.quantiles.items():
+            self.quantiles.setdefault(col, KLLSketch(self.quantile_k)).merge(
+                sketch
+            )
+        for col, sketch in other.distinct.items():
+            self.distinct.setdefault(
+                col, HyperLogLog(self.hll_precision)
+            ).merge(sketch)
+        for col, sketch in other.frequent.items():
+            self.frequent.setdefault(col, SpaceSaving(self.top_k)).merge(
+                sketch
+            )
+        if other.year_counts is not None:
+            self._add_year_counts(other.year_counts)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the data quality report with its error bounds.
+
+        Returns:
+            Dict[str, Any]: The fields of the exact report, plus an
+                'approximation' section.
+        """
+        total_cells = self.total_records * len(self.dtypes)
+        total_missing = sum(self.missing.values())
+        data_types: Dict[str, int] = {}
+        for dtype in self.dtypes.values():
+            data_types[dtype] = data_types.get(dtype, 0) + 1
+
+        report: Dict[str, Any] = {
+            "total_records": self.total_records,
+            "total_columns": len(self.dtypes),
+            "memory_usage_mb": self.memory_bytes / 1024 / 1024,
+            "duplicate_rows": self._duplicate_rows(),
+            "missing_data": {
+                "total_missing_values": total_missing,
+                "columns_with_missing": sum(
+                    1 for count in self.missing.values() if count > 0
+                ),
+                "missing_percentage": (
+                    (total_missing / total_cells) * 100
+                    if total_cells
+                    else float("nan")
+                ),
+            },
+            "data_types": data_types,
+            "year_statistics": self._year_statistics(),
+        }
+        if self.moments:
+            report["numeric_summary"] = {
+                col: self._numeric_summary(col) for col in self.moments
+            }
+        if self.frequent:
+            report["categorical_summary"] = {
+                col: self._categorical_summary(col) for col in self.frequent
+            }
+
+        report["approximation"] = {
+            "unique_values_relative_error": HyperLogLog(
+                self.hll_precision
+            ).relative_error,
+            "quantile_rank_error": KLLSketch(self.quantile_k).rank_error,
+            "most_frequent_max_count_error": {
+                col: sketch.max_error for col, sketch in self.frequent.items()
+            },
+            "sketches": {
+                "hll_precision": self.hll_precision,
+                "quantile_k": self.quantile_k,
+                "top_k": self.top_k,
+            },
+        }
+        return report
+
+    def _duplicate_rows(self) -> int:
+        """Rows whose hash repeats the hash of an earlier row."""
+        if not self.row_hashes:
+            return 0
+        hashes = np.concatenate(self.row_hashes)
+        return int(len(hashes) - len(np.unique(hashes)))
+
+    def _update_numeric(self, col: str, values: pd.Series) -> None:
+        """Add a numeric column to its moments and quantile sketch."""
+        array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        array = array[~np.isnan(array)]
+        if array.size:
+            mean = array.mean()
+            self._merge_moments(
+                col,
+                {
+                    "count": float(array.size),
+                    "mean": float(mean),
+                    "m2": float(((array - mean) ** 2).sum()),
+                    "min": float(array.min()),
+                    "max": float(array.max()),
+                },
+            )
+        else:
+            self.moments.setdefault(col, self._empty_moments())
+        self.quantiles.setdefault(col, KLLSketch(self.quantile_k)).update(
+            pd.Series(array)
+        )
+
+    def _update_categorical(self, col: str, values: pd.Series) -> None:
+        """Add a categorical column to its distinct and top-k sketches."""
+        codes, uniques = QualityStatistics._codes(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        self.memory_bytes += QualityStatistics._memory_usage(
+            values, counts, uniques
+        )
+        present = pd.Series(uniques[counts > 0])
+        # Each distinct value is hashed once per chunk, not once per row
+        self.distinct.setdefault(col, HyperLogLog(self.hll_precision))
+        self.distinct[col].update_hashes(hash_values(present))
+        self.frequent.setdefault(col, SpaceSaving(self.top_k))
+        self.frequent[col].update_counts(
+            pd.Series(counts[counts > 0], index=pd.Index(present))
+        )
+
+    def _update_years(self, years: pd.Series) -> None:
+        """Add the row count of every year in a chunk."""
+        if not pd.api.types.is_numeric_dtype(years):
+            # Integer year keys are already years
+            if not pd.api.types.is_datetime64_any_dtype(years):
+                years = pd.to_datetime(years)
+            years = years.dt.year
+        values = years.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)].astype(np.int64)
+        counts: Dict[int, int] = {}
+        if values.size:
+            low = int(values.min())
+            bins = np.bincount(values - low)
+            counts = {
+                int(offset) + low: int(bins[offset])
+                for offset in np.flatnonzero(bins)
+            }
+        self._add_year_counts(counts)
+
+    def _add_year_counts(self, counts: Dict[int, int]) -> None:
+        """Add year counts to the running totals."""
+        if self.year_counts is None:
+            self.year_counts = {}
+        for year, count in counts.items():
+            self.year_counts[year] = self.year_counts.get(year, 0) + count
+
+    def _merge_moments(self, col: str, other: Dict[str, float]) -> None:
+        """Combine count, mean and squared deviations of two parts."""
+        moments = self.moments.setdefault(col, self._empty_moments())
+        count = moments["count"] + other["count"]
+        if not other["count"]:
+            return
+        delta = other["mean"] - moments["mean"]
+        moments["mean"] += delta * other["count"] / count
+        moments["m2"] += (
+            other["m2"] + delta**2 * moments["count"] * other["count"] / count
+        )
+        moments["count"] = count
+        moments["min"] = min(moments["min"], other["min"])
+        moments["max"] = max(moments["max"], other["max"])
+
+    def _empty_moments(self) -> Dict[str, float]:
+        """Moments of a column without values."""
+        return {
+            "count": 0.0,
+            "mean": 0.0,
+            "m2": 0.0,
+            "min": math.inf,
+            "max": -math.inf,
+        }
+
+    def _numeric_summary(self, col: str) -> Dict[str, float]:
+        """describe() fields of a column, with sketched quartiles."""
+        moments = self.moments[col]
+        count = moments["count"]
+        summary: Dict[str, float] = {"count": count}
+        if not count:
+            for key in ("mean", "std", "min", "25%", "50%", "75%", "max"):
+                summary[key] = float("nan")
+            return summary
+
+        summary["mean"] = moments["mean"]
+        summary["std"] = (
+            math.sqrt(moments["m2"] / (count - 1))
+            if count > 1
+            else float("nan")
+        )
+        summary["min"] = moments["min"]
+        quartiles = self.quantiles[col].quantiles(list(_QUANTILES))
+        for q, value in zip(_QUANTILES, quartiles):
+            summary[f"{q:.0%}"] = float(value)
+        summary["max"] = moments["max"]
+        return summary
+
+    def _categorical_summary(self, col: str) -> Dict[str, Any]:
+        """Estimated distinct count and most frequent value of a column."""
+        top = self.frequent[col].top(1)
+        if top.empty:
+            return {"unique_values": 0, "most_frequent": None}
+        most_frequent = top.index[0]
+        if isinstance(most_frequent, np.generic):
+            most_frequent = most_frequent.item()
+        return {
+            "unique_values": int(round(self.distinct[col].estimate())),
+            "most_frequent": most_frequent,
+        }
+
+    def _year_statistics(self) -> Dict[str, Any]:
+        """Exact year statistics from the merged year counts."""
+        if self.year_counts is None:
+            return {"error": "Year column not found in dataset"}
+        years = sorted(self.year_counts)
+        return {
+            "min_year": years[0],
+            "max_year": years[-1],
+            "total_years": len(years),
+            "year_counts": {year: self.year_counts[year] for year in years},
+        }
@@ -6,28 +6,65 @@ Coordinates the full ETL process by running each phase sequentially:
 Extraction, Transformation, and Loading.
 """
 
+import argparse
+import importlib
 import logging
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-
-import pandas as pd
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
 from etl_pipeline import ETLStep
 from etl_pipeline.config.config_manager import get_config
 from etl_pipeline.config.logger import setup_logger
-from etl_pipeline.extract import DataExtractionStep
-from etl_pipeline.load import DataExportStep, DataQualityReportStep
-from etl_pipeline.transform import (
-    DataCleaningStep,
-    DataMergingStep,
-    DataTransformationStep,
-    DataValidationStep,
-    FeatureEngineeringStep,
-)
 from etl_pipeline.utils import CheckProjectStructure
 
-setup_logger()
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from etl_pipeline.extract import SourceFrameCache
+
+# Default steps in execution order, mapped to the package that defines
+# them. Steps are imported when the pipeline is built, so importing this
+# module (e.g. for --help) does not import pandas or any step.
+STEP_REGISTRY: Dict[str, str] = {
+    "DataExtractionStep": "etl_pipeline.extract",
+    "DataTransformationStep": "etl_pipeline.transform",
+    "DataMergingStep": "etl_pipeline.transform",
+    "ProvinceYearAggregationStep": "etl_pipeline.transform",
+    "FeatureEngineeringStep": "etl_pipeline.transform",
+    "DataCleaningStep": "etl_pipeline.transform",
+    "DataValidationStep": "etl_pipeline.transform",
+    "DataExportStep": "etl_pipeline.load",
+    "DataQualityReportStep": "etl_pipeline.load",
+}
+
+
+def load_step_class(name: str) -> Type[ETLStep]:
+    """
+    Import a registered step class by name.
+
+    Args:
+        name (str): Step class name, a key of STEP_REGISTRY.
+
+    Returns:
+        Type[ETLStep]: The step class.
+
+    Raises:
+        KeyError: If the step is not registered.
+    """
+    if name not in STEP_REGISTRY:
+        raise KeyError(f"Unknown ETL step: '{name}'")
+    return getattr(importlib.import_module(STEP_REGISTRY[name]), name)
 
 
 class ETLPipeline:
@@ -38,13 +75,19 @@ class ETLPipeline:
         steps (List[ETLStep]): List of ETL steps to execute in order.
     """
 
-    def __init__(self, steps: Optional[Sequence[ETLStep]] = None):
+    def __init__(
+        self,
+        steps: Optional[Sequence[ETLStep]] = None,
+        source_cache: Optional["SourceFrameCache"] = None,
+    ):
         """
         Initializes the ETLPipeline.
 
         Args:
             steps (Optional[List[ETLStep]]): Optional list of ETL steps.
                 If None, defaults are loaded.
+            source_cache (Optional[SourceFrameCache]): Cache of extracted
+                source datasets used by the default extraction step.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -58,6 +101,7 @@ class ETLPipeline:
         else:
             self.config = None
 
+        self.source_cache = source_cache
         self.steps = steps or self._get_default_steps()
         self.recovery_enabled = True  # Enable recovery by default
 
@@ -68,16 +112,35 @@ class ETLPipeline:
         Returns:
             List[ETLStep]: Default ETL steps in execution order.
         """
-        return [
-            DataExtractionStep(),
-            DataTransformationStep(),
-            DataMergingStep(),
-            FeatureEngineeringStep(),
-            DataCleaningStep(),
-            DataValidationStep(),
-            DataExportStep(),
-            DataQualityReportStep(),
-        ]
+        steps: List[ETLStep] = []
+        disabled = self._disabled_steps()
+        for name in STEP_REGISTRY:
+            if name in disabled:
+                continue
+            step_class = load_step_class(name)
+            if name == "DataExtractionStep":
+                steps.append(step_class(source_cache=self.source_cache))
+            else:
+                steps.append(step_class())
+        return steps
+
+    def _disabled_steps(self) -> Set[str]:
+        """
+        Names of the steps disabled in the 'pipeline.steps' configuration.
+
+        Returns:
+            Set[str]: Disabled step names; empty without configuration.
+        """
+        try:
+            configured = get_config().get("pipeline.steps", [])
+        except Exception as e:
+            self.logger.warning(f"Failed to read the pipeline steps: {e}")
+            return set()
+        return {
+            step["name"]
+            for step in configured
+            if not step.get("enabled", True)
+        }
 
     def _can_recover_from_error(self, step: ETLStep, error: Exception) -> bool:
         """
@@ -118,13 +181,21 @@ class ETLPipeline:
 
         return False
 
-    def run(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def run(
+        self, context_overrides: Optional[Dict[str, Any]] = None
+    ) -> Tuple["pd.DataFrame", Dict[str, Any]]:
         """
         Executes the ETL pipeline by running all configured steps in order.
 
+        Args:
+            context_overrides (Optional[Dict[str, Any]]): Values that
+                replace or extend the default run context
+                (e.g. {"export_format": ["parquet"]}).
+
         Returns:
             Tuple[pd.DataFrame, Dict[str, Any]]:
-                - The final processed DataFrame.
+                - The final processed DataFrame, or None when it was
+                  streamed to the export from context["output_chunks"].
                 - Dictionary with metadata such as execution time, output file,
                   final shape, and number of executed steps..
         """
@@ -139,6 +210,7 @@ class ETLPipeline:
                 "data_path": data_path,
                 "export_format": ["csv"],
             }
+            context.update(context_overrides or {})
 
             # Run all pipeline steps with improved error handling
             for i, step in enumerate(self.steps):
@@ -186,14 +258,16 @@ class ETLPipeline:
             # Show results
             processing_time = datetime.now() - start_time
             output_file_path: str = context["output_file_path"]
-            output_file: pd.DataFrame = context["output_file"]
-            reports_path: pd.DataFrame = context["reports_path"]
+            # Streamed exports never build the full DataFrame, nor report
+            output_file: Optional[pd.DataFrame] = context["output_file"]
+            final_shape = context.get("output_shape") or output_file.shape
+            reports_path: Optional[str] = context.get("reports_path")
 
             results: Dict[str, Any] = {
                 "execution_time": processing_time,
                 "output_file_path": output_file_path,
                 "reports_path": reports_path,
-                "final_shape": output_file.shape,
+                "final_shape": final_shape,
                 "steps_executed": [
                     f"{i} - {step.__class__.__name__}\n"
                     for i, step in enumerate(self.steps)
@@ -208,7 +282,7 @@ class ETLPipeline:
     def _attempt_step_recovery(
         self,
         step: ETLStep,
-        dataframes: Dict[str, pd.DataFrame],
+        dataframes: Dict[str, "pd.DataFrame"],
         context: Dict[str, Any],
         error: Exception,
     ) -> None:
@@ -257,12 +331,34 @@ def main():
 
     Runs the pipeline and prints a summary of the results.
     """
+    parser = argparse.ArgumentParser(
+        description="Run the air quality ETL pipeline"
+    )
+    parser.add_argument(
+        "--export-format",
+        nargs="+",
+        choices=[
+            "csv",
+            "parquet",
+            "partitioned_parquet",
+            "incremental_parquet",
+            "sqlite",
+            "duckdb",
+        ],
+        help="Output formats (default: csv)",
+    )
+    args = parser.parse_args()
+    setup_logger()
+
     print("Starting automated data processing...")
     print("=" * 60)
 
     try:
         pipeline = ETLPipeline()
-        final_df, results = pipeline.run()
+        overrides = (
+            {"export_format": args.export_format} if args.export_format else {}
+        )
+        final_df, results = pipeline.run(overrides)
 
         print("\n" + "=" * 60)
         print("✅ Processing completed successfully!")
@@ -278,7 +374,7 @@ def main():
         print("Steps executed:\n" + "".join(results["steps_executed"]))
         print("=" * 60)
 
-        if not final_df.empty:
+        if final_df is not None and not final_df.empty:
             print("\nFinal dataset preview:")
             print(final_df.head())
             print("\nDataset info:")
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+ETL Pipeline Service
+
+Runs the ETL pipeline as a resident local service. The process keeps the
+configuration, feature schema, province mapping and extracted source
+datasets in memory, so each run only pays for the steps that depend on
+new data.
+
+Endpoints:
+- GET /health: service status and number of completed runs.
+- POST /run: run the pipeline and return its results as JSON. The
+  optional JSON body may set the run options listed in RUN_OPTIONS.
+"""
+
+import argparse
+import json
+import logging
+import os
+import socketserver
+import threading
+from datetime import timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from etl_pipeline.config.config_manager import get_config
+from etl_pipeline.config.logger import setup_logger
+from etl_pipeline.extract import SourceFrameCache
+from etl_pipeline.main_orchestrator import ETLPipeline
+from etl_pipeline.utils.province_mapper import ProvinceMapper
+
+RUN_OPTIONS = ("export_format", "validation_mode", "report_mode")
+
+
+class ETLService:
+    """
+    Keeps one warm ETLPipeline and runs it on demand.
+
+    Runs are serialized because the pipeline steps keep per-run state.
+    """
+
+    def __init__(self, pipeline: Optional[ETLPipeline] = None):
+        """
+        Initialize the service and warm up the shared caches.
+
+        Args:
+            pipeline (Optional[ETLPipeline]): Pipeline to run. Defaults to
+                the standard pipeline with a source dataset cache.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.source_cache = SourceFrameCache()
+        self.pipeline = pipeline or ETLPipeline(source_cache=self.source_cache)
+        self.runs = 0
+        self._run_lock = threading.Lock()
+        self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Load the configuration, schema and province mapping once."""
+        get_config().get_feature_schema()
+        ProvinceMapper.preload()
+        self.logger.info("Service caches warmed up")
+
+    def run(self, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run the pipeline and return its results in JSON-safe form.
+
+        Args:
+            options (Optional[Dict[str, Any]]): Run options; keys must be
+                in RUN_OPTIONS.
+
+        Returns:
+            Dict[str, Any]: Pipeline results dict.
+
+        Raises:
+            ValueError: If an unknown run option is given.
+        """
+        options = options or {}
+        unknown = sorted(set(options) - set(RUN_OPTIONS))
+        if unknown:
+            raise ValueError(
+                f"Unknown run options: {unknown}. "
+                f"Supported options: {list(RUN_OPTIONS)}"
+            )
+
+        with self._run_lock:
+            _, results = self.pipeline.run(options)
+            self.runs += 1
+        return self._to_json_safe(results)
+
+    def health(self) -> Dict[str, Any]:
+        """Status of the service."""
+        return {"status": "ok", "runs": self.runs}
+
+    def _to_json_safe(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert durations, paths and tuples to JSON types."""
+        safe: Dict[str, Any] = {}
+        for key, value in results.items():
+            if isinstance(value, timedelta):
+                safe[key] = value.total_seconds()
+            elif isinstance(value, Path):
+                safe[key] = str(value)
+            elif isinstance(value, tuple):
+                safe[key] = list(value)
+            else:
+                safe[key] = value
+        return safe
+
+
+class ETLRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler that routes requests to the server's ETLService."""
+
+    server: "ETLHTTPServer"
+
+    def do_GET(self) -> None:
+        """Handle GET /health."""
+        if self.path != "/health":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+        self._send_json(HTTPStatus.OK, self.server.service.health())
+
+    def do_POST(self) -> None:
+        """Handle POST /run."""
+        if self.path != "/run":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            options = json.loads(body) if body else {}
+            if not isinstance(options, dict):
+                raise ValueError("Request body must be a JSON object")
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+
+        try:
+            results = self.server.service.run(options)
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        except Exception as e:
+            self.server.service.logger.error(f"Pipeline run failed: {e}")
+            self._send_json(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+            )
+            return
+        self._send_json(HTTPStatus.OK, results)
+
+    def address_string(self) -> str:
+        """Client address for logs; Unix sockets have no host."""
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+        return "unix-socket"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Send access logs to the service logger instead of stderr."""
+        self.server.service.logger.info(
+            f"{self.address_string()} - {format % args}"
+        )
+
+    def _send_json(self, status: HTTPStatus, payload: Dict[str, Any]) -> None:
+        """Write a JSON response."""
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ETLHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Threaded HTTP server bound to a TCP address."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Any, service: ETLService):
+        self.service = service
+        super().__init__(address, ETLRequestHandler)
+
+
+class ETLUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """Threaded HTTP server bound to a Unix domain socket."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: ETLService):
+        self.service = service
+        super().__init__(socket_path, ETLRequestHandler)
+
+
+def create_server(
+    service: ETLService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """
+    Create the service server on a TCP port or a Unix socket.
+
+    Args:
+        service (ETLService): Service that handles the requests.
+        host (str): TCP host, ignored when socket_path is given.
+        port (int): TCP port, ignored when socket_path is given.
+        socket_path (Optional[str]): Unix socket path. A stale socket
+            file at that path is replaced.
+
+    Returns:
+        socketserver.BaseServer: Server ready for serve_forever().
+    """
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return ETLUnixHTTPServer(socket_path, service)
+    return ETLHTTPServer((host, port), service)
+
+
+def main():
+    """
+    Entry point of the ETL service.
+    """
+    parser = argparse.ArgumentParser(description="Run the ETL service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--socket", dest="socket_path", help="Serve on a Unix socket"
+    )
+    args = parser.parse_args()
+    setup_logger()
+
+    server = create_server(
+        ETLService(), args.host, args.port, args.socket_path
+    )
+    address = args.socket_path or f"{args.host}:{args.port}"
+    logging.getLogger("ETLService").info(f"ETL service listening on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pandas as pd
-from etl_pipeline.extract import DataExtractionStep
+from etl_pipeline.extract import DataExtractionStep, SourceFrameCache
 from etl_pipeline.tests.conftest import initialize_test_data
 
 
@@ -39,3 +40,104 @@ def test_real_data_extraction_step(
         df = dataframes[key]
         assert isinstance(df, pd.DataFrame)
         assert not df.empty
+
+
+def test_extraction_step_reuses_source_cache(tmp_path: Path):
+    """
+    Tests that a cached extraction skips the raw files until they change
+    and hands out copies that steps can modify.
+    """
+    initialize_test_data(tmp_path)
+    cache = SourceFrameCache()
+    step = DataExtractionStep(source_cache=cache)
+
+    first: Dict[str, pd.DataFrame] = {}
+    step.execute(first, {"data_path": tmp_path})
+    first["gdp"].drop(first["gdp"].index, inplace=True)
+
+    with patch.object(step, "_extract_sources") as mock_extract:
+        second: Dict[str, pd.DataFrame] = {}
+        step.execute(second, {"data_path": tmp_path})
+
+        mock_extract.assert_not_called()
+        assert not second["gdp"].empty
+
+        raw_file = next((tmp_path / "health_data" / "raw").iterdir())
+        raw_file.write_text(raw_file.read_text() + "\n")
+        step.execute({}, {"data_path": tmp_path})
+
+        mock_extract.assert_called_once()
+
+
+def test_totals_parsed_at_extraction_match_string_cleanup():
+    """
+    Tests on the real INE files that reading the totals with the
+    thousands separator gives the values of the former string cleanup.
+    """
+    from common.utils.dataframe_utils import (
+        remove_commas_and_dots,
+        remove_dots,
+    )
+    from etl_pipeline.extract.data_extractors import (
+        HealthDataExtractor,
+        SocioeconomicDataExtractor,
+    )
+
+    data_path = Path(__file__).parents[2] / "data"
+    dataframes: Dict[str, pd.DataFrame] = {}
+    HealthDataExtractor(data_path).extract(dataframes)
+    SocioeconomicDataExtractor(data_path).extract(dataframes)
+
+    raw = data_path / "health_data" / "raw" / "enfermedades_respiratorias.csv"
+    respiratory = pd.read_csv(raw, sep=";", decimal=",")
+    remove_commas_and_dots(respiratory, ["Total"], convert_to=float)
+    pd.testing.assert_series_equal(
+        dataframes["respiratory_diseases"]["Total"], respiratory["Total"]
+    )
+
+    raw = data_path / "socioeconomic_data" / "raw"
+    population = pd.read_csv(
+        raw / "poblacion_provincias_21.csv",
+        sep=";",
+        decimal=",",
+        encoding="latin1",
+    )
+    remove_dots(population, ["Total"], convert_to=int)
+    pd.testing.assert_series_equal(
+        dataframes["province_population"]["Total"], population["Total"]
+    )
+
+    # GDP keeps '.' as decimal point: values are thousands of euros
+    assert dataframes["gdp"]["2000"].astype(float).iloc[0] == 22.134
+
+
+def test_int_year_keys_match_parsed_dates(monkeypatch):
+    """
+    Tests on the real INE files that int16 year keys hold the years of
+    the dates read with parse_dates.
+    """
+    from etl_pipeline.config.config_manager import get_config
+    from etl_pipeline.extract.data_extractors import (
+        HealthDataExtractor,
+        SocioeconomicDataExtractor,
+    )
+
+    data_path = Path(__file__).parents[2] / "data"
+    dates: Dict[str, pd.DataFrame] = {}
+    HealthDataExtractor(data_path).extract(dates)
+    SocioeconomicDataExtractor(data_path).extract(dates)
+
+    monkeypatch.setitem(
+        get_config().config["processing"], "int_year_keys", True
+    )
+    keys: Dict[str, pd.DataFrame] = {}
+    HealthDataExtractor(data_path).extract(keys)
+    SocioeconomicDataExtractor(data_path).extract(keys)
+
+    for name in ("respiratory_diseases", "life_expectancy"):
+        assert keys[name]["Periodo"].dtype == "int16"
+        pd.testing.assert_series_equal(
+            keys[name]["Periodo"],
+            dates[name]["Periodo"].dt.year.astype("int16"),
+        )
+    assert keys["province_population"]["Periodo"].dtype == "int16"
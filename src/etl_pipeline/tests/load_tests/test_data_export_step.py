@@ -1,8 +1,11 @@
+import sys
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 import pytest
+from etl_pipeline.config.config_manager import get_config
 from etl_pipeline.load import DataExportStep
 
 
@@ -134,6 +137,19 @@ def test_export_to_csv(export_step, sample_output_df, tmp_path):
     assert list(exported_df.columns) == list(sample_output_df.columns)
 
 
+def test_plain_csv_export_without_pyarrow(
+    export_step, sample_output_df, tmp_path, monkeypatch
+):
+    """Test that uncompressed pandas CSV export does not need pyarrow."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    context = {"data_path": tmp_path, "export_format": ["csv"]}
+
+    export_step.execute({"output_df": sample_output_df}, context)
+
+    exported_df = pd.read_csv(tmp_path / "output" / "dataset.csv")
+    assert len(exported_df) == len(sample_output_df)
+
+
 @pytest.mark.skip(reason="Parquet support requires pyarrow/fastparquet")
 def test_export_to_parquet(export_step, sample_output_df, tmp_path):
     """Test Parquet export functionality."""
@@ -169,3 +185,578 @@ def test_unsupported_export_format(
 def test_step_name_initialization(export_step):
     """Test that the step is initialized with correct name."""
     assert export_step.name == "etl_pipeline.load.data_export_step"
+
+
+def test_partitioned_parquet_export(export_step, tmp_path):
+    """Test the Hive-style year=/province= Parquet dataset export."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    output_df = pd.DataFrame(
+        {
+            "province": pd.Categorical(
+                ["Madrid", "Alicante/Alacant", "Madrid", "Madrid"]
+            ),
+            "year": pd.to_datetime(["2019", "2019", "2019", "2020"]),
+            "air_pollution_level": [50.5, 45.2, 40.1, 30.0],
+        }
+    )
+    export_step.exporters["partitioned_parquet"].options.update(
+        {"compression": "zstd", "row_group_size": 1}
+    )
+    context = {
+        "data_path": tmp_path,
+        "export_format": ["partitioned_parquet"],
+    }
+
+    export_step.execute({"output_df": output_df}, context)
+
+    dataset_path = tmp_path / "output" / "dataset"
+    assert context["output_file_path"] == dataset_path
+    madrid_2019 = list(
+        (dataset_path / "year=2019" / "province=Madrid").iterdir()
+    )
+    assert len(madrid_2019) == 1
+    metadata = pq.ParquetFile(madrid_2019[0]).metadata
+    assert metadata.num_row_groups == 2
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    madrid = pd.read_parquet(
+        dataset_path, filters=[("province", "==", "Madrid")]
+    )
+    assert sorted(madrid["air_pollution_level"]) == pytest.approx(
+        [30.0, 40.1, 50.5]
+    )
+    alicante = pd.read_parquet(
+        dataset_path, filters=[("province", "==", "Alicante/Alacant")]
+    )
+    assert alicante["year"].tolist() == [2019]
+
+
+def test_multiple_formats_written_concurrently(
+    export_step, sample_dataframes_for_export, tmp_path
+):
+    """Test that several formats are exported and no temp files remain."""
+    pytest.importorskip("pyarrow")
+    context = {
+        "data_path": tmp_path,
+        "export_format": ["parquet", "csv", "partitioned_parquet"],
+    }
+    sample_dataframes_for_export["output_df"].columns = [
+        "province",
+        "year",
+        "air_pollution_level",
+        "respiratory_diseases_total",
+    ]
+
+    export_step.execute(sample_dataframes_for_export, context)
+
+    output_dir = tmp_path / "output"
+    assert sorted(p.name for p in output_dir.iterdir()) == [
+        "dataset",
+        "dataset.csv",
+        "dataset.parquet",
+    ]
+    assert context["output_file_path"] == output_dir / "dataset"
+
+
+def test_failed_export_keeps_previous_output(
+    export_step, sample_dataframes_for_export, tmp_path
+):
+    """Test that a failing write leaves the previous file untouched."""
+    context = {"data_path": tmp_path, "export_format": ["csv"]}
+    export_step.execute(sample_dataframes_for_export, context)
+    csv_path = tmp_path / "output" / "dataset.csv"
+    previous = csv_path.read_bytes()
+
+    def failing_write(df, path):
+        path.write_text("partial")
+        raise OSError("disk full")
+
+    export_step.exporters["csv"]._write = failing_write
+    with pytest.raises(OSError, match="disk full"):
+        export_step.execute(sample_dataframes_for_export, context)
+
+    assert csv_path.read_bytes() == previous
+    assert [p.name for p in csv_path.parent.iterdir()] == ["dataset.csv"]
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_pyarrow_csv_matches_pandas_csv(
+    export_step, sample_output_df, tmp_path, compression
+):
+    """Test that the pyarrow CSV writer parses to the pandas output."""
+    pa = pytest.importorskip("pyarrow")
+    output_df = sample_output_df.assign(
+        Province=pd.Categorical(
+            ["Madrid", 'Quoted "name", x', None, "Madrid", "Valencia"]
+        ),
+        Year=pd.to_datetime(["2018", "2019", "2020", "2018", "2021"]),
+    )
+    export_step.execute(
+        {"output_df": output_df},
+        {"data_path": tmp_path, "export_format": ["csv"]},
+    )
+    reference = pd.read_csv(tmp_path / "output" / "dataset.csv")
+
+    export_step.exporters["csv"].options.update(
+        {"engine": "pyarrow", "compression": compression}
+    )
+    context = {"data_path": tmp_path, "export_format": ["csv"]}
+    export_step.execute({"output_df": output_df}, context)
+
+    with pa.input_stream(
+        str(context["output_file_path"]), compression="detect"
+    ) as stream:
+        exported = pd.read_csv(stream)
+    pd.testing.assert_frame_equal(exported, reference)
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+def test_streamed_export_matches_full_export(
+    export_step, sample_output_df, tmp_path, engine
+):
+    """Test that chunks streamed from a generator export like one frame."""
+    pytest.importorskip("pyarrow")
+    output_df = sample_output_df.assign(
+        Province=pd.Categorical(sample_output_df["Province"]),
+        province=sample_output_df["Province"],
+        year=sample_output_df["Year"],
+    )
+    export_formats = ["csv", "parquet", "partitioned_parquet"]
+    export_step.exporters["csv"].options["engine"] = engine
+    export_step.execute(
+        {"output_df": output_df},
+        {"data_path": tmp_path / "full", "export_format": export_formats},
+    )
+
+    def chunks():
+        for start in range(0, len(output_df), 2):
+            # Each chunk has only the categories of its own rows
+            chunk = output_df.iloc[start : start + 2]
+            yield chunk.assign(
+                Province=chunk["Province"].astype(str).astype("category")
+            )
+
+    context = {
+        "data_path": tmp_path / "streamed",
+        "export_format": export_formats,
+        "output_chunks": chunks(),
+    }
+    export_step.execute({}, context)
+
+    assert context["output_shape"] == output_df.shape
+    assert context["output_file"] is None
+    full_output = tmp_path / "full" / "output"
+    streamed_output = tmp_path / "streamed" / "output"
+    pd.testing.assert_frame_equal(
+        pd.read_csv(streamed_output / "dataset.csv"),
+        pd.read_csv(full_output / "dataset.csv"),
+    )
+    streamed_parquet = pd.read_parquet(streamed_output / "dataset.parquet")
+    pd.testing.assert_frame_equal(
+        streamed_parquet.astype({"Province": str}),
+        pd.read_parquet(full_output / "dataset.parquet").astype(
+            {"Province": str}
+        ),
+    )
+    columns = ["province", "year", "Air Pollution Level"]
+    sort_by = ["province", "year"]
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(streamed_output / "dataset", columns=columns)
+        .astype(str)
+        .sort_values(sort_by, ignore_index=True),
+        pd.read_parquet(full_output / "dataset", columns=columns)
+        .astype(str)
+        .sort_values(sort_by, ignore_index=True),
+    )
+
+
+def test_failed_streamed_export_removes_partial_output(
+    export_step, sample_output_df, tmp_path
+):
+    """Test that an error in the chunk generator leaves no partial files."""
+    pytest.importorskip("pyarrow")
+
+    def chunks():
+        yield sample_output_df.iloc[:2]
+        raise RuntimeError("cleaning failed")
+
+    context = {
+        "data_path": tmp_path,
+        "export_format": ["csv", "parquet"],
+        "output_chunks": chunks(),
+    }
+    with pytest.raises(RuntimeError, match="cleaning failed"):
+        export_step.execute({}, context)
+
+    assert list((tmp_path / "output").iterdir()) == []
+
+    context["output_chunks"] = iter([])
+    with pytest.raises(ValueError, match="no rows"):
+        export_step.execute({}, context)
+    assert list((tmp_path / "output").iterdir()) == []
+
+
+@pytest.fixture
+def cleaned_output_df() -> pd.DataFrame:
+    """Cleaned dataset with standardized column names."""
+    return pd.DataFrame(
+        {
+            "province": pd.Categorical(["madrid", "soria", "madrid"]),
+            "air_pollutant_description": ["nitrogen dioxide (air)"] * 3,
+            "air_pollution_level": [50.5, 45.2, 40.1],
+            "latitude": [40.416775, 41.7665, 40.416775],
+            "population": [6_751_251, 88_884, 6_751_251],
+            "respiratory_diseases_total": [1_200, 150, 1_180],
+            "derived_feature": [1.0, 2.0, 3.0],
+        }
+    )
+
+
+@pytest.fixture
+def compact_export_step(monkeypatch):
+    """DataExportStep with the compact schema and a float32 tolerance."""
+    options = get_config().config["output"]["compact_schema"]
+    monkeypatch.setitem(options, "enabled", True)
+    monkeypatch.setitem(options, "float32_tolerance", 1e-6)
+    return DataExportStep()
+
+
+def test_compact_schema_narrows_exported_dtypes(
+    compact_export_step, cleaned_output_df, tmp_path
+):
+    """Test the float32/int/dictionary export schema and its report."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    context = {"data_path": tmp_path, "export_format": ["parquet"]}
+    compact_export_step.execute({"output_df": cleaned_output_df}, context)
+
+    schema = pq.read_schema(context["output_file_path"])
+    assert str(schema.field("air_pollution_level").type) == "float"
+    assert str(schema.field("latitude").type) == "float"
+    assert str(schema.field("population").type) == "int32"
+    assert str(schema.field("respiratory_diseases_total").type) == "int16"
+    assert str(schema.field("derived_feature").type) == "double"
+    assert str(schema.field("air_pollutant_description").type).startswith(
+        "dictionary"
+    )
+    # The in-memory dataset keeps its dtypes
+    assert cleaned_output_df["population"].dtype == "int64"
+
+    report = context["export_schema_report"]
+    assert report["dtypes"]["population"] == "int32"
+    assert report["bytes_after"] < report["bytes_before"]
+    assert report["saved_pct"] > 0
+    exported = pd.read_parquet(context["output_file_path"])
+    assert exported["latitude"].to_numpy() == pytest.approx(
+        cleaned_output_df["latitude"].to_numpy(), rel=1e-7
+    )
+
+
+def test_compact_schema_keeps_dtypes_out_of_range(
+    compact_export_step, cleaned_output_df
+):
+    """Test that values outside the narrow ranges keep their dtype."""
+    wide_df = cleaned_output_df.assign(
+        population=[2**40, 1, 2],
+        respiratory_diseases_total=[2**24 + 1, np.nan, 2.0],
+        air_pollution_level=[1e39, 1.0, 2.0],
+        air_pollutant_description=["a", "b", "c"],
+    )
+
+    compact, report = compact_export_step.compact_schema.apply(wide_df)
+
+    assert compact["population"].dtype == "int64"
+    assert compact["respiratory_diseases_total"].dtype == "float64"
+    assert compact["air_pollution_level"].dtype == "float64"
+    assert compact["air_pollutant_description"].dtype == object
+    assert set(report["skipped"]) == {
+        "population",
+        "respiratory_diseases_total",
+        "air_pollution_level",
+        "air_pollutant_description",
+    }
+
+
+def test_compact_schema_default_is_lossless(
+    monkeypatch, export_step, cleaned_output_df
+):
+    """Test that the compact schema is off and lossless by default."""
+    assert export_step.compact_schema is None
+    monkeypatch.setitem(
+        get_config().config["output"]["compact_schema"], "enabled", True
+    )
+
+    compact, report = DataExportStep().compact_schema.apply(cleaned_output_df)
+
+    # 40.416775 is not exact in float32
+    assert compact["latitude"].dtype == "float64"
+    assert report["skipped"]["latitude"] == (
+        "float32 round trip changes values"
+    )
+    assert compact["population"].dtype == "int32"
+
+
+def test_streamed_chunks_keep_declared_numeric_dtypes(
+    compact_export_step, cleaned_output_df, tmp_path
+):
+    """Test that streamed chunks share a schema later chunks always fit."""
+    pytest.importorskip("pyarrow")
+    context = {
+        "data_path": tmp_path,
+        "export_format": ["parquet"],
+        "output_chunks": iter(
+            [
+                cleaned_output_df.iloc[:2],
+                cleaned_output_df.iloc[2:].assign(
+                    population=2**40, air_pollution_level=1e39
+                ),
+            ]
+        ),
+    }
+    compact_export_step.execute({}, context)
+
+    exported = pd.read_parquet(context["output_file_path"])
+    assert exported["population"].tolist()[-1] == 2**40
+    assert exported["air_pollution_level"].dtype == "float64"
+    assert isinstance(
+        exported["air_pollutant_description"].dtype, pd.CategoricalDtype
+    )
+    report = context["export_schema_report"]
+    assert report["dtypes"] == {"air_pollutant_description": "category"}
+
+
+def test_sqlite_export_indexes_lookup_columns(
+    export_step, cleaned_output_df, tmp_path
+):
+    """Test the SQLite export and its province/year/pollutant indexes."""
+    import sqlite3
+
+    output_df = cleaned_output_df.assign(
+        year=pd.to_datetime(["2019", "2020", "2020"]),
+        air_pollutant=pd.Categorical(["no2", "o3", "no2"]),
+    )
+    context = {"data_path": tmp_path, "export_format": ["sqlite"]}
+    export_step.execute({"output_df": output_df}, context)
+
+    assert (
+        context["output_file_path"] == tmp_path / "output" / "dataset.sqlite"
+    )
+    with sqlite3.connect(context["output_file_path"]) as connection:
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        query = (
+            "SELECT air_pollution_level FROM dataset "
+            "WHERE province = 'madrid' AND air_pollutant = 'no2' "
+            "AND year >= '2020-01-01'"
+        )
+        plan = " ".join(
+            str(row)
+            for row in connection.execute(f"EXPLAIN QUERY PLAN {query}")
+        )
+        rows = connection.execute(query).fetchall()
+
+    assert indexes == {
+        "idx_dataset_province",
+        "idx_dataset_year",
+        "idx_dataset_air_pollutant",
+        "idx_dataset_province_year_air_pollutant",
+    }
+    assert "USING INDEX" in plan
+    assert rows == [(pytest.approx(40.1),)]
+
+
+def test_duckdb_export(export_step, cleaned_output_df, tmp_path):
+    """Test the optional DuckDB export."""
+    duckdb = pytest.importorskip("duckdb")
+    context = {"data_path": tmp_path, "export_format": ["duckdb"]}
+    export_step.execute({"output_df": cleaned_output_df}, context)
+
+    connection = duckdb.connect(str(context["output_file_path"]))
+    exported = connection.sql(
+        "SELECT population FROM dataset WHERE province = 'soria'"
+    ).fetchall()
+    connection.close()
+    assert exported == [(88_884,)]
+
+
+@pytest.fixture
+def station_output_df() -> pd.DataFrame:
+    """Cleaned dataset with two stations over three province-years."""
+    return pd.DataFrame(
+        {
+            "province": pd.Categorical(
+                ["madrid", "madrid", "madrid", "soria", "soria"]
+            ),
+            "year": pd.to_datetime(["2019", "2019", "2020", "2019", "2020"]),
+            "longitude": [-3.7, -3.7, -3.7, -2.4, -2.4],
+            "latitude": [40.4, 40.4, 40.4, 41.7, 41.7],
+            "altitude": [650.0, 650.0, 650.0, 1060.0, 1060.0],
+            "air_pollutant": pd.Categorical(
+                ["no2", "o3", "no2", "no2", "no2"]
+            ),
+            "air_pollution_level": [50.5, 45.2, 40.1, 10.0, 12.0],
+        }
+    )
+
+
+def test_incremental_export_rewrites_only_changed_partitions(
+    export_step, station_output_df, tmp_path
+):
+    """Test the diff against the previous incremental export."""
+    pytest.importorskip("pyarrow")
+    context = {"data_path": tmp_path, "export_format": ["incremental_parquet"]}
+    export_step.execute({"output_df": station_output_df}, context)
+
+    assert context["export_stats"]["incremental_parquet"]["mode"] == "full"
+    dataset_path = context["output_file_path"]
+    untouched = dataset_path / "year=2020" / "province=madrid"
+    untouched_mtime = (untouched / "part-0.parquet").stat().st_mtime_ns
+
+    # One changed level, one new station row and a dropped partition
+    changed_df = pd.concat(
+        [
+            station_output_df.iloc[:3].assign(
+                air_pollution_level=[50.5, 47.0, 40.1]
+            ),
+            station_output_df.iloc[[3]].assign(air_pollutant="o3"),
+            station_output_df.iloc[[3]],
+        ],
+        ignore_index=True,
+    ).astype({"province": "category", "air_pollutant": "category"})
+    export_step.execute({"output_df": changed_df}, context)
+
+    diff = context["export_stats"]["incremental_parquet"]
+    assert diff == {
+        "mode": "incremental",
+        "partitions_written": 2,
+        "partitions_deleted": 1,
+        "partitions_unchanged": 1,
+        "rows_added": 1,
+        "rows_removed": 1,
+        "rows_changed": 1,
+        "bytes_written": diff["bytes_written"],
+    }
+    assert (untouched / "part-0.parquet").stat().st_mtime_ns == (
+        untouched_mtime
+    )
+    assert not (dataset_path / "year=2020" / "province=soria").exists()
+
+    exported = pd.read_parquet(dataset_path)
+    assert len(exported) == len(changed_df)
+    assert sorted(exported["air_pollution_level"]) == pytest.approx(
+        sorted(changed_df["air_pollution_level"])
+    )
+
+
+def test_incremental_and_partitioned_exports_kept_apart(
+    export_step, station_output_df, tmp_path
+):
+    """Test that a partitioned export leaves the incremental one intact."""
+    pytest.importorskip("pyarrow")
+    formats = ["partitioned_parquet", "incremental_parquet"]
+    context = {"data_path": tmp_path, "export_format": formats}
+    export_step.execute({"output_df": station_output_df}, context)
+    export_step.execute({"output_df": station_output_df}, context)
+
+    output_dir = tmp_path / "output"
+    assert (output_dir / "dataset_incremental" / "_manifest.json").exists()
+    assert not (output_dir / "dataset" / "_manifest.json").exists()
+    diff = context["export_stats"]["incremental_parquet"]
+    assert diff["mode"] == "incremental"
+    assert diff["partitions_written"] == 0
+
+
+def test_formats_writing_the_same_target_rejected(
+    export_step, station_output_df, tmp_path
+):
+    """Test that two formats may not write the same directory."""
+    export_step.exporters["incremental_parquet"].options[
+        "directory"
+    ] = "dataset"
+    context = {
+        "data_path": tmp_path,
+        "export_format": ["partitioned_parquet", "incremental_parquet"],
+    }
+
+    with pytest.raises(ValueError, match="both write 'dataset'"):
+        export_step.execute({"output_df": station_output_df}, context)
+
+
+def test_int_year_keys_exported_as_dates(
+    export_step, cleaned_output_df, tmp_path
+):
+    """Test that int16 year keys become datetime64 values at export."""
+    pytest.importorskip("pyarrow")
+    export_step.int_year_keys = True
+    output_df = cleaned_output_df.assign(
+        year=pd.Series([2019, 2020, 2021], dtype="int16")
+    )
+
+    context = {"data_path": tmp_path, "export_format": ["parquet"]}
+    export_step.execute({"output_df": output_df}, context)
+
+    exported = pd.read_parquet(context["output_file_path"])
+    assert pd.api.types.is_datetime64_any_dtype(exported["year"])
+    assert exported["year"].dt.year.tolist() == [2019, 2020, 2021]
+    assert output_df["year"].dtype == "int16"
+
+
+def test_province_year_table_exported(
+    export_step, sample_dataframes_for_export, tmp_path
+):
+    """Test that the province-year table is written to its directory."""
+    dataframes = {
+        **sample_dataframes_for_export,
+        "province_year_df": pd.DataFrame(
+            {"province": ["madrid"], "year": [2020], "no2_mean": [31.5]}
+        ),
+    }
+    context = {"data_path": tmp_path, "export_format": ["csv", "sqlite"]}
+
+    export_step.execute(dataframes, context)
+
+    paths = context["province_year_paths"]
+    assert list(paths) == ["csv"]
+    assert paths["csv"].parent == tmp_path / "output" / "province_year"
+    pd.testing.assert_frame_equal(
+        pd.read_csv(paths["csv"]), dataframes["province_year_df"]
+    )
+
+
+def test_station_dimension_joined_back(export_step, tmp_path):
+    """Test that the station columns are exported in place of station_id."""
+    full_df = pd.DataFrame(
+        {
+            "province": ["madrid", "madrid", "zaragoza"],
+            "air_pollution_level": [50.5, 45.2, 40.1],
+            "air_quality_station_type": ["traffic", "traffic", "background"],
+            "longitude": [-3.7, -3.7, -0.9],
+            "pib": [35.0, 35.0, 28.0],
+        }
+    )
+    dataframes = {
+        "output_df": full_df.drop(
+            columns=["air_quality_station_type", "longitude"]
+        ).assign(station_id=[0, 0, 1])[
+            ["province", "air_pollution_level", "station_id", "pib"]
+        ],
+        "stations": full_df.iloc[[0, 2]][
+            ["air_quality_station_type", "longitude"]
+        ].reset_index(drop=True),
+    }
+    context = {"data_path": tmp_path, "export_format": ["csv"]}
+
+    export_step.execute(dataframes, context)
+
+    assert "stations" not in dataframes
+    pd.testing.assert_frame_equal(dataframes["output_df"], full_df)
+    pd.testing.assert_frame_equal(
+        pd.read_csv(context["output_file_path"]), full_df
+    )
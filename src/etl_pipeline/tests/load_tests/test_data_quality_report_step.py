@@ -18,6 +18,16 @@ def test_execute_missing_output_df(quality_report_step):
         quality_report_step.execute(empty_dataframes, context)
 
 
+def test_execute_skipped_for_streamed_export(quality_report_step, tmp_path):
+    """Test that a streamed export, without 'output_df', is not reported."""
+    context = {"data_path": tmp_path, "output_chunks": iter([])}
+
+    quality_report_step.execute({}, context)
+
+    assert "reports_path" not in context
+    assert not (tmp_path / "output" / "reports").exists()
+
+
 def test_execute_missing_data_path(
     quality_report_step, dataframes_with_output
 ):
@@ -178,3 +188,114 @@ def test_full_execute_integration(
     assert "memory_usage_mb" in report_data
     assert "duplicate_rows" in report_data
     assert "missing_data" in report_data
+
+
+def test_quality_statistics_match_pandas():
+    """Test that the one-pass statistics match the pandas reductions."""
+    from etl_pipeline.load.data_reporters import QualityStatistics
+
+    df = pd.DataFrame(
+        {
+            "Province": pd.Categorical(
+                ["Madrid", "Sevilla", "Madrid", "Sevilla", None, "Madrid"],
+                categories=["Sevilla", "Madrid", "Cuenca"],
+            ),
+            "Station": ["b", "a", "b", "a", None, "c"],
+            "Year": pd.to_datetime(
+                ["2020", "2021", "2020", "2021", "2019", "2021"]
+            ),
+            "Air Pollution Level": [50.5, None, 50.5, None, 3.0, -0.0],
+            "Population": [10, 20, 10, 20, 30, 40],
+        }
+    )
+
+    report = QualityStatistics(df).report()
+
+    assert report["duplicate_rows"] == df.duplicated().sum() == 2
+    assert report["memory_usage_mb"] == pytest.approx(
+        df.memory_usage(deep=True).sum() / 1024 / 1024
+    )
+    assert report["missing_data"]["total_missing_values"] == 4
+    describe = df.describe().to_dict()
+    for col in ("Air Pollution Level", "Population"):
+        assert report["numeric_summary"][col] == pytest.approx(
+            describe[col], nan_ok=True
+        )
+    for col in ("Province", "Station"):
+        assert report["categorical_summary"][col] == {
+            "unique_values": df[col].nunique(),
+            "most_frequent": df[col].mode().iloc[0],
+        }
+    assert report["year_statistics"]["year_counts"] == {
+        2019: 1,
+        2020: 2,
+        2021: 3,
+    }
+
+
+def test_approximate_statistics_merge_chunks():
+    """Test that sketched statistics of two chunks merge into one report."""
+    from etl_pipeline.load.data_reporters import (
+        ApproximateQualityStatistics,
+        QualityStatistics,
+    )
+
+    df = pd.DataFrame(
+        {
+            "Province": pd.Categorical(
+                ["Madrid", "Sevilla", "Madrid", "Cuenca"] * 50
+            ),
+            "Year": pd.to_datetime(["2020", "2021", "2020", "2019"] * 50),
+            "Air Pollution Level": [float(i) for i in range(200)],
+        }
+    )
+    # Duplicates within and across the two chunks
+    df.iloc[[1, 150]] = df.iloc[[0, 10]].to_numpy()
+    df.iloc[170] = df.iloc[160]
+    first = ApproximateQualityStatistics()
+    first.update(df.iloc[:120])
+    second = ApproximateQualityStatistics()
+    second.update(df.iloc[120:])
+    first.merge(second)
+
+    report = first.report()
+    exact = QualityStatistics(df).report()
+
+    for key in (
+        "total_records",
+        "duplicate_rows",
+        "missing_data",
+        "year_statistics",
+    ):
+        assert report[key] == exact[key]
+    assert report["categorical_summary"] == exact["categorical_summary"]
+    summary = report["numeric_summary"]["Air Pollution Level"]
+    expected = exact["numeric_summary"]["Air Pollution Level"]
+    for key in ("count", "mean", "std", "min", "max"):
+        assert summary[key] == pytest.approx(expected[key])
+    # Quartiles are within the rank error of the quantile sketch
+    rank_error = report["approximation"]["quantile_rank_error"]
+    assert summary["50%"] == pytest.approx(
+        expected["50%"], abs=200 * rank_error + 1
+    )
+    assert report["approximation"]["most_frequent_max_count_error"] == {
+        "Province": 0
+    }
+
+
+def test_execute_approximate_report_mode(
+    quality_report_step, dataframes_with_output, tmp_path
+):
+    """Test that the approximate mode writes the error bounds."""
+    import json
+
+    context = {"data_path": str(tmp_path), "report_mode": "approximate"}
+
+    quality_report_step.execute(dataframes_with_output, context)
+
+    with open(context["quality_report_path"], "r") as f:
+        report_data = json.load(f)
+    assert report_data["total_records"] == len(
+        dataframes_with_output["output_df"]
+    )
+    assert "unique_values_relative_error" in report_data["approximation"]
@@ -0,0 +1,85 @@
+import json
+import threading
+from http.client import HTTPConnection
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from etl_pipeline.etl_step import ETLStep
+from etl_pipeline.main_orchestrator import ETLPipeline
+from etl_pipeline.service import ETLService, create_server
+
+
+class ExportingStep(ETLStep):
+    """Step that fills the context keys the pipeline results need."""
+
+    def __init__(self):
+        super().__init__("ExportingStep")
+
+    def execute(
+        self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
+    ) -> None:
+        """Record the export format in the output."""
+        output = pd.DataFrame({"format": context["export_format"]})
+        context["output_file"] = output
+        context["output_file_path"] = Path("dataset.csv")
+        context["reports_path"] = Path("reports")
+
+
+@pytest.fixture
+def running_service() -> Iterator[Tuple[ETLService, int]]:
+    """Serve an ETLService with a single test step on a free port."""
+    with patch("etl_pipeline.main_orchestrator.CheckProjectStructure"):
+        service = ETLService(ETLPipeline(steps=[ExportingStep()]))
+        server = create_server(service, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield service, server.server_address[1]  # type: ignore[index]
+        server.shutdown()
+        server.server_close()
+
+
+def _request(
+    port: int, method: str, path: str, body: Any = None
+) -> Tuple[int, Dict[str, Any]]:
+    """Send a request to the local service and decode the JSON reply."""
+    connection = HTTPConnection("127.0.0.1", port, timeout=10)
+    payload = json.dumps(body) if body is not None else None
+    connection.request(method, path, body=payload)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_service_runs_pipeline_on_request(
+    running_service: Tuple[ETLService, int],
+):
+    """Test that POST /run returns the results and honours options."""
+    _, port = running_service
+
+    status, results = _request(
+        port, "POST", "/run", {"export_format": ["csv", "parquet"]}
+    )
+
+    assert status == 200
+    assert results["final_shape"] == [2, 1]
+    assert results["output_file_path"] == "dataset.csv"
+    assert isinstance(results["execution_time"], float)
+    assert _request(port, "GET", "/health") == (
+        200,
+        {"status": "ok", "runs": 1},
+    )
+
+
+def test_service_rejects_unknown_options(
+    running_service: Tuple[ETLService, int],
+):
+    """Test that unknown run options are a client error."""
+    _, port = running_service
+
+    status, body = _request(port, "POST", "/run", {"data_path": "/tmp"})
+
+    assert status == 400
+    assert "Unknown run options" in body["error"]
@@ -1,9 +1,11 @@
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from common.utils.dataframe_utils import join_dimension, split_dimension
 from etl_pipeline.transform import DataCleaningStep
 
 
@@ -248,3 +250,48 @@ def test_convert_to_appropriate_dtypes(cleaning_step: DataCleaningStep):
 def test_step_name_initialization(cleaning_step: DataCleaningStep):
     """Test that the step is initialized with correct name."""
     assert cleaning_step.name == "etl_pipeline.transform.data_cleaning_step"
+
+
+def test_cleaning_with_station_dimension_matches_full_rows(
+    cleaning_step: DataCleaningStep,
+):
+    """Test that cleaning a station dimension matches cleaning full rows."""
+    rng = np.random.default_rng(0)
+    station = rng.integers(0, 6, size=60)
+    # Station 5 has no coordinates: its rows are under 5% of the dataset
+    station[station == 5] = 0
+    station[:2] = 5
+    longitude = np.array([-3.7, -0.9, -4.0, -2.5, -1.1, np.nan])
+    df = pd.DataFrame(
+        {
+            "Air Pollutant": rng.choice(["NO2", "O3"], size=60),
+            "Year": pd.to_datetime(
+                rng.choice(["1999", "2015", "2020"], size=60)
+            ),
+            "Air Pollution Level": rng.uniform(0, 100, size=60).round(1),
+            "Air Quality Station Type": np.array(
+                ["Traffic", "Background", "Traffic"] * 2
+            )[station],
+            "Longitude": longitude[station],
+            "Province": np.array(["Madrid", "Zaragoza"] * 3)[station],
+        }
+    )
+    expected = {"output_df": df.copy()}
+    fact, stations = split_dimension(
+        df, ["Air Quality Station Type", "Longitude"], "station_id"
+    )
+    dataframes = {"output_df": fact, "stations": stations}
+
+    cleaning_step.execute(expected, {})
+    cleaning_step.execute(dataframes, {})
+
+    assert dataframes["stations"].columns.tolist() == [
+        "air_quality_station_type",
+        "longitude",
+    ]
+    pd.testing.assert_frame_equal(
+        join_dimension(
+            dataframes["output_df"], dataframes["stations"], "station_id"
+        ),
+        expected["output_df"],
+    )
@@ -79,3 +79,111 @@ def test_execute_missing_dataframe():
 
     with pytest.raises(ValueError, match="Input DataFrame is empty"):
         step.execute(incomplete_dataframes, {})
+
+
+def test_gdp_reshape_matches_melt():
+    """Test on the real GDP file that the reshape matches DataFrame.melt."""
+    from pathlib import Path
+
+    from etl_pipeline.extract.data_extractors import (
+        SocioeconomicDataExtractor,
+    )
+    from etl_pipeline.transform.data_transformers import (
+        SocioeconomicDataTransformer,
+    )
+    from etl_pipeline.utils.province_mapper import ProvinceMapper
+
+    dataframes = {}
+    SocioeconomicDataExtractor(Path(__file__).parents[2] / "data").extract(
+        dataframes
+    )
+    gdp_df = dataframes["gdp"]
+
+    expected = gdp_df.melt(id_vars=["Provincia"], var_name="anio").rename(
+        columns={"value": "pib", "Provincia": "Province", "anio": "Year"}
+    )
+    expected["Year"] = pd.to_datetime(expected["Year"], format="%Y")
+    expected["pib"] = expected["pib"].astype(float)
+    ProvinceMapper.map_province_name(expected)
+
+    result = SocioeconomicDataTransformer()._transform_gdp_columns(gdp_df)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert "object" not in result.dtypes.astype(str).tolist()
+
+
+def test_province_imputed_from_nearest_station():
+    """Test that missing provinces take the nearest station's province."""
+    from etl_pipeline.transform.data_transformers import (
+        AirQualityDataTransformer,
+    )
+
+    air_quality_df = pd.DataFrame(
+        {
+            "Air Pollutant": ["NO2"] * 6,
+            "Air Pollution Level": [20.0, 35.0, 50.0, 12.0, 40.0, 8.0],
+            "Longitude": [-3.705, -0.877, -3.71, -0.88, -0.88, -20.0],
+            "Latitude": [40.347, 41.656, 40.35, 41.65, 41.65, 28.0],
+            "Province": ["Madrid", "Zaragoza", "Desconocido", None]
+            + ["Error", "Error"],
+        }
+    )
+
+    (result,) = AirQualityDataTransformer(
+        {"enabled": True, "max_distance_km": 25}
+    ).transform(air_quality_df)
+
+    assert result["Province"].iloc[:5].tolist() == [
+        "Madrid",
+        "Zaragoza",
+        "Madrid",
+        "Zaragoza",
+        "Zaragoza",
+    ]
+    # No station within 25 km
+    assert result["Province"].iloc[5] not in ("Madrid", "Zaragoza")
+
+
+def test_quality_classification_matches_pd_cut():
+    """Test the vectorized classification against pd.cut on each row."""
+    from etl_pipeline.transform.data_transformers import (
+        AirQualityDataTransformer,
+    )
+    from etl_pipeline.utils.air_quality_rules import (
+        quality_labels,
+        quality_thresholds,
+    )
+
+    levels = [0.0, 10.0, 10.5, 40.0, 120.0, 750.0, 900.0, -1.0, None]
+    pollutants = ["NO2", "PM2.5", "pm10", "O3", "no2", "SO2", "so2"]
+    air_quality_df = pd.DataFrame(
+        {
+            "Air Pollutant": [p for p in pollutants + ["CO"] for _ in levels],
+            "Air Pollution Level": levels * (len(pollutants) + 1),
+            "Province": "Madrid",
+        }
+    )
+    expected = [
+        (
+            str(
+                pd.cut(
+                    [level],
+                    bins=quality_thresholds[pollutant.lower()],
+                    labels=quality_labels,
+                )[0]
+            )
+            if pollutant.lower() in quality_thresholds
+            else "UNKNOWN"
+        )
+        for pollutant, level in zip(
+            air_quality_df["Air Pollutant"],
+            air_quality_df["Air Pollution Level"],
+        )
+    ]
+
+    (result,) = AirQualityDataTransformer().transform(air_quality_df)
+
+    pd.testing.assert_series_equal(
+        result["Quality"],
+        pd.Series(expected, name="Quality").astype("category"),
+    )
@@ -0,0 +1,311 @@
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.utils.dataframe_utils import split_dimension
+from etl_pipeline.transform import DataValidationStep
+from etl_pipeline.transform.data_validators import (
+    SampledDataValidator,
+    StreamingDataValidator,
+    ValidationRulePlan,
+)
+
+
+@pytest.fixture
+def validation_step() -> DataValidationStep:
+    """Create a DataValidationStep instance."""
+    return DataValidationStep()
+
+
+@pytest.fixture
+def dataframe_with_issues() -> pd.DataFrame:
+    """DataFrame with duplicates, nulls and business rule violations."""
+    df = pd.DataFrame(
+        {
+            "Province": ["Madrid", "Barcelona", "Valencia", "Sevilla"] * 50,
+            "Year": pd.to_datetime(
+                ["1998", "2005", "2010", "2020"] * 50, format="%Y"
+            ),
+            "Air Pollution Level": [float(i) for i in range(200)],
+        }
+    )
+    df.loc[0:39, "Air Pollution Level"] = 10_000.0
+    df.loc[45, "Air Pollution Level"] = -5.0
+    df.loc[47, "Province"] = None
+    return pd.concat([df, df.iloc[[10, 11]]], ignore_index=True)
+
+
+def test_execute_missing_output_df(validation_step: DataValidationStep):
+    """Test that execute raises ValueError when output_df is missing."""
+    with pytest.raises(ValueError, match="'output_df' is missing"):
+        validation_step.execute({}, {})
+
+
+def test_rule_plan_compiled_from_config(validation_step: DataValidationStep):
+    """Test that ranges, memberships, dtypes and non-null rules compile."""
+    rule_kinds = {rule.kind for rule in validation_step.rule_plan.rules}
+
+    assert rule_kinds == {"range", "membership", "dtype", "non_null"}
+
+
+def test_rule_plan_counts_violations():
+    """Test that the plan counts violations per rule on cleaned names."""
+    plan = ValidationRulePlan.from_config(
+        {
+            "ranges": {
+                "Year": {"min": 2000, "max": 2021, "severity": "warning"},
+                "Air Pollution Level": {"min": 0, "max": 1000},
+            },
+            "allowed_values": {"air_pollutant": ["no2", "o3"]},
+            "data_types": {"numeric_columns": ["province"]},
+            "non_null_columns": ["province"],
+        }
+    )
+    df = pd.DataFrame(
+        {
+            "year": pd.to_datetime(["1999", "2010", "2022"], format="%Y"),
+            "air_pollution_level": [-1.0, 5.0, 2000.0],
+            "air_pollutant": pd.Categorical(["no2", "pm10", "pm10"]),
+            "province": ["Madrid", None, "Soria"],
+        }
+    )
+
+    counts = plan.evaluate(df)
+
+    assert counts == {
+        "range:Year": 2,
+        "range:Air Pollution Level": 2,
+        "membership:air_pollutant": 2,
+        "dtype:province": 2,
+        "non_null:province": 1,
+    }
+
+
+def test_business_rule_severity(validation_step: DataValidationStep):
+    """Test that warning rules do not fail validation but errors do."""
+    df = pd.DataFrame(
+        {
+            "year": pd.to_datetime(["1999", "2010"], format="%Y"),
+            "air_pollution_level": [1.0, 2.0],
+        }
+    )
+    results = {"passed": True, "warnings": [], "errors": []}
+
+    validation_step._validate_business_rules(df, results)  # type: ignore[attr-defined]  # noqa: E501
+
+    assert results["passed"]
+    assert any("outside valid range" in w for w in results["warnings"])
+
+    df.loc[0, "air_pollution_level"] = -3.0
+    validation_step._validate_business_rules(df, results)  # type: ignore[attr-defined]  # noqa: E501
+
+    assert not results["passed"]
+
+
+def test_execute_streaming_requires_source(
+    validation_step: DataValidationStep,
+):
+    """Test that streaming mode requires a Parquet source in context."""
+    with pytest.raises(ValueError, match="'validation_source' is missing"):
+        validation_step.execute({}, {"validation_mode": "streaming"})
+
+
+def test_streaming_validation_matches_in_memory(
+    validation_step: DataValidationStep,
+    dataframe_with_issues: pd.DataFrame,
+    tmp_path: Path,
+):
+    """Test that row-group validation reports the in-memory results."""
+    pytest.importorskip("pyarrow")
+    parquet_path = tmp_path / "dataset.parquet"
+    dataframe_with_issues.to_parquet(parquet_path, row_group_size=32)
+
+    in_memory = validation_step._run_comprehensive_validation(  # type: ignore[attr-defined]  # noqa: E501
+        dataframe_with_issues
+    )
+    streaming = validation_step._run_streaming_validation(  # type: ignore[attr-defined]  # noqa: E501
+        parquet_path
+    )
+
+    assert streaming["total_records"] == in_memory["total_records"]
+    assert streaming["passed"] == in_memory["passed"]
+    assert streaming["errors"] == in_memory["errors"]
+    assert streaming["warnings"] == in_memory["warnings"]
+    assert streaming["distinct_counts"]["Province"] == 4
+
+
+def test_streaming_validation_reads_hive_partition_keys(tmp_path: Path):
+    """Test that Hive partition keys are profiled as regular columns."""
+    pytest.importorskip("pyarrow")
+    dataset_dir = tmp_path / "dataset"
+    pd.DataFrame(
+        {
+            "year": [2019, 2020, 2019, 2020],
+            "province": ["Madrid", "Madrid", "Sevilla", "Sevilla"],
+            "air_pollution_level": [10.0, 10.0, 10.0, 10.0],
+        }
+    ).to_parquet(dataset_dir, partition_cols=["year", "province"])
+
+    profile = StreamingDataValidator().profile(dataset_dir)
+
+    assert profile["total_records"] == 4
+    assert {"year", "province"} <= set(profile["columns"])
+    assert profile["duplicate_count"] == 0
+
+
+def test_streaming_outliers_match_in_memory_quartiles(tmp_path: Path):
+    """Test that outliers use exact quartiles when the column fits."""
+    pytest.importorskip("pyarrow")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"level": rng.lognormal(3, 1, 50_000)})
+    parquet_path = tmp_path / "dataset.parquet"
+    df.to_parquet(parquet_path, row_group_size=4_096)
+    q1, q3 = df["level"].quantile([0.25, 0.75])
+    expected = int(
+        (
+            (df["level"] < q1 - 1.5 * (q3 - q1))
+            | (df["level"] > q3 + 1.5 * (q3 - q1))
+        ).sum()
+    )
+
+    exact = StreamingDataValidator().profile(parquet_path)
+    sketched = StreamingDataValidator(exact_quantile_rows=0).profile(
+        parquet_path
+    )
+
+    assert exact["quartiles"]["level"] == {"q1": q1, "q3": q3}
+    assert exact["outlier_counts"]["level"] == expected
+    assert exact["approximate_outliers"] == []
+    assert sketched["approximate_outliers"] == ["level"]
+
+
+def test_streaming_approximate_outliers_flagged(
+    validation_step: DataValidationStep, tmp_path: Path
+):
+    """Test that outliers from sketched quartiles are marked approximate."""
+    pytest.importorskip("pyarrow")
+    parquet_path = tmp_path / "dataset.parquet"
+    pd.DataFrame({"level": [1.0, 2.0, 3.0, 4.0] * 4 + [100.0] * 4}).to_parquet(
+        parquet_path
+    )
+    validation_step.validation_config = {
+        "required_columns": [],
+        "streaming": {"exact_quantile_rows": 0},
+    }
+
+    results = validation_step._run_streaming_validation(parquet_path)  # type: ignore[attr-defined]  # noqa: E501
+
+    assert results["approximate_outliers"] == ["level"]
+    assert any(
+        "outliers detected" in w and "approximate" in w
+        for w in results["warnings"]
+    )
+
+
+def test_execute_streaming_mode(
+    validation_step: DataValidationStep, tmp_path: Path
+):
+    """Test that a clean Parquet dataset passes streaming validation."""
+    pytest.importorskip("pyarrow")
+    parquet_path = tmp_path / "dataset.parquet"
+    pd.DataFrame(
+        {
+            "Province": ["Madrid", "Barcelona", "Valencia"],
+            "Air Pollution Level": [50.5, 45.2, 40.1],
+        }
+    ).to_parquet(parquet_path)
+    validation_step.validation_config = {"required_columns": []}
+    context: Dict[str, object] = {
+        "validation_mode": "streaming",
+        "validation_source": parquet_path,
+    }
+
+    validation_step.execute({}, context)
+
+    assert context["validation_summary"]["passed"]  # type: ignore[index]
+
+
+def test_sampled_validator_bounds_cover_true_counts():
+    """Test that sampled estimates bound the exact duplicates/outliers."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "province": pd.Categorical(rng.choice(["a", "b", "c"], 20_000)),
+            "air_pollutant": pd.Categorical(rng.choice(["no2", "o3"], 20_000)),
+            "air_pollution_level": rng.normal(50, 10, 20_000),
+        }
+    )
+    df = pd.concat([df, df.iloc[:1_000]], ignore_index=True)
+    values = df["air_pollution_level"]
+    q1, q3 = values.quantile([0.25, 0.75])
+    true_outliers = int(
+        (
+            (values < q1 - 1.5 * (q3 - q1)) | (values > q3 + 1.5 * (q3 - q1))
+        ).sum()
+    )
+
+    profile = SampledDataValidator(fraction=0.2).profile(df)
+
+    duplicates = profile["duplicate_rows"]
+    outliers = profile["outliers"]["air_pollution_level"]
+    assert profile["strata"] == 6
+    assert profile["sample_size"] < len(df)
+    assert duplicates["lower"] <= 1_000 <= duplicates["upper"]
+    assert outliers["lower"] <= true_outliers <= outliers["upper"]
+
+
+def test_execute_sample_mode(
+    validation_step: DataValidationStep,
+    dataframe_with_issues: pd.DataFrame,
+):
+    """Test that sample mode reports estimates and flags the issues."""
+    validation_step.validation_config = {
+        **validation_step.validation_config,
+        "required_columns": [],
+        "sampling": {"fraction": 1.0},
+    }
+
+    results = validation_step._run_sampled_validation(  # type: ignore[attr-defined]  # noqa: E501
+        dataframe_with_issues
+    )
+
+    duplicates = int(dataframe_with_issues.duplicated().sum())
+    assert results["estimates"]["duplicate_rows"]["estimate"] == duplicates
+    assert not results["passed"]
+    assert any("outside valid range" in e for e in results["errors"])
+
+
+def test_station_dimension_validated_without_join(
+    validation_step: DataValidationStep,
+):
+    """Test that the fact and station tables report the joined results."""
+    rng = np.random.default_rng(0)
+    station = rng.integers(0, 6, 300)
+    joined = pd.DataFrame(
+        {
+            "province": rng.choice(["madrid", "sevilla"], 300),
+            "air_quality_station_type": np.array(
+                ["traffic", "background", "mine", None, "traffic", "rural"],
+                dtype=object,
+            )[station],
+            "altitude": np.array([600.0, 10.0, np.nan, 650, 620, 4000])[
+                station
+            ],
+            "air_pollution_level": rng.normal(50, 10, 300),
+        }
+    )
+    fact, stations = split_dimension(
+        joined, ["air_quality_station_type", "altitude"], "station_id"
+    )
+
+    expected = validation_step._run_comprehensive_validation(joined)  # type: ignore[attr-defined]  # noqa: E501
+    results = validation_step._run_comprehensive_validation(  # type: ignore[attr-defined]  # noqa: E501
+        fact, stations
+    )
+
+    assert results["passed"] == expected["passed"]
+    assert results["errors"] == expected["errors"]
+    assert results["warnings"] == expected["warnings"]
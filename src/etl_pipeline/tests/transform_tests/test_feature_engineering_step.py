@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+import pytest
+from etl_pipeline.transform import FeatureEngineeringStep
+from etl_pipeline.transform.data_features import (
+    EXCEEDANCE_LIMITS,
+    FEATURES,
+    FeatureRegistry,
+    YearlyGrid,
+)
+
+
+@pytest.fixture
+def merged_df() -> pd.DataFrame:
+    """Merged dataset with two provinces, two pollutants and four years."""
+    rng = np.random.default_rng(0)
+    n = 400
+    years = rng.choice([2015, 2016, 2018, 2019], size=n)
+    provinces = rng.choice(["Madrid", "Soria"], size=n)
+    pib = {"Madrid": 34.0, "Soria": 24.0}
+    return pd.DataFrame(
+        {
+            "Province": pd.Categorical(provinces),
+            "Year": pd.to_datetime(years.astype(str)),
+            "Air Pollutant": pd.Categorical(
+                rng.choice(["no2", "pm10"], size=n)
+            ),
+            "Air Pollution Level": rng.uniform(0, 150, size=n),
+            "pib": [pib[p] + (y - 2015) for p, y in zip(provinces, years)],
+            "Respiratory_diseases_total": rng.integers(100, 1000, size=n),
+            "Population": rng.integers(80_000, 7_000_000, size=n),
+        }
+    )
+
+
+def test_plan_orders_dependencies():
+    """Test that dependencies are added and evaluated first."""
+    plan = FEATURES.plan(
+        ["air_pollution_level_rolling_3", "air_pollution_level_lag_1"]
+    )
+
+    assert [feature.name for feature in plan] == [
+        "air_pollution_level_yearly_mean",
+        "air_pollution_level_rolling_3",
+        "air_pollution_level_lag_1",
+    ]
+
+
+def test_plan_rejects_unknown_features_and_cycles():
+    """Test the errors of unknown features and dependency cycles."""
+    registry = FeatureRegistry()
+    registry.register("a", inputs=("b",))(lambda df: df["b"])
+    registry.register("b", inputs=("a",))(lambda df: df["a"])
+
+    with pytest.raises(ValueError, match="cycle"):
+        registry.plan(["a"])
+    with pytest.raises(ValueError, match="Unknown feature"):
+        registry.plan(["c"])
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("a", inputs=())(lambda df: df)
+
+
+def test_execute_computes_only_requested_features(merged_df):
+    """Test that only the configured features and their inputs are added."""
+    step = FeatureEngineeringStep()
+    step.features = ["air_pollution_level_lag_1"]
+
+    step.execute({"output_df": merged_df}, {})
+
+    added = set(merged_df.columns) - {
+        "Province",
+        "Year",
+        "Air Pollutant",
+        "Air Pollution Level",
+        "pib",
+        "Respiratory_diseases_total",
+        "Population",
+    }
+    assert added == {
+        "air_pollution_level_yearly_mean",
+        "air_pollution_level_lag_1",
+    }
+
+
+def test_execute_skips_features_with_missing_inputs(merged_df):
+    """Test that features without their input columns are skipped."""
+    step = FeatureEngineeringStep()
+    step.features = ["respiratory_deaths_per_100k", "pib_ratio_to_year_mean"]
+    df = merged_df.drop(columns=["Population"])
+
+    step.execute({"output_df": df}, {})
+
+    assert "respiratory_deaths_per_100k" not in df.columns
+    assert "pib_ratio_to_year_mean" in df.columns
+
+
+def test_features_match_pandas_groupby(merged_df):
+    """Test every built-in feature against a pandas groupby reference."""
+    step = FeatureEngineeringStep()
+    step.features = FEATURES.names
+    df = merged_df.copy()
+
+    step.execute({"output_df": df}, {})
+
+    pd.testing.assert_series_equal(
+        df["respiratory_deaths_per_100k"],
+        round(
+            merged_df["Respiratory_diseases_total"]
+            / merged_df["Population"]
+            * 100000,
+            2,
+        ),
+        check_names=False,
+    )
+
+    pairs = merged_df.drop_duplicates(["Province", "Year"])
+    year_mean = merged_df["Year"].map(pairs.groupby("Year")["pib"].mean())
+    np.testing.assert_allclose(
+        df["pib_ratio_to_year_mean"], merged_df["pib"] / year_mean
+    )
+
+    limits = merged_df["Air Pollutant"].astype(str).map(EXCEEDANCE_LIMITS)
+    exceeded = merged_df["Air Pollution Level"] > limits
+    expected = exceeded.groupby(
+        [merged_df["Province"], merged_df["Year"]], observed=True
+    ).transform("sum")
+    np.testing.assert_array_equal(
+        df["exceedances_per_province_year"], expected
+    )
+
+    keys = ["Province", "Air Pollutant", "Year"]
+    yearly = merged_df.groupby(keys, observed=True)[
+        "Air Pollution Level"
+    ].mean()
+    np.testing.assert_allclose(
+        df["air_pollution_level_yearly_mean"],
+        merged_df.join(yearly.rename("mean"), on=keys)["mean"],
+    )
+
+    years = yearly.reset_index()
+    years["Year"] = years["Year"].dt.year
+    lookup = years.set_index(["Province", "Air Pollutant", "Year"])[
+        "Air Pollution Level"
+    ]
+    row_years = merged_df["Year"].dt.year
+    for row, result in df.iterrows():
+        key = (result["Province"], result["Air Pollutant"])
+        window = [
+            lookup.get(key + (row_years[row] - back,)) for back in range(5)
+        ]
+        for back in (1, 2, 3):
+            previous = window[back] if window[back] is not None else np.nan
+            assert result[f"air_pollution_level_lag_{back}"] == pytest.approx(
+                previous, nan_ok=True
+            )
+        for size in (3, 5):
+            assert result[
+                f"air_pollution_level_rolling_{size}"
+            ] == pytest.approx(
+                np.mean([mean for mean in window[:size] if mean is not None])
+            )
+
+
+def test_yearly_grid_matches_grouped_rolling():
+    """Test lags and windows against pandas on the aggregated series."""
+    yearly = pd.DataFrame(
+        {
+            "Province": ["Madrid"] * 5 + ["Soria"] * 5,
+            "Year": list(range(2010, 2015)) * 2,
+            "mean": np.arange(10, dtype=float),
+        }
+    )
+    # Int year keys with several rows per series and year
+    rows = yearly.loc[np.repeat(yearly.index, 3)].reset_index(drop=True)
+    rows["Year"] = rows["Year"].astype("int16")
+
+    grid = YearlyGrid.from_rows(rows, ["Province"], "mean")
+
+    grouped = yearly.groupby("Province")["mean"]
+    np.testing.assert_allclose(
+        grid.lag(2), np.repeat(grouped.shift(2).to_numpy(), 3)
+    )
+    np.testing.assert_allclose(
+        grid.rolling_mean(3),
+        np.repeat(grouped.rolling(3, min_periods=1).mean().to_numpy(), 3),
+    )
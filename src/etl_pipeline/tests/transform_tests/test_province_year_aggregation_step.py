@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+from etl_pipeline.config.config_manager import get_config
+from etl_pipeline.transform import ProvinceYearAggregationStep
+
+
+@pytest.fixture
+def merged_df() -> pd.DataFrame:
+    """Station-level dataset repeating province-year values on each row."""
+    rng = np.random.default_rng(1)
+    n = 600
+    provinces = rng.choice(["Madrid", "Soria", "Teruel"], size=n)
+    years = rng.choice([2019, 2020, 2021], size=n)
+    pollutants = rng.choice(["no2", "o3", "pm2.5"], size=n)
+    levels = rng.uniform(0, 120, size=n)
+    levels[rng.random(n) < 0.05] = np.nan
+    # Soria has no o3 station in 2021
+    keep = ~((provinces == "Soria") & (years == 2021) & (pollutants == "o3"))
+    population = {"Madrid": 6_751_251, "Soria": 88_884, "Teruel": 134_176}
+    return pd.DataFrame(
+        {
+            "Province": pd.Categorical(provinces[keep]),
+            "Year": pd.to_datetime(years[keep].astype(str)),
+            "Air Pollutant": pd.Categorical(pollutants[keep]),
+            "Air Pollution Level": levels[keep],
+            "Population": [population[p] for p in provinces[keep]],
+            "pib": (years[keep] - 2000) * 1.5,
+        }
+    )
+
+
+def test_aggregation_matches_pivot_table(merged_df):
+    """Test the pivoted statistics against pandas pivot_table."""
+    step = ProvinceYearAggregationStep()
+    step.statistics = ["mean", "min", "p95", "max", "count"]
+    dataframes = {"output_df": merged_df}
+
+    step.execute(dataframes, {})
+
+    table = dataframes["province_year_df"]
+    assert len(table) == 9
+    assert list(table.columns[:4]) == ["province", "year", "pib", "population"]
+    assert "pm2.5_p95" in table.columns
+
+    grouped = merged_df.groupby(
+        ["Province", "Year", "Air Pollutant"], observed=False
+    )["Air Pollution Level"]
+    expected = {
+        "mean": grouped.mean(),
+        "min": grouped.min(),
+        "p95": grouped.quantile(0.95),
+        "max": grouped.max(),
+        "count": grouped.count(),
+    }
+    for statistic, values in expected.items():
+        wide = values.unstack("Air Pollutant")
+        for pollutant in ["no2", "o3", "pm2.5"]:
+            np.testing.assert_allclose(
+                table[f"{pollutant}_{statistic}"], wide[pollutant]
+            )
+
+    assert table["o3_count"].iloc[5] == 0
+    assert np.isnan(table["o3_mean"].iloc[5])
+    population = merged_df.groupby("Province", observed=True)[
+        "Population"
+    ].first()
+    assert table["population"].tolist() == np.repeat(population, 3).tolist()
+
+
+def test_output_df_unchanged(merged_df):
+    """Test that the station-level dataset is left as it was."""
+    original = merged_df.copy()
+
+    ProvinceYearAggregationStep().execute({"output_df": merged_df}, {})
+
+    pd.testing.assert_frame_equal(merged_df, original)
+
+
+def test_unsupported_statistic(monkeypatch):
+    """Test that unknown statistics are rejected at construction."""
+    monkeypatch.setitem(
+        get_config().config["province_year_aggregation"],
+        "statistics",
+        ["median"],
+    )
+
+    with pytest.raises(ValueError, match="Unsupported aggregation"):
+        ProvinceYearAggregationStep()
+
+
+def test_execute_missing_output_df():
+    """Test that the step requires the merged dataset."""
+    with pytest.raises(ValueError, match="output_df"):
+        ProvinceYearAggregationStep().execute({}, {})
+
+
+def test_excluded_regions_and_years_left_out(merged_df):
+    """Test that the cleaning step's region and timeframe filters apply."""
+    extra = pd.DataFrame(
+        {
+            "Province": ["Las Palmas", "Madrid", "Madrid"],
+            "Year": pd.to_datetime(["2020", "1995", "2022"]),
+            "Air Pollutant": ["no2"] * 3,
+            "Air Pollution Level": [500.0] * 3,
+            "Population": [1_128_539, 6_751_251, 6_751_251],
+            "pib": [20.0, 30.0, 30.0],
+        }
+    )
+    df = pd.concat([merged_df, extra], ignore_index=True)
+    dataframes = {"output_df": df}
+
+    ProvinceYearAggregationStep().execute(dataframes, {})
+
+    table = dataframes["province_year_df"]
+    assert "Las Palmas" not in table["province"].tolist()
+    assert table["year"].dt.year.between(2000, 2021).all()
+    assert table["no2_max"].max() < 500
+    assert len(df) == len(merged_df) + 3
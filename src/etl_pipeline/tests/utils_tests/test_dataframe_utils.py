@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from common.utils.dataframe_utils import (
+    join_dimension,
+    split_dimension,
+    to_year_keys,
+    year_keys_to_datetime,
+)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [2019, 2020, 2022],
+        ["2019", "2020", "2022"],
+        pd.to_datetime(["2019", "2020", "2022"]),
+    ],
+)
+def test_year_keys_round_trip(values):
+    """Test that year keys convert back to the dates parse_dates gives."""
+    years = pd.Series(values, name="Year")
+
+    keys = to_year_keys(years)
+
+    assert keys.dtype == "int16"
+    assert keys.tolist() == [2019, 2020, 2022]
+    pd.testing.assert_series_equal(
+        year_keys_to_datetime(keys),
+        pd.Series(pd.to_datetime(["2019", "2020", "2022"]), name="Year"),
+    )
+
+
+def test_to_year_keys_missing_year():
+    """Test that missing years raise ValueError."""
+    with pytest.raises(ValueError):
+        to_year_keys(pd.Series([2019.0, None], name="Year"))
+
+
+def test_split_and_join_dimension_round_trip():
+    """Test that a dimension split is undone by joining it back."""
+    df = pd.DataFrame(
+        {
+            "Air Pollution Level": [50.0, 45.0, 40.0, 12.5, 30.0],
+            "Station Type": ["traffic", "urban", "traffic", None, None],
+            "Longitude": [-3.7, -0.9, -3.7, float("nan"), float("nan")],
+            "Province": ["Madrid", "Zaragoza", "Madrid", "Soria", "Soria"],
+        },
+        index=[4, 2, 2, 0, 7],
+    )
+
+    fact, stations = split_dimension(
+        df, ["Station Type", "Longitude"], "station_id"
+    )
+
+    assert list(fact.columns) == [
+        "Air Pollution Level",
+        "station_id",
+        "Province",
+    ]
+    assert fact["station_id"].tolist() == [0, 1, 0, 2, 2]
+    assert len(stations) == 3
+    pd.testing.assert_frame_equal(
+        join_dimension(fact, stations, "station_id"), df
+    )
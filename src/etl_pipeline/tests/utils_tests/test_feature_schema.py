@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+
+from etl_pipeline.config.config_manager import get_config
+from etl_pipeline.config.feature_schema import (
+    FeatureSchema,
+    load_feature_schema,
+)
+
+FEATURE_TYPES = """
+preprocess:
+  var_dtypes:
+    Province: category
+    Air Pollution Level: {level_dtype}
+  categorical_features:
+    - name: Province
+      categories: ["Madrid", "Soria"]
+  numerical_features:
+    - Air Pollution Level
+  date_features: []
+"""
+
+
+def test_feature_schema_is_typed():
+    """Test that the shipped feature_types.yaml parses into the schema."""
+    schema = load_feature_schema()
+
+    assert isinstance(schema, FeatureSchema)
+    assert schema.var_dtypes["Air Pollution Level"] == "float64"
+    assert "no2" in schema.categories["Air Pollutant"]
+    assert schema.date_features == ("Year",)
+
+
+def test_feature_schema_is_memoized_and_shared():
+    """Test that the schema is parsed once and shared via ConfigManager."""
+    assert load_feature_schema() is load_feature_schema()
+    assert get_config().get_feature_schema() is load_feature_schema()
+
+
+def test_feature_schema_reloads_on_mtime_change(tmp_path: Path):
+    """Test that editing the file invalidates the cached schema."""
+    path = tmp_path / "feature_types.yaml"
+    path.write_text(FEATURE_TYPES.format(level_dtype="float64"))
+    first = load_feature_schema(path)
+
+    path.write_text(FEATURE_TYPES.format(level_dtype="float32"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_feature_schema(path)
+
+    assert first.var_dtypes["Air Pollution Level"] == "float64"
+    assert second.var_dtypes["Air Pollution Level"] == "float32"
+    assert second.categories == {"Province": ("Madrid", "Soria")}
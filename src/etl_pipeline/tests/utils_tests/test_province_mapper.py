@@ -268,3 +268,26 @@ def test_province_mapper_preserves_other_columns(
     # Verify only Province column changed
     assert original_df.loc[0, "Province"] == "Madrid"
     assert original_df.loc[1, "Province"] == "Barcelona"
+
+
+@patch.object(ProvinceMapper, "_load_json_file")
+def test_map_province_name_matches_replace(
+    _mock_load: MagicMock,
+    sample_province_mapping: Dict[str, List[str]],
+):
+    """Test that mapping distinct names matches replacing on every row."""
+    ProvinceMapper.unified_province_dict = sample_province_mapping
+    provinces = pd.Series(
+        ["28 Madrid", "Madrid", None, "Valencia", float("nan"), "Teruel"] * 3
+    )
+    df = pd.DataFrame({"Province": provinces})
+    aliases = {
+        alias: province
+        for province, names in sample_province_mapping.items()
+        for alias in names
+    }
+    expected = provinces.astype(str).replace(aliases).astype("category")
+
+    ProvinceMapper.map_province_name(df)
+
+    pd.testing.assert_series_equal(df["Province"], expected, check_names=False)
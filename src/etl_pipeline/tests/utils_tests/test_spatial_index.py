@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from common.utils.spatial_index import (
+    StationIndex,
+    chord_to_km,
+    unit_vectors,
+)
+
+
+@pytest.fixture
+def stations():
+    """Station coordinates scattered over the Iberian peninsula."""
+    rng = np.random.default_rng(0)
+    return rng.uniform(-9.5, 3.3, 400), rng.uniform(36.0, 43.8, 400)
+
+
+def _brute_force(stations, longitude, latitude):
+    """Nearest station and its distance by comparing every pair."""
+    distances = np.linalg.norm(
+        unit_vectors(longitude, latitude)[:, None]
+        - unit_vectors(*stations)[None],
+        axis=2,
+    )
+    return distances.argmin(axis=1), chord_to_km(distances.min(axis=1))
+
+
+@pytest.mark.parametrize("cell_km", [2.0, 10.0, 200.0])
+def test_nearest_matches_brute_force(stations, cell_km):
+    """Test near and far queries against a brute-force search."""
+    rng = np.random.default_rng(1)
+    pick = rng.integers(0, 400, 300)
+    longitude = np.concatenate(
+        [stations[0][pick] + rng.normal(0, 0.05, 300), [-30.0, 20.0]]
+    )
+    latitude = np.concatenate(
+        [stations[1][pick] + rng.normal(0, 0.05, 300), [60.0, -10.0]]
+    )
+
+    positions, distances = StationIndex(*stations, cell_km=cell_km).nearest(
+        longitude, latitude
+    )
+
+    expected_positions, expected_distances = _brute_force(
+        stations, longitude, latitude
+    )
+    np.testing.assert_array_equal(positions, expected_positions)
+    np.testing.assert_allclose(distances, expected_distances)
+
+
+def test_nearest_max_distance_and_missing_coordinates(stations):
+    """Test that far and unlocated queries have no nearest station."""
+    longitude = np.array([stations[0][0], np.nan, -3.7, 20.0])
+    latitude = np.array([stations[1][0], 40.4, np.nan, 60.0])
+
+    positions, distances = StationIndex(*stations).nearest(
+        longitude, latitude, max_distance_km=25
+    )
+
+    assert positions.tolist() == [0, -1, -1, -1]
+    assert distances[0] == pytest.approx(0.0, abs=1e-6)
+    assert np.isinf(distances[1:]).all()
+
+
+def test_invalid_stations():
+    """Test that stations without coordinates are rejected."""
+    with pytest.raises(ValueError, match="missing"):
+        StationIndex(np.array([-3.7, np.nan]), np.array([40.4, 41.0]))
+    with pytest.raises(ValueError, match="positive"):
+        StationIndex(np.array([-3.7]), np.array([40.4]), cell_km=0)
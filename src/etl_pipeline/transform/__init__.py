@@ -2,16 +2,40 @@
 Transform module - Contains all data transformation related classes.
 """
 
-from .data_transformation_step import DataTransformationStep
-from .data_merging_step import DataMergingStep
-from .feature_engineering_step import FeatureEngineeringStep
-from .data_cleaning_step import DataCleaningStep
-from .data_validation_step import DataValidationStep
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .data_transformation_step import DataTransformationStep
+    from .data_merging_step import DataMergingStep
+    from .province_year_aggregation_step import ProvinceYearAggregationStep
+    from .feature_engineering_step import FeatureEngineeringStep
+    from .data_cleaning_step import DataCleaningStep
+    from .data_validation_step import DataValidationStep
+
+# Classes are imported on first access, so importing the package (or one
+# of its steps) does not import every implementation and its dependencies.
+_MODULES = {
+    "DataTransformationStep": ".data_transformation_step",
+    "DataMergingStep": ".data_merging_step",
+    "ProvinceYearAggregationStep": ".province_year_aggregation_step",
+    "FeatureEngineeringStep": ".feature_engineering_step",
+    "DataCleaningStep": ".data_cleaning_step",
+    "DataValidationStep": ".data_validation_step",
+}
 
 __all__ = [
     "DataTransformationStep",
     "DataMergingStep",
+    "ProvinceYearAggregationStep",
     "FeatureEngineeringStep",
     "DataCleaningStep",
     "DataValidationStep",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested class from its module."""
+    if name in _MODULES:
+        return getattr(import_module(_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
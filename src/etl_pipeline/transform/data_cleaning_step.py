@@ -1,16 +1,69 @@
-from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 
-from common.utils.file_utils import load_yaml_config
 from etl_pipeline import ETLStep
+from etl_pipeline.config.feature_schema import (
+    FeatureSchema,
+    load_feature_schema,
+)
+
+
+def excluded_region_rows(
+    df: pd.DataFrame, processing_config: Dict[str, Any]
+) -> Optional[pd.Series]:
+    """
+    Rows of the regions listed in 'processing.excluded_regions'.
+
+    Args:
+        df (pd.DataFrame): Dataset with a 'Province' column.
+        processing_config (Dict[str, Any]): The 'processing' section.
+
+    Returns:
+        Optional[pd.Series]: Boolean mask, or None if no region is
+            excluded.
+    """
+    excluded_regions = processing_config.get("excluded_regions", [])
+    if not excluded_regions:
+        return None
+    return df["Province"].isin(excluded_regions)  # type: ignore
+
+
+def rows_outside_timeframe(
+    df: pd.DataFrame, processing_config: Dict[str, Any]
+) -> Optional[pd.Series]:
+    """
+    Rows whose year is outside 'processing.time_range'.
+
+    Args:
+        df (pd.DataFrame): Dataset with a datetime or integer 'Year'.
+        processing_config (Dict[str, Any]): The 'processing' section.
+
+    Returns:
+        Optional[pd.Series]: Boolean mask, or None if no time range is
+            configured.
+    """
+    time_range = processing_config.get("time_range", {})
+    start_year = time_range.get("start_year")
+    end_year = time_range.get("end_year")
+    if not start_year or not end_year:
+        return None
+    years = df["Year"]
+    if pd.api.types.is_datetime64_any_dtype(years):
+        years = years.dt.year  # type: ignore
+    return ~years.between(start_year, end_year)  # type: ignore
 
 
 class DataCleaningStep(ETLStep):
     """
     Clean and validate the dataset by applying several in-place
     preprocessing steps.
+
+    When the station metadata lives in the 'stations' dimension table
+    (see DataTransformationStep), the column-wise steps are applied to
+    that table instead of to every measurement, and null handling looks
+    up each row's station.
     """
 
     def __init__(self):
@@ -55,15 +108,20 @@ class DataCleaningStep(ETLStep):
             )
 
         df = dataframes["output_df"]
+        stations = dataframes.get("stations")
 
         self._remove_metadata_columns(df)
         self._remove_island_observations(df)
         self._filter_timeframe(df)
         self._convert_categories_to_lowercase(df)
-        self._handle_null_values(df)
+        self._handle_null_values(df, stations)
         self._handle_duplicated_rows(df)
         self._convert_to_appropriate_dtypes(df)
         self._standarize_colnames(df)
+        if stations is not None:
+            self._convert_categories_to_lowercase(stations)
+            self._convert_to_appropriate_dtypes(stations)
+            self._standarize_colnames(stations)
 
         self.log_success(f"Dataset cleaned: {len(df)} records")
 
@@ -108,19 +166,16 @@ class DataCleaningStep(ETLStep):
         Args:
             df (pd.DataFrame): DataFrame to filter.
         """
-        excluded_regions = self.processing_config.get("excluded_regions", [])
-
-        if not excluded_regions:
+        excluded = excluded_region_rows(df, self.processing_config)
+        if excluded is None:
             self.logger.warning(
                 "No excluded regions configured, skipping region filtering"
             )
             return
 
+        excluded_regions = self.processing_config["excluded_regions"]
         before = len(df)
-        df.drop(
-            df[df["Province"].isin(excluded_regions)].index,  # type: ignore
-            inplace=True,
-        )
+        df.drop(df[excluded].index, inplace=True)
         removed = before - len(df)
         self.logger.info(
             f"Removed {removed} records from excluded regions: "
@@ -134,52 +189,72 @@ class DataCleaningStep(ETLStep):
         Args:
             df (pd.DataFrame): DataFrame to filter.
         """
-        time_range = self.processing_config.get("time_range", {})
-        start_year = time_range.get("start_year")
-        end_year = time_range.get("end_year")
-
-        if not start_year or not end_year:
+        outside = rows_outside_timeframe(df, self.processing_config)
+        if outside is None:
             self.logger.warning(
                 "No time range configured, skipping timeframe filtering"
             )
             return
 
+        time_range = self.processing_config["time_range"]
+        start_year = time_range["start_year"]
+        end_year = time_range["end_year"]
         before = len(df)
-        if pd.api.types.is_datetime64_any_dtype(df["Year"]):
-            mask = df["Year"].dt.year.between(  # type: ignore
-                start_year, end_year
-            )  # type: ignore
-        else:
-            mask = df["Year"].between(start_year, end_year)  # type: ignore
-        df.drop(index=df[~mask].index, inplace=True)
+        df.drop(index=df[outside].index, inplace=True)
         removed = before - len(df)
         self.logger.info(
             f"Removed {removed} records outside {start_year}–{end_year} "
             f"timeframe"
         )
 
-    def _handle_null_values(self, df: pd.DataFrame) -> None:
+    def _handle_null_values(
+        self, df: pd.DataFrame, stations: Optional[pd.DataFrame] = None
+    ) -> None:
         """
         Remove rows with nulls if the percentage is below 5%. Otherwise,
         keep and log a warning.
 
         Args:
             df (pd.DataFrame): DataFrame to process.
+            stations (Optional[pd.DataFrame]): Station dimension table of
+                the rows' 'station_id'; a row is null in a station column
+                when its station is.
         """
         for col in df.columns:
-            null_pct = df[col].isnull().mean() * 100
-            if null_pct == 0:
-                self.logger.info(f"No nulls in '{col}'")
-            elif null_pct < 5:
-                self.logger.info(
-                    f"Removing rows with nulls in '{col}' ({null_pct:.2f}%)"
-                )
-                df.drop(index=df[df[col].isna()].index, inplace=True)
-            else:
-                self.logger.warning(
-                    f"Nulls >5% in '{col}' ({null_pct:.2f}%), "
-                    f"kept for imputation"
-                )
+            self._drop_null_rows(df, col, df[col].isna().to_numpy())
+
+        if stations is None:
+            return
+        for col in stations.columns:
+            station_nulls = stations[col].isna().to_numpy()
+            self._drop_null_rows(
+                df, col, station_nulls[df["station_id"].to_numpy()]
+            )
+
+    def _drop_null_rows(
+        self, df: pd.DataFrame, col: str, nulls: np.ndarray
+    ) -> None:
+        """
+        Drop the null rows of one column if they are below 5%.
+
+        Args:
+            df (pd.DataFrame): DataFrame to process.
+            col (str): Column name, for logging.
+            nulls (np.ndarray): Boolean null mask of the rows.
+        """
+        null_pct = nulls.mean() * 100 if len(nulls) else 0
+        if null_pct == 0:
+            self.logger.info(f"No nulls in '{col}'")
+        elif null_pct < 5:
+            self.logger.info(
+                f"Removing rows with nulls in '{col}' ({null_pct:.2f}%)"
+            )
+            df.drop(index=df.index[nulls], inplace=True)
+        else:
+            self.logger.warning(
+                f"Nulls >5% in '{col}' ({null_pct:.2f}%), "
+                f"kept for imputation"
+            )
 
     def _handle_duplicated_rows(self, df: pd.DataFrame) -> None:
         """
@@ -205,17 +280,20 @@ class DataCleaningStep(ETLStep):
         """
         # Type hint for static analysis
         assert isinstance(df, pd.DataFrame)
-        config_path = (
-            Path(__file__).parent.parent.parent
-            / "common"
-            / "feature_types.yaml"
-        )
-        feature_config = load_yaml_config(config_path)
-        dtypes = feature_config.get("preprocess", {}).get("var_dtypes", {})
-        for col, dtype in dtypes.items():
+        int_year_keys = self.processing_config.get("int_year_keys", False)
+        for col, dtype in self._feature_schema().var_dtypes.items():
+            if col == "Year" and int_year_keys:
+                # Year keys stay int16 until export
+                continue
             if col in df.columns:
                 df[col] = df[col].astype(dtype)  # type: ignore
 
+    def _feature_schema(self) -> FeatureSchema:
+        """Cached feature schema, shared through the config manager."""
+        if self.config:
+            return self.config.get_feature_schema()
+        return load_feature_schema()
+
     def _standarize_colnames(self, df: pd.DataFrame) -> None:
         """
         Standardize column names to lowercase and replace spaces with
@@ -0,0 +1,11 @@
+from .feature_registry import Feature, FeatureRegistry
+from .features import EXCEEDANCE_LIMITS, FEATURES
+from .yearly_grid import YearlyGrid
+
+__all__ = [
+    "EXCEEDANCE_LIMITS",
+    "FEATURES",
+    "Feature",
+    "FeatureRegistry",
+    "YearlyGrid",
+]
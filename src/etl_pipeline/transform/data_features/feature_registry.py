@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Feature:
+    """A derived column computed from declared input columns."""
+
+    name: str
+    inputs: Tuple[str, ...]
+    compute: Callable[[pd.DataFrame], Any]
+    description: str = ""
+
+
+class FeatureRegistry:
+    """
+    Named feature definitions of the FeatureEngineeringStep.
+
+    Every feature declares the columns it reads. An input that is the name
+    of another registered feature is a dependency: plan() adds it to the
+    requested features and orders every feature after its dependencies.
+    Feature functions receive the whole dataset, read only their inputs
+    and return one value per row, so no intermediate frames are built.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._features: Dict[str, Feature] = {}
+
+    def register(
+        self, name: str, inputs: Iterable[str], description: str = ""
+    ) -> Callable[[Callable[[pd.DataFrame], Any]], Callable]:
+        """
+        Decorator that registers a feature function.
+
+        Args:
+            name (str): Name of the column the feature creates.
+            inputs (Iterable[str]): Columns, or other features, it reads.
+            description (str): Short description of the feature.
+
+        Returns:
+            Callable: Decorator returning the function unchanged.
+        """
+
+        def decorator(
+            function: Callable[[pd.DataFrame], Any],
+        ) -> Callable[[pd.DataFrame], Any]:
+            self.add(Feature(name, tuple(inputs), function, description))
+            return function
+
+        return decorator
+
+    def add(self, feature: Feature) -> None:
+        """
+        Register a feature.
+
+        Args:
+            feature (Feature): Feature to register.
+
+        Raises:
+            ValueError: If a feature with the same name is registered.
+        """
+        if feature.name in self._features:
+            raise ValueError(f"Feature '{feature.name}' is already registered")
+        self._features[feature.name] = feature
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the registered features."""
+        return list(self._features)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._features
+
+    def __getitem__(self, name: str) -> Feature:
+        return self._features[name]
+
+    def plan(self, names: Iterable[str]) -> List[Feature]:
+        """
+        Resolve the requested features into an evaluation order.
+
+        Args:
+            names (Iterable[str]): Requested feature names.
+
+        Returns:
+            List[Feature]: The requested features and the features they
+                depend on, each after its dependencies.
+
+        Raises:
+            ValueError: If a feature is not registered or the dependencies
+                form a cycle.
+        """
+        ordered: List[Feature] = []
+        # 1: being resolved, 2: resolved
+        state: Dict[str, int] = {}
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                cycle = " -> ".join(path[path.index(name) :] + (name,))
+                raise ValueError(f"Feature dependency cycle: {cycle}")
+            state[name] = 1
+            feature = self._features[name]
+            for column in feature.inputs:
+                if column in self._features:
+                    visit(column, path + (name,))
+            state[name] = 2
+            ordered.append(feature)
+
+        for name in names:
+            if name not in self._features:
+                raise ValueError(
+                    f"Unknown feature '{name}'. Registered features: "
+                    f"{self.names}"
+                )
+            visit(name, ())
+        return ordered
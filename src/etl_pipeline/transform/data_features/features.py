@@ -0,0 +1,162 @@
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from etl_pipeline.utils.air_quality_rules import quality_thresholds
+
+from .feature_registry import FeatureRegistry
+from .yearly_grid import YearlyGrid
+
+FEATURES = FeatureRegistry()
+
+# A measurement exceeds the limit of its pollutant when its quality is
+# worse than 'RAZONABLEMENTE BUENA'
+EXCEEDANCE_LIMITS = {
+    pollutant: bins[2] for pollutant, bins in quality_thresholds.items()
+}
+
+# Lag and rolling window features of the yearly mean pollution levels
+LAG_YEARS = (1, 2, 3)
+ROLLING_WINDOWS = (3, 5)
+
+_STATION_KEYS = ["Province", "Air Pollutant"]
+
+
+def _group_codes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Dense integer group of every row, for the given key columns.
+
+    Missing keys form their own group.
+
+    Args:
+        df (pd.DataFrame): Dataset.
+        columns (List[str]): Key columns.
+
+    Returns:
+        np.ndarray: Codes from 0 to the number of groups - 1.
+    """
+    codes = np.zeros(len(df), dtype=np.int64)
+    for column in columns:
+        column_codes, uniques = pd.factorize(df[column])
+        codes = codes * (len(uniques) + 1) + column_codes + 1
+    return pd.factorize(codes)[0]
+
+
+@FEATURES.register(
+    "respiratory_deaths_per_100k",
+    inputs=("Respiratory_diseases_total", "Population"),
+    description="Respiratory deaths per 100,000 inhabitants",
+)
+def respiratory_deaths_per_100k(df: pd.DataFrame) -> pd.Series:
+    """Respiratory deaths per 100,000 inhabitants, rounded to 2 decimals."""
+    return round(
+        (df["Respiratory_diseases_total"] / df["Population"]) * 100000, 2
+    )
+
+
+@FEATURES.register(
+    "pib_ratio_to_year_mean",
+    inputs=("Province", "Year", "pib"),
+    description="GDP per capita over the mean of all provinces that year",
+)
+def pib_ratio_to_year_mean(df: pd.DataFrame) -> np.ndarray:
+    """
+    GDP per capita of the province over the mean of the provinces.
+
+    Every station row repeats the GDP of its province, so the yearly mean
+    is taken over one value per province and year.
+    """
+    pairs = _group_codes(df, ["Province", "Year"])
+    year_codes = pd.factorize(df["Year"])[0]
+    pib = df["pib"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    _, first_rows = np.unique(pairs, return_index=True)
+    pair_pib = pib[first_rows]
+    pair_years = year_codes[first_rows]
+    present = ~np.isnan(pair_pib)
+    n_years = year_codes.max() + 1 if len(year_codes) else 0
+    totals = np.bincount(
+        pair_years[present], weights=pair_pib[present], minlength=n_years
+    )
+    counts = np.bincount(pair_years[present], minlength=n_years)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        year_means = totals / counts
+    return pib / year_means[year_codes]
+
+
+@FEATURES.register(
+    "exceedances_per_province_year",
+    inputs=("Province", "Year", "Air Pollutant", "Air Pollution Level"),
+    description="Measurements above their pollutant limit, per "
+    "province and year",
+)
+def exceedances_per_province_year(df: pd.DataFrame) -> np.ndarray:
+    """
+    Number of measurements of the province and year above the limit of
+    their pollutant (EXCEEDANCE_LIMITS).
+    """
+    pollutant_codes, pollutants = pd.factorize(df["Air Pollutant"])
+    # The last entry is the limit of missing pollutants (code -1)
+    limits = np.array(
+        [EXCEEDANCE_LIMITS.get(str(p).lower(), np.inf) for p in pollutants]
+        + [np.inf]
+    )
+    levels = df["Air Pollution Level"].to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    with np.errstate(invalid="ignore"):
+        exceeded = levels > limits[pollutant_codes]
+
+    groups = _group_codes(df, ["Province", "Year"])
+    n_groups = groups.max() + 1 if len(groups) else 0
+    counts = np.bincount(groups[exceeded], minlength=n_groups)
+    return counts[groups].astype(np.int64)
+
+
+@FEATURES.register(
+    "air_pollution_level_yearly_mean",
+    inputs=("Province", "Air Pollutant", "Year", "Air Pollution Level"),
+    description="Mean level of the pollutant in the province that year",
+)
+def air_pollution_level_yearly_mean(df: pd.DataFrame) -> np.ndarray:
+    """Mean pollution level of the province, pollutant and year."""
+    grid = YearlyGrid.mean_of_rows(df, _STATION_KEYS, "Air Pollution Level")
+    return grid.broadcast(grid.values)
+
+
+def _yearly_grid(df: pd.DataFrame) -> YearlyGrid:
+    """Province and pollutant yearly means of the dataset."""
+    return YearlyGrid.from_rows(
+        df, _STATION_KEYS, "air_pollution_level_yearly_mean"
+    )
+
+
+def _register_window_features(
+    lag_years: Tuple[int, ...], windows: Tuple[int, ...]
+) -> None:
+    """
+    Register the lag and rolling features of the yearly mean levels.
+
+    They read the yearly means, one value per province, pollutant and
+    year, so the windows run on the aggregated series instead of the
+    station rows.
+    """
+    inputs = (*_STATION_KEYS, "Year", "air_pollution_level_yearly_mean")
+    for years in lag_years:
+        FEATURES.register(
+            f"air_pollution_level_lag_{years}",
+            inputs=inputs,
+            description=f"Yearly mean level of the pollutant {years} "
+            f"year(s) before",
+        )(lambda df, years=years: _yearly_grid(df).lag(years))
+    for window in windows:
+        FEATURES.register(
+            f"air_pollution_level_rolling_{window}",
+            inputs=inputs,
+            description=f"Mean of the yearly mean levels over the last "
+            f"{window} years",
+        )(lambda df, window=window: _yearly_grid(df).rolling_mean(window))
+
+
+_register_window_features(LAG_YEARS, ROLLING_WINDOWS)
@@ -0,0 +1,186 @@
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from common.utils.dataframe_utils import to_year_keys
+
+
+class YearlyGrid:
+    """
+    One value per series and calendar year, laid out as a dense 2-D grid.
+
+    A series is a combination of key columns (a province and pollutant).
+    Rows are mapped to an integer cell key, series * n_years + year
+    offset, so the rows of a station-level dataset scatter into the grid
+    and window results broadcast back to them with one fancy index.
+    Lags shift the grid along the year axis and rolling windows are
+    differences of cumulative sums, so their cost depends on the number
+    of series and years, not on the number of rows. Years without data
+    are NaN cells, which keeps lags and windows on calendar years.
+    """
+
+    def __init__(self, cells: np.ndarray, values: np.ndarray):
+        """
+        Initialize the grid.
+
+        Args:
+            cells (np.ndarray): Cell key of every row.
+            values (np.ndarray): Grid of shape (series, years).
+        """
+        self.cells = cells
+        self.values = values
+
+    @classmethod
+    def from_rows(
+        cls,
+        df: pd.DataFrame,
+        keys: List[str],
+        value_column: str,
+        year_column: str = "Year",
+    ) -> "YearlyGrid":
+        """
+        Build the grid from a column with one value per series and year.
+
+        Args:
+            df (pd.DataFrame): Dataset.
+            keys (List[str]): Columns identifying a series.
+            value_column (str): Column that is constant within each series
+                and year, such as a yearly mean broadcast to the rows.
+            year_column (str): Datetime or integer year column.
+
+        Returns:
+            YearlyGrid: Grid of the yearly values.
+        """
+        cells, shape = cls._cells(df, keys, year_column)
+        values = np.full(shape[0] * shape[1], np.nan)
+        values[cells] = df[value_column].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        return cls(cells, values.reshape(shape))
+
+    @classmethod
+    def mean_of_rows(
+        cls,
+        df: pd.DataFrame,
+        keys: List[str],
+        value_column: str,
+        year_column: str = "Year",
+    ) -> "YearlyGrid":
+        """
+        Build the grid of the yearly means of a row-level column.
+
+        Args:
+            df (pd.DataFrame): Dataset.
+            keys (List[str]): Columns identifying a series.
+            value_column (str): Column to average; NaN values are ignored.
+            year_column (str): Datetime or integer year column.
+
+        Returns:
+            YearlyGrid: Grid of the yearly means.
+        """
+        cells, shape = cls._cells(df, keys, year_column)
+        values = df[value_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        size = shape[0] * shape[1]
+        totals = np.bincount(
+            cells[present], weights=values[present], minlength=size
+        )
+        counts = np.bincount(cells[present], minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return cls(cells, (totals / counts).reshape(shape))
+
+    def lag(self, years: int) -> np.ndarray:
+        """
+        Value of the series a number of years before, for every row.
+
+        Args:
+            years (int): Years back; 0 is the row's own year.
+
+        Returns:
+            np.ndarray: Lagged values, NaN before the first year.
+        """
+        shifted = np.full_like(self.values, np.nan)
+        if years < self.values.shape[1]:
+            shifted[:, years:] = self.values[:, : self.values.shape[1] - years]
+        return self.broadcast(shifted)
+
+    def rolling_mean(self, window: int) -> np.ndarray:
+        """
+        Mean of the series over the row's year and the previous ones.
+
+        Args:
+            window (int): Number of calendar years in the window.
+
+        Returns:
+            np.ndarray: Means of the years with values in the window.
+        """
+        present = ~np.isnan(self.values)
+        totals = self._window_sums(np.where(present, self.values, 0.0), window)
+        counts = self._window_sums(present.astype(np.float64), window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.broadcast(totals / counts)
+
+    def broadcast(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Values of a grid for every row.
+
+        Args:
+            grid (np.ndarray): Grid with the shape of 'values'.
+
+        Returns:
+            np.ndarray: One value per row.
+        """
+        return grid.ravel()[self.cells]
+
+    @classmethod
+    def _cells(
+        cls, df: pd.DataFrame, keys: List[str], year_column: str
+    ) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """Cell key of every row, and the shape of the grid."""
+        series, n_series = cls._series_codes(df, keys)
+
+        # Each distinct year is converted once, not once per row
+        year_codes, year_uniques = pd.factorize(df[year_column])
+        unique_years = to_year_keys(pd.Series(year_uniques)).to_numpy()
+        years = unique_years.astype(np.int64)[year_codes]
+        first_year = int(years.min()) if len(years) else 0
+        n_years = int(years.max()) - first_year + 1 if len(years) else 0
+        return series * n_years + (years - first_year), (n_series, n_years)
+
+    @staticmethod
+    def _series_codes(
+        df: pd.DataFrame, keys: List[str]
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Series code of every row, and the number of codes.
+
+        Codes of the key columns are combined in mixed radix; categoricals
+        use their category codes, so no hashing is needed. The combined
+        codes are only compacted when they outgrow the number of rows.
+        """
+        series = np.zeros(len(df), dtype=np.int64)
+        n_series = 1
+        for column in keys:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                codes = values.cat.codes.to_numpy().astype(np.int64)
+                n_codes = len(values.cat.categories)
+            else:
+                codes, uniques = pd.factorize(values)
+                n_codes = len(uniques)
+            # Missing keys (code -1) are a series of their own
+            series = series * (n_codes + 1) + codes + 1
+            n_series *= n_codes + 1
+        if n_series > max(len(df), 1):
+            series, uniques = pd.factorize(series)
+            n_series = len(uniques)
+        return series, n_series
+
+    @staticmethod
+    def _window_sums(grid: np.ndarray, window: int) -> np.ndarray:
+        """Sums over the last 'window' years, from cumulative sums."""
+        cumulative = np.cumsum(grid, axis=1)
+        sums = cumulative.copy()
+        sums[:, window:] -= cumulative[:, :-window]
+        return sums
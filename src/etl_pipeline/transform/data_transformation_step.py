@@ -1,6 +1,7 @@
 from typing import Any, Dict
 import pandas as pd
 
+from common.utils.dataframe_utils import split_dimension
 from etl_pipeline.transform.data_transformers import (
     AirQualityDataTransformer,
     HealthDataTransformer,
@@ -8,6 +9,15 @@ from etl_pipeline.transform.data_transformers import (
 )
 from etl_pipeline import ETLStep
 
+# Station metadata repeated on every air quality measurement
+DEFAULT_STATION_COLUMNS = [
+    "Air Quality Station Type",
+    "Air Quality Station Area",
+    "Altitude",
+    "Longitude",
+    "Latitude",
+]
+
 
 class DataTransformationStep(ETLStep):
     """
@@ -15,6 +25,11 @@ class DataTransformationStep(ETLStep):
 
     This step delegates the transformation to specific transformer classes
     for air quality, health, and socioeconomic data.
+
+    With 'processing.air_quality.station_dimension.enabled', the station
+    metadata columns are moved from the air quality measurements to a
+    'stations' table with one row per station, referenced by an integer
+    'station_id' column. DataExportStep joins them back.
     """
 
     def __init__(self):
@@ -23,6 +38,24 @@ class DataTransformationStep(ETLStep):
         """
         super().__init__("Data Transformation")
 
+        # Try to load configuration, fall back to defaults if not available
+        try:
+            from etl_pipeline.config.config_manager import get_config
+
+            self.int_year_keys = get_config().get(
+                "processing.int_year_keys", False
+            )
+            self.province_imputation = get_config().get(
+                "processing.air_quality.province_imputation", {}
+            )
+            self.station_dimension = get_config().get(
+                "processing.air_quality.station_dimension", {}
+            )
+        except ImportError:
+            self.int_year_keys = False
+            self.province_imputation = {}
+            self.station_dimension = {}
+
     def execute(
         self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
     ) -> None:
@@ -38,9 +71,11 @@ class DataTransformationStep(ETLStep):
 
         # Air quality transformation
         self.logger.info("Transforming air quality data...")
-        (air_quality_df,) = AirQualityDataTransformer().transform(
-            dataframes["air_quality"]
-        )
+        (air_quality_df,) = AirQualityDataTransformer(
+            self.province_imputation
+        ).transform(dataframes["air_quality"])
+        if self.station_dimension.get("enabled", False):
+            air_quality_df = self._split_stations(air_quality_df, dataframes)
         dataframes["air_quality"] = air_quality_df
 
         # Health data transformation
@@ -56,10 +91,49 @@ class DataTransformationStep(ETLStep):
 
         # Socioeconomic data transformation
         self.logger.info("Transforming socioeconomic data...")
-        gdp_df, population_df = SocioeconomicDataTransformer().transform(
-            dataframes["gdp"], dataframes["province_population"]
-        )
+        gdp_df, population_df = SocioeconomicDataTransformer(
+            self.int_year_keys
+        ).transform(dataframes["gdp"], dataframes["province_population"])
         dataframes["gdp"] = gdp_df
         dataframes["province_population"] = population_df
 
         self.log_success(f"Transformed {len(dataframes)} datasets")
+
+    def _split_stations(
+        self,
+        air_quality_df: pd.DataFrame,
+        dataframes: Dict[str, pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Move the station metadata to the 'stations' dimension table.
+
+        Args:
+            air_quality_df (pd.DataFrame): Transformed air quality data.
+            dataframes (Dict[str, pd.DataFrame]): Receives 'stations'.
+
+        Returns:
+            pd.DataFrame: Measurements with a 'station_id' column instead
+                of the station metadata.
+        """
+        columns = [
+            col
+            for col in self.station_dimension.get(
+                "columns", DEFAULT_STATION_COLUMNS
+            )
+            if col in air_quality_df.columns
+        ]
+        if not columns:
+            self.logger.warning(
+                "No station columns found, keeping the measurements as is"
+            )
+            return air_quality_df
+
+        air_quality_df, dataframes["stations"] = split_dimension(
+            air_quality_df, columns, "station_id"
+        )
+        self.logger.info(
+            f"Moved {len(columns)} station columns of "
+            f"{len(air_quality_df):,} records to a table of "
+            f"{len(dataframes['stations']):,} stations"
+        )
+        return air_quality_df
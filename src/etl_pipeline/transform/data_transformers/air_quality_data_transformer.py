@@ -1,8 +1,10 @@
 import logging
-from typing import Any, Tuple
+from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from common.utils.spatial_index import StationIndex
 from etl_pipeline.utils.air_quality_rules import (
     quality_labels,
     quality_thresholds,
@@ -15,15 +17,22 @@ class AirQualityDataTransformer(BaseTransformer):
     """
     Applies transformations to air quality data:
     - Cleans invalid province values
+    - Optionally imputes missing provinces from the nearest station
     - Classifies air quality based on pollutant thresholds
     - Standardizes province names
     """
 
-    def __init__(self):
+    def __init__(self, province_imputation: Optional[Dict[str, Any]] = None):
         """
         Initialize the transformer and set up the logger.
+
+        Args:
+            province_imputation (Optional[Dict[str, Any]]): Settings of the
+                nearest-station province imputation: 'enabled',
+                'max_distance_km' and 'cell_km'. Disabled if None.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.province_imputation = province_imputation or {}
 
     def transform(self, *df: pd.DataFrame) -> Tuple[pd.DataFrame, ...]:
         """
@@ -45,11 +54,74 @@ class AirQualityDataTransformer(BaseTransformer):
             column="Province",
             invalid_values=["nan", "Desconocido", "Error"],
         )
+        if self.province_imputation.get("enabled", False):
+            self._impute_province_from_nearest_station(air_quality_df)
         self._classify_quality(air_quality_df)
         self._map_province_names(air_quality_df)
 
         return (air_quality_df,)
 
+    def _impute_province_from_nearest_station(
+        self, air_quality_df: pd.DataFrame
+    ) -> None:
+        """
+        Fill missing provinces with the province of the nearest station.
+
+        Stations are the distinct coordinates of the rows with a province,
+        indexed once in a StationIndex. Only the distinct coordinates of
+        the rows without a province are queried, and the provinces found
+        are broadcast back to the rows. Stations farther than
+        'max_distance_km' are not used, so rows far from every known
+        station keep a missing province.
+
+        Args:
+            air_quality_df (pd.DataFrame): Air quality data, updated in
+                place.
+        """
+        columns = ["Longitude", "Latitude"]
+        if not set(columns).issubset(air_quality_df.columns):
+            self.logger.warning(
+                "Station coordinates not available, skipping province "
+                "imputation"
+            )
+            return
+
+        coordinates = air_quality_df[columns].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        located = ~np.isnan(coordinates).any(axis=1)
+        missing = air_quality_df["Province"].isna().to_numpy()
+        known = ~missing & located
+        rows = np.flatnonzero(missing & located)
+        if not len(rows) or not known.any():
+            return
+
+        stations = air_quality_df.loc[known, columns + ["Province"]]
+        stations = stations.drop_duplicates(columns)
+        index = StationIndex.from_frame(
+            stations, cell_km=self.province_imputation.get("cell_km", 10.0)
+        )
+
+        # Rows of one station share their coordinates: query each once
+        query_codes, queries = pd.MultiIndex.from_arrays(
+            coordinates[rows].T
+        ).factorize()
+        positions, _ = index.nearest(
+            queries.get_level_values(0).to_numpy(),
+            queries.get_level_values(1).to_numpy(),
+            max_distance_km=self.province_imputation.get("max_distance_km"),
+        )
+        positions = positions[query_codes]
+        found = positions >= 0
+        air_quality_df.iloc[
+            rows[found], air_quality_df.columns.get_loc("Province")
+        ] = stations["Province"].to_numpy()[positions[found]]
+
+        self.logger.info(
+            f"Imputed the province of {int(found.sum()):,} of "
+            f"{int(missing.sum()):,} records from the nearest station"
+        )
+
     def _classify_quality(self, air_quality_df: pd.DataFrame) -> pd.DataFrame:
         """
         Assign air quality classification based on pollutant levels.
@@ -68,25 +140,13 @@ class AirQualityDataTransformer(BaseTransformer):
             "Air Pollutant"
         ].str.lower()
 
-        def get_quality(row: pd.Series) -> str:
-            pollutant = row["Air Pollutant"]
-            value = row["Air Pollution Level"]
-            if pollutant in quality_thresholds:
-                bins = quality_thresholds[pollutant]
-                label: Any = pd.cut(  # type: ignore
-                    [value], bins=bins, labels=quality_labels
-                )[0]
-                return str(label)
-            return "UNKNOWN"
-
-        air_quality_df["Quality"] = air_quality_df.apply(get_quality, axis=1)
-
+        air_quality_df["Quality"] = self._quality_labels(
+            air_quality_df["Air Pollutant"],
+            air_quality_df["Air Pollution Level"],
+        )
         air_quality_df["Air Pollutant"] = air_quality_df[
             "Air Pollutant"
         ].astype("category")
-        air_quality_df["Quality"] = air_quality_df["Quality"].astype(
-            "category"
-        )
 
         quality_counts = air_quality_df["Quality"].value_counts()
         self.logger.info(
@@ -103,3 +163,48 @@ class AirQualityDataTransformer(BaseTransformer):
             )
 
         return air_quality_df
+
+    @staticmethod
+    def _quality_labels(
+        pollutants: pd.Series, levels: pd.Series
+    ) -> pd.Categorical:
+        """
+        Quality label of every measurement, binned one pollutant at a time.
+
+        Levels are binned like pd.cut with right-closed intervals: a level
+        on a threshold is in the lower class, and missing levels or levels
+        outside the thresholds are labelled 'nan'. Pollutants without
+        thresholds are labelled 'UNKNOWN'.
+
+        Args:
+            pollutants (pd.Series): Lowercase pollutant names.
+            levels (pd.Series): Air pollution levels.
+
+        Returns:
+            pd.Categorical: Labels, with the sorted categories that
+                astype("category") gives.
+        """
+        names = np.array(quality_labels + ["nan", "UNKNOWN"], dtype=object)
+        out_of_range = len(quality_labels)
+        # Rows of pollutants without thresholds keep the 'UNKNOWN' code
+        codes = np.full(len(levels), len(names) - 1)
+        values = levels.to_numpy(dtype=np.float64, na_value=np.nan)
+        pollutant_codes, uniques = pd.factorize(pollutants)
+        for code, pollutant in enumerate(uniques):
+            if pollutant not in quality_thresholds:
+                continue
+            rows = pollutant_codes == code
+            bins = np.asarray(quality_thresholds[pollutant], dtype=np.float64)
+            # Class i holds the levels in (bins[i], bins[i + 1]]; NaN
+            # levels sort after every threshold
+            classes = np.searchsorted(bins, values[rows], side="left") - 1
+            classes[(classes < 0) | (classes >= out_of_range)] = out_of_range
+            codes[rows] = classes
+
+        present = np.unique(codes)
+        order = np.argsort(names[present])
+        remap = np.empty(len(names), dtype=np.int64)
+        remap[present[order]] = np.arange(len(present))
+        return pd.Categorical.from_codes(
+            remap[codes], categories=names[present][order]
+        )
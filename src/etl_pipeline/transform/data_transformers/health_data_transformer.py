@@ -2,8 +2,6 @@ from typing import Dict, Tuple
 
 import pandas as pd
 
-from common.utils.dataframe_utils import remove_commas_and_dots
-
 from .base_transformer import BaseTransformer
 
 
@@ -50,11 +48,6 @@ class HealthDataTransformer(BaseTransformer):
         respiratory_df.rename(
             columns=self._RESP_DIS_COLUMNS_MAPPER, inplace=True
         )
-        remove_commas_and_dots(
-            respiratory_df,
-            columns=["Respiratory_diseases_total"],
-            convert_to=float,
-        )
         self._map_province_names(respiratory_df)
 
         # Life expectancy
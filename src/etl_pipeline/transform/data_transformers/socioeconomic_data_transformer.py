@@ -1,9 +1,8 @@
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
-from common.utils.dataframe_utils import remove_dots
-
 from .base_transformer import BaseTransformer
 
 
@@ -14,9 +13,7 @@ class SocioeconomicDataTransformer(BaseTransformer):
     """
 
     _GDP_COLUMNS_MAPPER = {
-        "value": "pib",
         "Provincia": "Province",
-        "anio": "Year",
     }
 
     _POPULATION_COLUMNS_MAPPER = {
@@ -25,8 +22,16 @@ class SocioeconomicDataTransformer(BaseTransformer):
         "Provincias": "Province",
     }
 
-    def __init__(self):
+    def __init__(self, int_year_keys: bool = False):
+        """
+        Initialize SocioeconomicDataTransformer.
+
+        Args:
+            int_year_keys (bool): Whether 'Year' holds int16 year keys
+                instead of datetimes, as in the extracted population data.
+        """
         super().__init__(__name__)
+        self.int_year_keys = int_year_keys
 
     def transform(self, *df: pd.DataFrame) -> Tuple[pd.DataFrame, ...]:
         """
@@ -59,23 +64,45 @@ class SocioeconomicDataTransformer(BaseTransformer):
         """
         Transform GDP columns from wide to long format.
 
+        The wide table has one row per province and one column per year.
+        Province names are mapped on those rows and the year header is
+        parsed once; the long columns are then built with np.tile and
+        np.repeat, in the row order of DataFrame.melt.
+
         Args:
             gdp_df: GDP DataFrame in wide format
 
         Returns:
-            GDP DataFrame in long format with standardized columns.
+            GDP DataFrame in long format with a categorical 'Province', a
+            datetime (or int16 key) 'Year' and a float 'pib' column.
         """
         self.logger.info("Transforming GDP DataFrame from wide to long format")
 
-        gdp_df = gdp_df.melt(  # type: ignore
-            id_vars=["Provincia"], var_name="anio"
+        provinces = gdp_df[["Provincia"]].rename(
+            columns=self._GDP_COLUMNS_MAPPER
+        )
+        self._map_province_names(provinces)
+        province = provinces["Province"].array
+
+        year_columns = gdp_df.columns.drop("Provincia")
+        years = (
+            pd.Index(year_columns.astype(int), dtype="int16")
+            if self.int_year_keys
+            else pd.to_datetime(year_columns.astype(str), format="%Y")
+        )
+        values = gdp_df[year_columns].to_numpy(dtype=np.float64)
+
+        return pd.DataFrame(
+            {
+                "Province": pd.Categorical.from_codes(
+                    np.tile(province.codes, len(years)),
+                    dtype=province.dtype,
+                ),
+                "Year": np.repeat(years.to_numpy(), len(province)),
+                # Column-major order stacks one year after another
+                "pib": values.ravel(order="F"),
+            }
         )
-        gdp_df.rename(columns=self._GDP_COLUMNS_MAPPER, inplace=True)
-        gdp_df["Year"] = pd.to_datetime(gdp_df["Year"], format="%Y")
-        gdp_df["pib"] = gdp_df["pib"].astype(float)
-        self._map_province_names(gdp_df)
-
-        return gdp_df
 
     def _transform_population_columns(
         self, province_population_df: pd.DataFrame
@@ -94,9 +121,6 @@ class SocioeconomicDataTransformer(BaseTransformer):
         province_population_df.rename(
             columns=self._POPULATION_COLUMNS_MAPPER, inplace=True
         )
-        remove_dots(
-            province_population_df, columns=["Population"], convert_to=int
-        )
         self._map_province_names(province_population_df)
 
         return province_population_df
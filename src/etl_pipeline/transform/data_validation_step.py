@@ -1,12 +1,20 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 
-from common.utils.file_utils import load_yaml_config
 from etl_pipeline import ETLStep
+from etl_pipeline.config.feature_schema import (
+    FeatureSchema,
+    load_feature_schema,
+)
+from etl_pipeline.transform.data_validators import (
+    SampledDataValidator,
+    StreamingDataValidator,
+    ValidationRulePlan,
+)
 
 
 class DataValidationStep(ETLStep):
@@ -18,7 +26,7 @@ class DataValidationStep(ETLStep):
         super().__init__(__name__)
         # Try to load configuration, fall back to defaults if not available
         try:
-            from config.config_manager import get_config
+            from etl_pipeline.config.config_manager import get_config
 
             self.config = get_config()
             self.validation_config = self.config.get_validation_config()
@@ -31,6 +39,7 @@ class DataValidationStep(ETLStep):
             self.validation_config = {}
             self.processing_config = {}
             self.recovery_enabled = False  # Disable recovery if no config
+        self.rule_plan = ValidationRulePlan.from_config(self.validation_config)
 
     def execute(
         self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
@@ -38,20 +47,44 @@ class DataValidationStep(ETLStep):
         """
         Run comprehensive validations on 'output_df'.
 
+        context["validation_mode"] selects how the checks run:
+        - "full" (default): every check on the whole 'output_df'.
+        - "sample": cheap checks on the whole 'output_df', duplicate and
+          anomaly checks estimated on a stratified sample.
+        - "streaming": the Parquet dataset at context["validation_source"]
+          is validated row group by row group, without loading it.
+
+        When the station metadata is in the 'stations' dimension table,
+        'output_df' and 'stations' are checked separately and the station
+        column counts are weighted by the rows of each 'station_id', so
+        the results match those of the exported, joined dataset.
+
         Raises:
             ValueError: If 'output_df' missing or critical validations fail.
         """
         self.log_start()
-        if "output_df" not in dataframes:
-            raise ValueError(
-                "'output_df' is missing. Run feature engineering before "
-                "validation."
+        validation_mode = context.get("validation_mode", "full")
+        if validation_mode == "streaming":
+            validation_results = self._run_streaming_validation(
+                context.get("validation_source")
             )
+        else:
+            if "output_df" not in dataframes:
+                raise ValueError(
+                    "'output_df' is missing. Run feature engineering before "
+                    "validation."
+                )
 
-        df = dataframes["output_df"]
+            df = dataframes["output_df"]
+            stations = dataframes.get("stations")
 
-        # Run all validations
-        validation_results = self._run_comprehensive_validation(df)
+            # Run all validations
+            if validation_mode == "sample":
+                validation_results = self._run_sampled_validation(df, stations)
+            else:
+                validation_results = self._run_comprehensive_validation(
+                    df, stations
+                )
 
         # Store validation summary in context for potential use by
         # reporting step
@@ -78,30 +111,105 @@ class DataValidationStep(ETLStep):
         )
 
     def _run_comprehensive_validation(
-        self, df: pd.DataFrame
+        self, df: pd.DataFrame, stations: Optional[pd.DataFrame] = None
     ) -> Dict[str, Any]:
-        """Run comprehensive validation on the DataFrame."""
-        results: Dict[str, Any] = {
-            "df_name": "output_df",
-            "total_records": len(df),
-            "validation_timestamp": datetime.now(),
-            "passed": True,
-            "warnings": [],
-            "errors": [],
-        }
+        """
+        Run comprehensive validation on the DataFrame.
+
+        Args:
+            df: DataFrame to validate.
+            stations: Station dimension table of the rows' 'station_id',
+                validated as if it were joined to df.
+
+        Returns:
+            Dict[str, Any]: Validation results.
+        """
+        results = self._init_results("output_df", len(df))
 
         try:
             # Basic validations (keep existing behavior for compatibility)
             self._validate_not_empty(df, results)
-            self._validate_nulls(df, results)
-            self._validate_dtypes(df, results)
+            self._validate_nulls(df, results, stations)
+            self._validate_dtypes(df, results, stations)
             self._validate_duplicates(df, results)
 
             # Enhanced validations (only if config available)
             if self.config:
-                self._validate_required_columns(df, results)
-                self._validate_business_rules(df, results)
-                self._detect_statistical_anomalies(df, results)
+                self._validate_required_columns(df, results, stations)
+                self._validate_business_rules(df, results, stations)
+                self._detect_statistical_anomalies(df, results, stations)
+
+        except Exception as e:
+            results["passed"] = False
+            results["errors"].append(
+                f"Validation failed with exception: {str(e)}"
+            )
+            self.logger.error(f"Validation failed: {str(e)}")
+
+        return results
+
+    def _run_sampled_validation(
+        self, df: pd.DataFrame, stations: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the cheap checks exactly and estimate the expensive ones.
+
+        Nulls, dtypes, required columns and rule violations are computed on
+        the full DataFrame. Duplicates and statistical anomalies are
+        estimated from a stratified sample configured under
+        'validation.sampling'; the checks use the point estimates and the
+        confidence intervals are stored under results["estimates"].
+        Station columns are few distinct values, so their outliers are
+        counted exactly.
+
+        Args:
+            df: DataFrame to validate.
+            stations: Station dimension table of the rows' 'station_id',
+                validated as if it were joined to df.
+
+        Returns:
+            Dict[str, Any]: Validation results with sampling estimates.
+        """
+        results = self._init_results("output_df", len(df))
+        sampling_config = self.validation_config.get("sampling", {})
+
+        try:
+            self._validate_not_empty(df, results)
+            self._validate_nulls(df, results, stations)
+            self._validate_dtypes(df, results, stations)
+            if self.config:
+                self._validate_required_columns(df, results, stations)
+                self._validate_business_rules(df, results, stations)
+
+            estimates = SampledDataValidator(
+                fraction=sampling_config.get("fraction", 0.05),
+                min_rows_per_stratum=sampling_config.get(
+                    "min_rows_per_stratum", 20
+                ),
+                strata_columns=sampling_config.get("strata_columns"),
+                confidence=sampling_config.get("confidence", 0.95),
+                seed=sampling_config.get("seed", 42),
+            ).profile(df)
+            results["estimates"] = estimates
+
+            self._check_duplicates(
+                round(estimates["duplicate_rows"]["estimate"]), results
+            )
+            if self.config:
+                outlier_counts = {
+                    col: round(estimate["estimate"])
+                    for col, estimate in estimates["outliers"].items()
+                }
+                if stations is not None:
+                    outlier_counts.pop("station_id", None)
+                    outlier_counts.update(
+                        self._station_outlier_counts(
+                            stations, self._station_rows(df, stations)
+                        )
+                    )
+                self._check_statistical_anomalies(
+                    outlier_counts, len(df), results
+                )
 
         except Exception as e:
             results["passed"] = False
@@ -112,30 +220,129 @@ class DataValidationStep(ETLStep):
 
         return results
 
+    def _run_streaming_validation(
+        self, source: Optional[Union[str, Path]]
+    ) -> Dict[str, Any]:
+        """
+        Run the same validations over a Parquet dataset, one row group at
+        a time.
+
+        Args:
+            source: Path to the exported Parquet file or dataset directory.
+
+        Returns:
+            Dict[str, Any]: Validation results, plus approximate distinct
+                counts, the error bounds of the sketches used and the
+                columns whose outlier counts come from sketched quartiles
+                ('approximate_outliers').
+
+        Raises:
+            ValueError: If no source is given.
+        """
+        if not source:
+            raise ValueError(
+                "'validation_source' is missing in the context. Streaming "
+                "validation needs the path of an exported Parquet dataset."
+            )
+
+        streaming_config = self.validation_config.get("streaming", {})
+        profile = StreamingDataValidator(
+            rule_plan=self.rule_plan,
+            detect_outliers=bool(self.config),
+            exact_quantile_rows=streaming_config.get(
+                "exact_quantile_rows", 10_000_000
+            ),
+        ).profile(source)
+
+        total_records = profile["total_records"]
+        columns: List[str] = profile["columns"]
+        results = self._init_results(str(source), total_records)
+        results["distinct_counts"] = profile["distinct_counts"]
+        results["error_bounds"] = profile["error_bounds"]
+        results["approximate_outliers"] = profile["approximate_outliers"]
+
+        try:
+            self._check_not_empty(total_records, len(columns), results)
+            self._check_nulls(
+                sum(profile["null_counts"].values()),
+                total_records * len(columns),
+                results,
+            )
+            self._check_dtypes(profile["dtypes"], results)
+            self._check_duplicates(profile["duplicate_count"], results)
+
+            if self.config:
+                self._check_required_columns(columns, results)
+                self._check_business_rules(profile["rule_violations"], results)
+                self._check_statistical_anomalies(
+                    profile["outlier_counts"],
+                    total_records,
+                    results,
+                    approximate=profile["approximate_outliers"],
+                )
+
+        except Exception as e:
+            results["passed"] = False
+            results["errors"].append(
+                f"Validation failed with exception: {str(e)}"
+            )
+            self.logger.error(f"Validation failed: {str(e)}")
+
+        return results
+
+    def _init_results(
+        self, df_name: str, total_records: int
+    ) -> Dict[str, Any]:
+        """Create an empty validation results dictionary."""
+        return {
+            "df_name": df_name,
+            "total_records": total_records,
+            "validation_timestamp": datetime.now(),
+            "passed": True,
+            "warnings": [],
+            "errors": [],
+        }
+
     def _validate_not_empty(
         self, df: pd.DataFrame, results: Dict[str, Any]
     ) -> None:
         """Validate that DataFrame is not empty."""
-        if df.empty:
+        self._check_not_empty(len(df), len(df.columns), results)
+
+    def _check_not_empty(
+        self, row_count: int, column_count: int, results: Dict[str, Any]
+    ) -> None:
+        """Record an error if the dataset has no rows or no columns."""
+        if row_count == 0 or column_count == 0:
             results["passed"] = False
             results["errors"].append("DataFrame is empty")
-        elif len(df) == 0:
-            results["passed"] = False
-            results["errors"].append("DataFrame has no rows")
 
     def _validate_nulls(
-        self, df: pd.DataFrame, results: Dict[str, Any]
+        self,
+        df: pd.DataFrame,
+        results: Dict[str, Any],
+        stations: Optional[pd.DataFrame] = None,
     ) -> None:
         """Enhanced null validation with configurable thresholds."""
-        null_counts = df.isnull().sum()
-        total_nulls = null_counts.sum()
+        total_nulls = df.isnull().sum().sum()
+        column_count = len(df.columns)
+        if stations is not None:
+            # A row is null in a station column when its station is
+            station_rows = self._station_rows(df, stations)
+            total_nulls += (
+                stations.isnull().sum(axis=1).to_numpy() @ station_rows
+            )
+            column_count += len(stations.columns) - 1
+        self._check_nulls(total_nulls, len(df) * column_count, results)
 
+    def _check_nulls(
+        self, total_nulls: int, total_cells: int, results: Dict[str, Any]
+    ) -> None:
+        """Compare the null count against the configured threshold."""
         if total_nulls > 0:
             if self.config:
                 # Use configuration-based validation
-                null_percentage = (
-                    total_nulls / (len(df) * len(df.columns))
-                ) * 100
+                null_percentage = (total_nulls / total_cells) * 100
                 max_null_percent = self.processing_config.get(
                     "data_quality", {}
                 ).get("null_threshold_percent", 0.0)
@@ -159,23 +366,28 @@ class DataValidationStep(ETLStep):
             self.logger.info("No null values found")
 
     def _validate_dtypes(
-        self, df: pd.DataFrame, results: Dict[str, Any]
+        self,
+        df: pd.DataFrame,
+        results: Dict[str, Any],
+        stations: Optional[pd.DataFrame] = None,
     ) -> None:
         """Enhanced data type validation."""
+        actual_dtypes = df.dtypes.astype(str).to_dict()
+        if stations is not None:
+            del actual_dtypes["station_id"]
+            actual_dtypes.update(stations.dtypes.astype(str).to_dict())
+        self._check_dtypes(actual_dtypes, results)
+
+    def _check_dtypes(
+        self, actual_dtypes: Dict[str, str], results: Dict[str, Any]
+    ) -> None:
+        """Compare column dtypes against the feature_types.yaml schema."""
         try:
-            config_path = (
-                Path(__file__).parent.parent.parent
-                / "common"
-                / "feature_types.yaml"
-            )
-            feature_config = load_yaml_config(config_path)
-            expected_dtypes = feature_config.get("preprocess", {}).get(
-                "var_dtypes", {}
-            )
+            expected_dtypes = self._feature_schema().var_dtypes
 
             for col, expected_dtype in expected_dtypes.items():
-                if col in df.columns:
-                    actual_dtype = str(df[col].dtype)  # type: ignore
+                if col in actual_dtypes:
+                    actual_dtype = actual_dtypes[col]
                     if actual_dtype != expected_dtype:
                         if self.config:
                             results["warnings"].append(
@@ -195,12 +407,27 @@ class DataValidationStep(ETLStep):
         except Exception as e:
             results["warnings"].append(f"Could not validate data types: {e}")
 
+    def _feature_schema(self) -> FeatureSchema:
+        """Cached feature schema, shared through the config manager."""
+        if self.config:
+            return self.config.get_feature_schema()
+        return load_feature_schema()
+
     def _validate_duplicates(
         self, df: pd.DataFrame, results: Dict[str, Any]
     ) -> None:
-        """Enhanced duplicate validation with configuration support."""
-        duplicate_count = df.duplicated().sum()
+        """
+        Enhanced duplicate validation with configuration support.
 
+        A 'station_id' stands for one distinct combination of the station
+        columns, so duplicates are the same with or without the join.
+        """
+        self._check_duplicates(df.duplicated().sum(), results)
+
+    def _check_duplicates(
+        self, duplicate_count: int, results: Dict[str, Any]
+    ) -> None:
+        """Apply the configured duplicate policy to a duplicate count."""
         if duplicate_count > 0:
             if self.config:
                 allow_duplicates = self.processing_config.get(
@@ -224,14 +451,27 @@ class DataValidationStep(ETLStep):
             self.logger.info("No duplicated rows found")
 
     def _validate_required_columns(
-        self, df: pd.DataFrame, results: Dict[str, Any]
+        self,
+        df: pd.DataFrame,
+        results: Dict[str, Any],
+        stations: Optional[pd.DataFrame] = None,
     ) -> None:
         """Validate that required columns are present."""
+        columns = list(df.columns)
+        if stations is not None:
+            columns.remove("station_id")
+            columns.extend(stations.columns)
+        self._check_required_columns(columns, results)
+
+    def _check_required_columns(
+        self, columns: List[str], results: Dict[str, Any]
+    ) -> None:
+        """Record an error for every configured column that is missing."""
         required_columns = self.validation_config.get("required_columns", [])
         if not required_columns:
             return
 
-        missing_columns = set(required_columns) - set(df.columns)
+        missing_columns = set(required_columns) - set(columns)
         if missing_columns:
             results["passed"] = False
             results["errors"].append(
@@ -239,43 +479,51 @@ class DataValidationStep(ETLStep):
             )
 
     def _validate_business_rules(
-        self, df: pd.DataFrame, results: Dict[str, Any]
+        self,
+        df: pd.DataFrame,
+        results: Dict[str, Any],
+        stations: Optional[pd.DataFrame] = None,
     ) -> None:
-        """Validate business-specific rules."""
-        # Validate time range
-        if "Year" in df.columns:
-            time_range = self.processing_config.get("time_range", {})
-            start_year = time_range.get("start_year", 2000)
-            end_year = time_range.get("end_year", 2021)
-
-            invalid_years = df[  # type: ignore
-                (df["Year"].dt.year < start_year)
-                | (df["Year"].dt.year > end_year)
-            ]
-            if len(invalid_years) > 0:  # type: ignore
-                results["warnings"].append(
-                    (
-                        f"Found {len(invalid_years)} records "  # type: ignore
-                        f"with years outside valid range "
-                        f"({start_year}-{end_year})"
-                    )
+        """Validate the rules declared in the validation configuration."""
+        violation_counts = self.rule_plan.evaluate(df)
+        if stations is not None:
+            violation_counts.update(
+                self.rule_plan.evaluate(
+                    stations, weights=self._station_rows(df, stations)
                 )
+            )
+        self._check_business_rules(violation_counts, results)
 
-        # Validate air quality levels
-        if "Air Pollution Level" in df.columns:
-            negative_pollution = df[df["Air Pollution Level"] < 0]
-            if len(negative_pollution) > 0:
-                results["errors"].append(
-                    f"Found {len(negative_pollution)} records with "
-                    f"negative pollution levels"
-                )
+    def _check_business_rules(
+        self, violation_counts: Dict[str, int], results: Dict[str, Any]
+    ) -> None:
+        """Turn rule violation counts into warnings and errors."""
+        for rule in self.rule_plan.rules:
+            count = violation_counts.get(rule.name, 0)
+            if not count:
+                continue
+            if rule.severity == "warning":
+                results["warnings"].append(rule.describe(count))
+            else:
                 results["passed"] = False
+                results["errors"].append(rule.describe(count))
 
     def _detect_statistical_anomalies(
-        self, df: pd.DataFrame, results: Dict[str, Any]
+        self,
+        df: pd.DataFrame,
+        results: Dict[str, Any],
+        stations: Optional[pd.DataFrame] = None,
     ) -> None:
         """Detect statistical anomalies in numeric columns."""
         numeric_columns = df.select_dtypes(include=[np.number]).columns
+        outlier_counts: Dict[str, int] = {}
+        if stations is not None:
+            numeric_columns = numeric_columns.drop("station_id")
+            outlier_counts.update(
+                self._station_outlier_counts(
+                    stations, self._station_rows(df, stations)
+                )
+            )
 
         for column in numeric_columns:
             if df[column].isna().all():
@@ -296,14 +544,84 @@ class DataValidationStep(ETLStep):
             outliers = df[
                 (df[column] < lower_bound) | (df[column] > upper_bound)
             ]
-            outlier_count = len(outliers)
+            outlier_counts[column] = len(outliers)
 
+        self._check_statistical_anomalies(outlier_counts, len(df), results)
+
+    def _station_outlier_counts(
+        self, stations: pd.DataFrame, station_rows: np.ndarray
+    ) -> Dict[str, int]:
+        """
+        Count IQR outliers of the numeric station columns over the rows.
+
+        Quartiles interpolate linearly, as pandas does, in the values of
+        the stations repeated once per row that references them.
+
+        Args:
+            stations: Station dimension table.
+            station_rows: Number of rows referencing each station.
+
+        Returns:
+            Dict[str, int]: Outlier count per station column.
+        """
+        outlier_counts: Dict[str, int] = {}
+        for column in stations.select_dtypes(include=[np.number]).columns:
+            values = stations[column].to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            valid = ~np.isnan(values) & (station_rows > 0)
+            if not valid.any():
+                continue
+
+            order = np.argsort(values[valid], kind="stable")
+            x, w = values[valid][order], station_rows[valid][order]
+            ends = np.cumsum(w)
+            positions = np.array([0.25, 0.75]) * (ends[-1] - 1)
+            below = x[np.searchsorted(ends, np.floor(positions), "right")]
+            above = x[np.searchsorted(ends, np.ceil(positions), "right")]
+            Q1, Q3 = below + (above - below) * (positions % 1)
+            IQR = Q3 - Q1
+
+            if IQR == 0:  # Skip if no variation
+                continue
+
+            outside = (x < Q1 - 1.5 * IQR) | (x > Q3 + 1.5 * IQR)
+            outlier_counts[column] = int(w[outside].sum())
+        return outlier_counts
+
+    def _station_rows(
+        self, df: pd.DataFrame, stations: pd.DataFrame
+    ) -> np.ndarray:
+        """Number of rows of df referencing each station."""
+        return np.bincount(
+            df["station_id"].to_numpy(), minlength=len(stations)
+        )
+
+    def _check_statistical_anomalies(
+        self,
+        outlier_counts: Dict[str, int],
+        total_records: int,
+        results: Dict[str, Any],
+        approximate: Sequence[str] = (),
+    ) -> None:
+        """
+        Warn about columns with a significant share of outliers.
+
+        Counts of the columns in approximate, whose IQR fences come from
+        sketched quartiles, are flagged as approximate in the warning.
+        """
+        for column, outlier_count in outlier_counts.items():
             if outlier_count > 0:
-                outlier_percentage = (outlier_count / len(df)) * 100
+                outlier_percentage = (outlier_count / total_records) * 100
                 if (
                     outlier_percentage > 10
                 ):  # Only warn if significant outlier percentage
                     results["warnings"].append(
                         f"Column '{column}': {outlier_count} outliers "
                         f"detected ({outlier_percentage:.1f}%)"
+                        + (
+                            ", approximate: IQR from sketched quartiles"
+                            if column in approximate
+                            else ""
+                        )
                     )
@@ -0,0 +1,10 @@
+from .sampled_data_validator import SampledDataValidator
+from .streaming_data_validator import StreamingDataValidator
+from .validation_rule_plan import ValidationRule, ValidationRulePlan
+
+__all__ = [
+    "SampledDataValidator",
+    "StreamingDataValidator",
+    "ValidationRule",
+    "ValidationRulePlan",
+]
@@ -0,0 +1,231 @@
+import logging
+import math
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from common.utils.sketches import float_bit_keys, mix64
+
+from .validation_rule_plan import standardize_column_name
+
+
+class SampledDataValidator:
+    """
+    Estimates the expensive validation statistics from a stratified sample.
+
+    Rows are sampled within every stratum (by default province x
+    pollutant) with a per-stratum inclusion probability, raised for small
+    strata so small provinces and rare pollutants stay represented.
+    Every estimate is returned with a confidence interval:
+    - duplicate rows: Horvitz-Thompson estimate over groups of identical
+      rows, with a normal interval (Poisson bound when none is observed)
+    - IQR outliers: weighted outlier share with a normal interval using
+      the Kish effective sample size
+    """
+
+    def __init__(
+        self,
+        fraction: float = 0.05,
+        min_rows_per_stratum: int = 20,
+        strata_columns: Optional[List[str]] = None,
+        confidence: float = 0.95,
+        seed: int = 42,
+    ):
+        """
+        Initialize the validator.
+
+        Args:
+            fraction (float): Share of each stratum to sample.
+            min_rows_per_stratum (int): Lower bound of rows sampled per
+                stratum (capped at the stratum size).
+            strata_columns (Optional[List[str]]): Columns that define the
+                strata; matched with or without standardized names.
+            confidence (float): Confidence level of the intervals.
+            seed (int): Seed mixed into the row hash that drives sampling.
+
+        Raises:
+            ValueError: If fraction or confidence are not in (0, 1].
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError("fraction must be in (0, 1]")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be in (0, 1)")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.fraction = fraction
+        self.min_rows_per_stratum = min_rows_per_stratum
+        self.strata_columns = strata_columns or ["province", "air_pollutant"]
+        self.confidence = confidence
+        self.seed = seed
+
+    def profile(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Sample the DataFrame and estimate duplicates and outliers.
+
+        Args:
+            df (pd.DataFrame): Full dataset.
+
+        Returns:
+            Dict[str, Any]: Sample size, strata count, and estimates with
+                lower/upper bounds for duplicate rows and for the outlier
+                count of every numeric column.
+        """
+        stratum_ids = self._stratum_ids(df)
+        sizes = np.bincount(stratum_ids)
+        # Each row of stratum g is kept with probability p[g]. The coin is
+        # a hash of the row values, so identical rows are kept or dropped
+        # together and duplicates found in the sample scale up by 1 / p[g].
+        probabilities = np.minimum(
+            1.0,
+            np.maximum(
+                self.fraction,
+                self.min_rows_per_stratum / np.maximum(sizes, 1),
+            ),
+        )
+        row_probabilities = probabilities[stratum_ids]
+        rows = np.flatnonzero(self._row_coins(df) < row_probabilities)
+        sample = df.iloc[rows]
+
+        self.logger.info(
+            f"Sampled {len(sample)} of {len(df)} rows from "
+            f"{np.count_nonzero(sizes)} strata"
+        )
+        return {
+            "sample_size": len(sample),
+            "strata": int(np.count_nonzero(sizes)),
+            "confidence": self.confidence,
+            "duplicate_rows": self._estimate_duplicates(
+                sample,
+                stratum_ids[rows],
+                probabilities,
+                sizes > 0,
+            ),
+            "outliers": self._estimate_outliers(
+                sample, 1 / row_probabilities[rows], len(df)
+            ),
+        }
+
+    def _stratum_ids(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Integer stratum id per row, combining the factorized codes of the
+        strata columns. One stratum if no strata column exists.
+        """
+        columns = {standardize_column_name(c): c for c in df.columns}
+        stratum_ids = np.zeros(len(df), dtype=np.int64)
+        for key in map(standardize_column_name, self.strata_columns):
+            if key not in columns:
+                continue
+            codes, uniques = pd.factorize(
+                df[columns[key]], use_na_sentinel=False
+            )
+            stratum_ids = stratum_ids * len(uniques) + codes
+            if stratum_ids.max(initial=0) > len(df):
+                _, stratum_ids = np.unique(stratum_ids, return_inverse=True)
+        return stratum_ids
+
+    def _row_coins(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Pseudo-random number in [0, 1) per row, equal for identical rows.
+
+        Identical rows agree on every column, so only the numeric columns
+        are mixed (bit patterns through a splitmix64 finalizer), which is
+        much cheaper than hashing whole rows. Without numeric columns the
+        full row hash is used.
+        """
+        numeric = df.select_dtypes(include=[np.number])
+        if numeric.shape[1] == 0:
+            keys = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        else:
+            keys = np.full(len(df), self.seed, dtype=np.uint64)
+            for column in numeric.columns:
+                values = numeric[column].to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+                keys = mix64(keys ^ float_bit_keys(values))
+        keys = mix64(keys ^ np.uint64(self.seed))
+        return (keys >> np.uint64(11)).astype(np.float64) * 2.0**-53
+
+    def _estimate_duplicates(
+        self,
+        sample: pd.DataFrame,
+        sample_strata: np.ndarray,
+        probabilities: np.ndarray,
+        non_empty: np.ndarray,
+    ) -> Dict[str, float]:
+        """
+        Estimate the number of duplicate rows in the full dataset.
+
+        Every group of c identical rows contributes c - 1 duplicates and
+        is sampled whole with the probability p of its stratum, so each
+        observed group is weighted by 1 / p (Horvitz-Thompson).
+        """
+        hashes = pd.util.hash_pandas_object(sample, index=False).to_numpy()
+        value_counts = pd.DataFrame(
+            {"stratum": sample_strata, "hash": hashes}
+        ).value_counts()
+        extra = value_counts.to_numpy() - 1
+        strata = value_counts.index.get_level_values("stratum").to_numpy()
+        inclusion = probabilities[strata]
+        estimate = float(np.sum(extra / inclusion))
+        observed = float(extra.sum())
+
+        if observed:
+            variance = np.sum(extra**2 * (1 - inclusion) / inclusion**2)
+            spread = self._z * math.sqrt(float(variance))
+            lower = max(observed, estimate - spread)
+            upper = estimate + spread
+        else:
+            # Poisson bound for zero observed duplicate groups
+            min_inclusion = float(probabilities[non_empty].min(initial=1.0))
+            lower = 0.0
+            upper = -math.log(1 - self.confidence) / min_inclusion
+        return {"estimate": estimate, "lower": lower, "upper": upper}
+
+    def _estimate_outliers(
+        self, sample: pd.DataFrame, weights: np.ndarray, total: int
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Estimate IQR outlier counts per numeric column from the sample.
+
+        Quartiles are weighted by the inverse inclusion probability of
+        each sampled row.
+        """
+        estimates: Dict[str, Dict[str, float]] = {}
+        for column in sample.select_dtypes(include=[np.number]).columns:
+            values = sample[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = ~np.isnan(values)
+            if not valid.any():
+                continue
+            x, w = values[valid], weights[valid]
+            q1, q3 = self._weighted_quantiles(x, w, [0.25, 0.75])
+            iqr = q3 - q1
+            if iqr == 0:
+                continue
+
+            outside = (x < q1 - 1.5 * iqr) | (x > q3 + 1.5 * iqr)
+            share = float(np.sum(w[outside]) / np.sum(w))
+            effective_n = np.sum(w) ** 2 / np.sum(w**2)
+            spread = self._z * math.sqrt(share * (1 - share) / effective_n)
+            estimates[column] = {
+                "estimate": share * total,
+                "lower": max(0.0, share - spread) * total,
+                "upper": min(1.0, share + spread) * total,
+            }
+        return estimates
+
+    def _weighted_quantiles(
+        self, values: np.ndarray, weights: np.ndarray, qs: List[float]
+    ) -> List[float]:
+        """Quantiles of values where each value counts ``weight`` times."""
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        positions = np.searchsorted(
+            cumulative, np.asarray(qs) * cumulative[-1], side="left"
+        )
+        return list(values[order][np.minimum(positions, len(values) - 1)])
+
+    @property
+    def _z(self) -> float:
+        """Two-sided normal quantile for the confidence level."""
+        return NormalDist().inv_cdf(0.5 + self.confidence / 2)
@@ -0,0 +1,303 @@
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from common.utils.sketches import HyperLogLog, KLLSketch
+
+from .validation_rule_plan import ValidationRulePlan
+
+
+class StreamingDataValidator:
+    """
+    Profiles an exported Parquet dataset one record batch at a time.
+
+    The files are scanned as a pyarrow dataset with Hive partitioning, so
+    the partition keys of a 'year=/province=' layout are columns of every
+    batch. Batches are no larger than a row group, and only one is held
+    in memory at once. Everything the
+    validation step needs is kept in mergeable accumulators:
+    - exact null counts and rule-violation counts per column
+    - row hashes for exact duplicate detection (8 bytes per row)
+    - KLL quantile sketches for the IQR anomaly check
+    - HyperLogLog sketches for distinct counts
+
+    The IQR check matches the in-memory validation: with outlier
+    detection on, a numeric column with at most 'exact_quantile_rows'
+    values is read back on its own, and its
+    exact quartiles and outliers are computed from those values. Larger
+    columns use the sketched quartiles and a second pass, and are listed
+    under 'approximate_outliers'.
+    """
+
+    def __init__(
+        self,
+        rule_plan: Optional[ValidationRulePlan] = None,
+        detect_outliers: bool = True,
+        quantile_k: int = 200,
+        hll_precision: int = 14,
+        exact_quantile_rows: int = 10_000_000,
+    ):
+        """
+        Initialize the validator.
+
+        Args:
+            rule_plan (Optional[ValidationRulePlan]): Compiled rules
+                evaluated on every batch.
+            detect_outliers (bool): Whether to run the second pass that
+                counts IQR outliers.
+            quantile_k (int): Accuracy parameter of the KLL sketches.
+            hll_precision (int): Precision of the HyperLogLog sketches.
+            exact_quantile_rows (int): Largest number of values of a
+                column loaded at once for exact quartiles (8 bytes each).
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.rule_plan = rule_plan or ValidationRulePlan([])
+        self.detect_outliers = detect_outliers
+        self.quantile_k = quantile_k
+        self.hll_precision = hll_precision
+        self.exact_quantile_rows = exact_quantile_rows
+
+    def profile(self, source: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Build the validation profile of a Parquet file or directory.
+
+        Args:
+            source (Union[str, Path]): Parquet file, or directory that is
+                searched recursively for Parquet files.
+
+        Returns:
+            Dict[str, Any]: Row and column counts, dtypes, null counts,
+                duplicate count, rule violations, quartiles, outlier
+                counts, the columns whose outliers are approximate,
+                distinct counts and the sketch error bounds.
+
+        Raises:
+            FileNotFoundError: If the source contains no Parquet files.
+        """
+        dataset = self._dataset(Path(source))
+
+        total_records = 0
+        batches = 0
+        dtypes: Dict[str, str] = {}
+        null_counts: Dict[str, int] = {}
+        rule_violations: Dict[str, int] = {}
+        quantile_sketches: Dict[str, KLLSketch] = {}
+        distinct_sketches: Dict[str, HyperLogLog] = {}
+        row_hashes: List[np.ndarray] = []
+
+        for chunk in self._iter_batches(dataset):
+            batches += 1
+            total_records += len(chunk)
+            if not dtypes:
+                dtypes = chunk.dtypes.astype(str).to_dict()
+
+            for col, count in chunk.isnull().sum().items():
+                null_counts[col] = null_counts.get(col, 0) + int(count)
+
+            row_hashes.append(
+                pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+            )
+
+            for rule, count in self.rule_plan.evaluate(chunk).items():
+                rule_violations[rule] = rule_violations.get(rule, 0) + count
+
+            for col in chunk.select_dtypes(include=[np.number]).columns:
+                quantile_sketches.setdefault(
+                    col, KLLSketch(self.quantile_k)
+                ).update(chunk[col])
+
+            for col in chunk.columns:
+                distinct_sketches.setdefault(
+                    col, HyperLogLog(self.hll_precision)
+                ).update(chunk[col])
+
+        hashes = (
+            np.concatenate(row_hashes)
+            if row_hashes
+            else np.empty(0, dtype=np.uint64)
+        )
+        duplicate_count = int(len(hashes) - len(np.unique(hashes)))
+
+        quartiles: Dict[str, Dict[str, float]] = {}
+        outlier_counts: Dict[str, int] = {}
+        sketched: Dict[str, Dict[str, float]] = {}
+        for col, sketch in quantile_sketches.items():
+            if not sketch.count:
+                continue
+            if (
+                self.detect_outliers
+                and sketch.count <= self.exact_quantile_rows
+            ):
+                quartiles[col], count = self._exact_outliers(dataset, col)
+                if count is not None:
+                    outlier_counts[col] = count
+            else:
+                quartiles[col] = sketched[col] = dict(
+                    zip(("q1", "q3"), sketch.quantiles([0.25, 0.75]))
+                )
+        if self.detect_outliers:
+            outlier_counts.update(self._count_outliers(dataset, sketched))
+
+        self.logger.info(
+            f"Profiled {total_records} records from {batches} batch(es) "
+            f"in {len(dataset.files)} file(s)"
+        )
+        return {
+            "total_records": total_records,
+            "columns": list(dtypes),
+            "dtypes": dtypes,
+            "null_counts": null_counts,
+            "duplicate_count": duplicate_count,
+            "rule_violations": rule_violations,
+            "quartiles": quartiles,
+            "outlier_counts": outlier_counts,
+            "approximate_outliers": sorted(
+                col for col in sketched if col in outlier_counts
+            ),
+            "distinct_counts": {
+                col: int(round(sketch.estimate()))
+                for col, sketch in distinct_sketches.items()
+            },
+            "error_bounds": {
+                "quantile_rank_error": KLLSketch(self.quantile_k).rank_error,
+                "distinct_relative_error": HyperLogLog(
+                    self.hll_precision
+                ).relative_error,
+            },
+        }
+
+    def _exact_outliers(
+        self, dataset: Any, col: str
+    ) -> Tuple[Dict[str, float], Optional[int]]:
+        """
+        Exact quartiles and IQR outlier count of one column.
+
+        Only the column is read, and its values are kept as one float64
+        array. Quartiles interpolate linearly, as pandas does.
+
+        Args:
+            dataset (pyarrow.dataset.Dataset): Dataset to scan.
+            col (str): Numeric column.
+
+        Returns:
+            Tuple[Dict[str, float], Optional[int]]: Q1/Q3, and the number
+                of values outside the IQR fences, None if the IQR is 0.
+        """
+        values = np.concatenate(
+            [
+                chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                for chunk in self._iter_batches(dataset, columns=[col])
+            ]
+        )
+        values = values[~np.isnan(values)]
+        q1, q3 = np.quantile(values, [0.25, 0.75])
+        iqr = q3 - q1
+        count = (
+            int(
+                np.count_nonzero(
+                    (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+                )
+            )
+            if iqr != 0
+            else None
+        )
+        return {"q1": float(q1), "q3": float(q3)}, count
+
+    def _count_outliers(
+        self, dataset: Any, quartiles: Dict[str, Dict[str, float]]
+    ) -> Dict[str, int]:
+        """
+        Second pass: count values outside the IQR fences per column.
+
+        Args:
+            dataset (pyarrow.dataset.Dataset): Dataset to scan.
+            quartiles (Dict[str, Dict[str, float]]): Sketched Q1/Q3 per
+                numeric column.
+
+        Returns:
+            Dict[str, int]: Outlier count per column with non-zero IQR.
+        """
+        fences: Dict[str, Tuple[float, float]] = {}
+        for col, q in quartiles.items():
+            iqr = q["q3"] - q["q1"]
+            if iqr != 0:
+                fences[col] = (q["q1"] - 1.5 * iqr, q["q3"] + 1.5 * iqr)
+
+        outlier_counts = {col: 0 for col in fences}
+        if not fences:
+            return outlier_counts
+
+        for chunk in self._iter_batches(dataset, columns=list(fences)):
+            for col, (lower, upper) in fences.items():
+                values = chunk[col]
+                outlier_counts[col] += int(
+                    ((values < lower) | (values > upper)).sum()
+                )
+        return outlier_counts
+
+    def _iter_batches(
+        self, dataset: Any, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield each record batch of the dataset as a DataFrame.
+
+        Args:
+            dataset (pyarrow.dataset.Dataset): Dataset to scan.
+            columns (Optional[List[str]]): Subset of columns to read;
+                partition keys can be selected like file columns.
+
+        Yields:
+            pd.DataFrame: One batch at a time.
+        """
+        for batch in dataset.to_batches(columns=columns):
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def _dataset(self, source: Path) -> Any:
+        """
+        Open the Parquet files of the source as one dataset.
+
+        Directories use Hive partitioning, relative to the source, so
+        'key=value' directories become columns.
+
+        Args:
+            source (Path): File or directory.
+
+        Returns:
+            pyarrow.dataset.Dataset: Dataset over the Parquet files.
+
+        Raises:
+            FileNotFoundError: If no Parquet file is found.
+        """
+        import pyarrow.dataset as ds
+
+        files = self._parquet_files(source)
+        return ds.dataset(
+            [str(file) for file in files],
+            format="parquet",
+            partitioning="hive" if source.is_dir() else None,
+            partition_base_dir=str(source) if source.is_dir() else None,
+        )
+
+    def _parquet_files(self, source: Path) -> List[Path]:
+        """
+        Resolve the Parquet files that make up a dataset.
+
+        Args:
+            source (Path): File or directory.
+
+        Returns:
+            List[Path]: Parquet files, sorted for deterministic order.
+
+        Raises:
+            FileNotFoundError: If no Parquet file is found.
+        """
+        files = (
+            sorted(source.rglob("*.parquet")) if source.is_dir() else [source]
+        )
+        if not files or not files[0].is_file():
+            raise FileNotFoundError(f"No Parquet data found at: {source}")
+        return files
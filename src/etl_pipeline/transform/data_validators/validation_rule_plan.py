@@ -0,0 +1,256 @@
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_DTYPE_CHECKS = {
+    "numeric": pd.api.types.is_numeric_dtype,
+    "categorical": lambda s: (
+        isinstance(s.dtype, pd.CategoricalDtype)
+        or pd.api.types.is_object_dtype(s)
+        or pd.api.types.is_string_dtype(s)
+    ),
+    "datetime": lambda s: (
+        pd.api.types.is_datetime64_any_dtype(s)
+        or pd.api.types.is_integer_dtype(s)
+    ),
+}
+
+
+def standardize_column_name(column: str) -> str:
+    """Lowercase a column name and replace spaces with underscores."""
+    return column.lower().replace(" ", "_")
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """A single declarative validation rule bound to one column."""
+
+    kind: str
+    column: str
+    severity: str = "error"
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    allowed_values: FrozenSet[str] = frozenset()
+    dtype_kind: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """Unique name of the rule, used as key of the violation counts."""
+        return f"{self.kind}:{self.column}"
+
+    def describe(self, count: int) -> str:
+        """
+        Build the human readable message for a number of violations.
+
+        Args:
+            count (int): Number of violating values.
+
+        Returns:
+            str: Message reported as warning or error.
+        """
+        if self.kind == "range":
+            return (
+                f"Found {count} records with '{self.column}' outside valid "
+                f"range ({self.min_value}-{self.max_value})"
+            )
+        if self.kind == "membership":
+            return (
+                f"Found {count} records with '{self.column}' values not in "
+                f"{sorted(self.allowed_values)}"
+            )
+        if self.kind == "dtype":
+            return (
+                f"Column '{self.column}' has a non-{self.dtype_kind} dtype "
+                f"instead of {self.dtype_kind} ({count} values)"
+            )
+        return f"Found {count} null values in column '{self.column}'"
+
+
+class ValidationRulePlan:
+    """
+    Validation rules compiled from the 'validation' configuration section.
+
+    Rules are grouped by column so every column is read once and all of its
+    rules are evaluated with vectorized NumPy reductions. Evaluation only
+    counts violations; no filtered DataFrames are built.
+
+    Supported configuration keys:
+    - ranges: {column: {min, max, severity}}
+    - allowed_values: {column: [values]}
+    - data_types: {numeric_columns, categorical_columns, datetime_columns}
+    - non_null_columns: [columns]
+    """
+
+    def __init__(self, rules: Iterable[ValidationRule]):
+        """
+        Initialize the plan.
+
+        Args:
+            rules (Iterable[ValidationRule]): Rules to evaluate.
+        """
+        self.rules: List[ValidationRule] = list(rules)
+        self._rules_by_column: Dict[str, List[ValidationRule]] = {}
+        for rule in self.rules:
+            self._rules_by_column.setdefault(
+                standardize_column_name(rule.column), []
+            ).append(rule)
+
+    @classmethod
+    def from_config(
+        cls, validation_config: Dict[str, Any]
+    ) -> "ValidationRulePlan":
+        """
+        Compile the rules declared in the validation configuration.
+
+        Args:
+            validation_config (Dict[str, Any]): 'validation' section of
+                pipeline_config.yaml.
+
+        Returns:
+            ValidationRulePlan: Compiled plan.
+        """
+        rules: List[ValidationRule] = []
+
+        for column, bounds in validation_config.get("ranges", {}).items():
+            rules.append(
+                ValidationRule(
+                    kind="range",
+                    column=column,
+                    severity=bounds.get("severity", "error"),
+                    min_value=bounds.get("min"),
+                    max_value=bounds.get("max"),
+                )
+            )
+
+        allowed = validation_config.get("allowed_values", {})
+        for column, values in allowed.items():
+            rules.append(
+                ValidationRule(
+                    kind="membership",
+                    column=column,
+                    allowed_values=frozenset(str(v) for v in values),
+                )
+            )
+
+        data_types = validation_config.get("data_types", {})
+        for dtype_kind in _DTYPE_CHECKS:
+            for column in data_types.get(f"{dtype_kind}_columns", []):
+                rules.append(
+                    ValidationRule(
+                        kind="dtype",
+                        column=column,
+                        severity="warning",
+                        dtype_kind=dtype_kind,
+                    )
+                )
+
+        for column in validation_config.get("non_null_columns", []):
+            rules.append(ValidationRule(kind="non_null", column=column))
+
+        return cls(rules)
+
+    def evaluate(
+        self, df: pd.DataFrame, weights: Optional[np.ndarray] = None
+    ) -> Dict[str, int]:
+        """
+        Count the violations of every rule whose column exists in df.
+
+        Column names are matched exactly or after standardization, so the
+        same plan applies before and after column names are cleaned.
+
+        Args:
+            df (pd.DataFrame): Data to check.
+            weights (Optional[np.ndarray]): Number of records each row of
+                df stands for, e.g. the rows referencing each row of a
+                dimension table. Every row counts once if not given.
+
+        Returns:
+            Dict[str, int]: Violation count per rule name.
+        """
+        columns = {standardize_column_name(col): col for col in df.columns}
+        counts: Dict[str, int] = {}
+        for key, rules in self._rules_by_column.items():
+            column = columns.get(key)
+            if column is None:
+                continue
+            series = df[column]
+            numeric_values: Optional[np.ndarray] = None
+            for rule in rules:
+                if rule.kind == "range":
+                    if numeric_values is None:
+                        numeric_values = self._numeric_values(series)
+                    counts[rule.name] = self._count_out_of_range(
+                        rule, numeric_values, weights
+                    )
+                elif rule.kind == "membership":
+                    counts[rule.name] = self._count_not_allowed(
+                        rule, series, weights
+                    )
+                elif rule.kind == "dtype":
+                    conforms = _DTYPE_CHECKS[rule.dtype_kind](series)
+                    counts[rule.name] = (
+                        0
+                        if conforms
+                        else self._count(series.notna().to_numpy(), weights)
+                    )
+                else:
+                    counts[rule.name] = self._count(
+                        series.isna().to_numpy(), weights
+                    )
+        return counts
+
+    @staticmethod
+    def _count(mask: np.ndarray, weights: Optional[np.ndarray]) -> int:
+        """Count the rows in mask, each weighted if weights are given."""
+        if weights is None:
+            return int(np.count_nonzero(mask))
+        return int(weights[mask].sum())
+
+    def _numeric_values(self, series: pd.Series) -> np.ndarray:
+        """Values as float array; datetimes are compared by year."""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.year
+        if not pd.api.types.is_numeric_dtype(series):
+            return np.empty(0)
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def _count_out_of_range(
+        self,
+        rule: ValidationRule,
+        values: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ) -> int:
+        """Count values below the minimum or above the maximum."""
+        if not len(values):
+            return 0
+        count = 0
+        if rule.min_value is not None:
+            count += self._count(values < rule.min_value, weights)
+        if rule.max_value is not None:
+            count += self._count(values > rule.max_value, weights)
+        return count
+
+    def _count_not_allowed(
+        self,
+        rule: ValidationRule,
+        series: pd.Series,
+        weights: Optional[np.ndarray] = None,
+    ) -> int:
+        """Count non-null values outside the allowed set."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Check the categories once and weight them by their frequency
+            codes = series.cat.codes.to_numpy()
+            present = codes >= 0
+            frequencies = np.bincount(
+                codes[present],
+                weights=None if weights is None else weights[present],
+                minlength=len(series.cat.categories),
+            )
+            allowed = series.cat.categories.astype(str).isin(
+                rule.allowed_values
+            )
+            return int(frequencies[~allowed].sum())
+        allowed = series.isin(list(rule.allowed_values)).to_numpy()
+        return self._count(series.notna().to_numpy() & ~allowed, weights)
@@ -1,15 +1,44 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
 from etl_pipeline import ETLStep
+from etl_pipeline.transform.data_features import FEATURES, FeatureRegistry
+
+DEFAULT_FEATURES = ["respiratory_deaths_per_100k"]
 
 
 class FeatureEngineeringStep(ETLStep):
-    """Step to perform feature engineering."""
+    """
+    Step to perform feature engineering.
+
+    Computes the features listed in 'features.enabled' of the pipeline
+    configuration from a FeatureRegistry, in dependency order. Each
+    feature is added as a column of 'output_df' in place; features whose
+    input columns are missing are skipped with a warning.
+    """
+
+    def __init__(self, registry: Optional[FeatureRegistry] = None):
+        """
+        Initialize the step.
 
-    def __init__(self):
+        Args:
+            registry (Optional[FeatureRegistry]): Feature definitions.
+                Defaults to the built-in features.
+        """
         super().__init__(__name__)
+        self.registry = registry if registry is not None else FEATURES
+        try:
+            from etl_pipeline.config.config_manager import get_config
+
+            self.features: List[str] = get_config().get(
+                "features.enabled", DEFAULT_FEATURES
+            )
+        except ImportError:
+            self.logger.warning(
+                "Configuration manager not available, using default features"
+            )
+            self.features = DEFAULT_FEATURES
 
     def execute(
         self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
@@ -26,22 +55,19 @@ class FeatureEngineeringStep(ETLStep):
                 )
             )
 
-        # Create respiratory diseases per 100k population column
-        self._respiratory_deaths_per_100k(dataframes["output_df"])
+        df = dataframes["output_df"]
+        for feature in self.registry.plan(self.features):
+            missing = [col for col in feature.inputs if col not in df.columns]
+            if missing:
+                self.logger.warning(
+                    f"Skipping feature '{feature.name}': missing input "
+                    f"columns {missing}"
+                )
+                continue
+            df[feature.name] = feature.compute(df)
+            self.logger.info(f"Calculated {feature.name}")
 
         self.log_success(
             f"Features engineered: "
             f"{len(dataframes['output_df'].columns)} total columns"
         )
-
-    def _respiratory_deaths_per_100k(self, df: pd.DataFrame) -> None:
-        """Calculate respiratory deaths per 100k population."""
-        if (
-            "Respiratory_diseases_total" in df.columns
-            and "Population" in df.columns
-        ):
-            df["respiratory_deaths_per_100k"] = round(
-                (df["Respiratory_diseases_total"] / df["Population"]) * 100000,
-                2,
-            )
-            self.logger.info("Calculated respiratory_deaths_per_100k")
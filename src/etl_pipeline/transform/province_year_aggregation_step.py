@@ -0,0 +1,260 @@
+import re
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from etl_pipeline import ETLStep
+from etl_pipeline.transform.data_cleaning_step import (
+    excluded_region_rows,
+    rows_outside_timeframe,
+)
+from etl_pipeline.transform.data_validators.validation_rule_plan import (
+    standardize_column_name,
+)
+
+DEFAULT_OPTIONS: Dict[str, Any] = {
+    "pollutant_column": "Air Pollutant",
+    "value_column": "Air Pollution Level",
+    "statistics": ["mean", "p95", "max", "count"],
+    "province_year_columns": [
+        "Respiratory_diseases_total",
+        "Life_expectancy_total",
+        "pib",
+        "Population",
+    ],
+}
+
+_PERCENTILE = re.compile(r"^p(\d{1,2})$")
+
+
+class ProvinceYearAggregationStep(ETLStep):
+    """
+    Aggregates the merged station measurements to one row per province
+    and year.
+
+    The merged dataset has one row per station and pollutant, and repeats
+    the health, GDP and population values of the province on every row.
+    This step builds 'province_year_df', a compact modeling table with:
+    - province and year;
+    - one column per pollutant and statistic ('no2_mean', 'no2_p95',
+      ...), with the statistics listed in 'province_year_aggregation'
+      of the pipeline configuration: mean, min, max, count, or pNN for
+      the NN-th percentile;
+    - the province-year columns, taken once per province and year.
+    Column names are standardized like DataCleaningStep does. The step
+    runs before DataCleaningStep, so the rows of excluded regions and
+    outside the time range are left out with the same filters; 'output_df'
+    is left unchanged for the station-level steps.
+
+    Every statistic is vectorized over integer cell codes (province-year
+    pair x pollutant): sums and counts come from np.bincount, and min,
+    max and percentiles from one sort of the values by cell.
+
+    The step is disabled by default; enable it in 'pipeline.steps'.
+    """
+
+    def __init__(self):
+        super().__init__(__name__)
+        try:
+            from etl_pipeline.config.config_manager import get_config
+
+            config = get_config()
+            options = config.get("province_year_aggregation", {})
+            self.processing_config = config.get_processing_config()
+        except ImportError:
+            self.logger.warning(
+                "Configuration manager not available, using default "
+                "aggregation settings"
+            )
+            options = {}
+            self.processing_config = {}
+        self.options: Dict[str, Any] = {**DEFAULT_OPTIONS, **options}
+        self.statistics: List[str] = list(self.options["statistics"])
+        for statistic in self.statistics:
+            self._percentile(statistic)
+
+    def execute(
+        self, dataframes: Dict[str, pd.DataFrame], context: Dict[str, Any]
+    ) -> None:
+        """
+        Build 'province_year_df' from 'output_df'.
+
+        Raises:
+            ValueError: If 'output_df' is missing or lacks the province,
+                year, pollutant or value columns.
+        """
+        self.log_start()
+
+        if "output_df" not in dataframes:
+            raise ValueError(
+                "'output_df' is missing in the dataframes dictionary. "
+                "Make sure the merging step has been executed before "
+                "the province-year aggregation."
+            )
+
+        df = dataframes["output_df"]
+        pollutant_column = self.options["pollutant_column"]
+        value_column = self.options["value_column"]
+        missing = [
+            col
+            for col in ["Province", "Year", pollutant_column, value_column]
+            if col not in df.columns
+        ]
+        if missing:
+            raise ValueError(f"output_df missing columns: {missing}")
+
+        dataframes["province_year_df"] = self._aggregate(df)
+        self.log_success(
+            f"Aggregated {len(df)} records to "
+            f"{len(dataframes['province_year_df'])} province-year rows"
+        )
+
+    def _aggregate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pivot the pollutant statistics of every province and year.
+
+        Args:
+            df (pd.DataFrame): Merged station-level dataset.
+
+        Returns:
+            pd.DataFrame: One row per province and year, sorted by both.
+        """
+        keep = (df["Province"].notna() & df["Year"].notna()).to_numpy()
+        if not keep.all():
+            self.logger.warning(
+                f"Skipping {int((~keep).sum())} records without province "
+                f"or year"
+            )
+        # Same scope as the cleaned station-level dataset
+        for rows in (
+            excluded_region_rows(df, self.processing_config),
+            rows_outside_timeframe(df, self.processing_config),
+        ):
+            if rows is not None:
+                keep &= ~rows.to_numpy()
+        if not keep.all():
+            df = df[keep]
+
+        province_codes, provinces = pd.factorize(df["Province"], sort=True)
+        year_codes, years = pd.factorize(df["Year"], sort=True)
+        # Pairs are found with bincount over the dense pair keys instead
+        # of sorting the rows
+        keys = province_codes * len(years) + year_codes
+        n_keys = len(provinces) * len(years)
+        is_pair = np.bincount(keys, minlength=n_keys) > 0
+        pairs = np.flatnonzero(is_pair)
+        pair_codes = (np.cumsum(is_pair) - 1)[keys]
+        first_rows = np.full(n_keys, len(keys))
+        np.minimum.at(first_rows, keys, np.arange(len(keys)))
+        first_rows = first_rows[pairs]
+
+        pollutant_codes, pollutants = pd.factorize(
+            df[self.options["pollutant_column"]], sort=True
+        )
+        values = df[self.options["value_column"]].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        present = ~np.isnan(values) & (pollutant_codes >= 0)
+        cells = (pair_codes * len(pollutants) + pollutant_codes)[present]
+        values = values[present]
+        shape = (len(pairs), len(pollutants))
+
+        columns = [
+            col
+            for col in self.options["province_year_columns"]
+            if col in df.columns
+        ]
+        table = df[["Province", "Year"] + columns].iloc[first_rows]
+        table = table.reset_index(drop=True)
+
+        statistics = self._statistics(cells, values, shape)
+        pivoted = {
+            f"{str(pollutant).lower()}_{statistic}": statistics[statistic][
+                :, index
+            ]
+            for index, pollutant in enumerate(pollutants)
+            for statistic in self.statistics
+        }
+        table = pd.concat([table, pd.DataFrame(pivoted)], axis=1)
+        table.columns = [standardize_column_name(col) for col in table]
+        return table
+
+    def _statistics(
+        self, cells: np.ndarray, values: np.ndarray, shape: Tuple[int, int]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Configured statistics of the values of every cell.
+
+        Args:
+            cells (np.ndarray): Cell code of every value.
+            values (np.ndarray): Non-missing values.
+            shape (Tuple[int, int]): Province-year pairs x pollutants.
+
+        Returns:
+            Dict[str, np.ndarray]: One (pairs, pollutants) array per
+                statistic; cells without values are NaN (0 for count).
+        """
+        size = shape[0] * shape[1]
+        counts = np.bincount(cells, minlength=size)
+        has_values = counts > 0
+        results: Dict[str, np.ndarray] = {}
+
+        # Values sorted by cell, then by value: every cell is one sorted
+        # run, starting at 'starts'. The values are sorted first, then
+        # stably by cell; cell codes are cast to the smallest integer
+        # type, so NumPy radix sorts them
+        sorted_values = values
+        if any(s not in ("count", "mean") for s in self.statistics):
+            order = np.argsort(values)
+            cell_codes = cells[order].astype(np.min_scalar_type(size))
+            order = order[np.argsort(cell_codes, kind="stable")]
+            sorted_values = values[order]
+        starts = np.cumsum(counts) - counts
+
+        for statistic in self.statistics:
+            if statistic == "count":
+                result = counts.astype(np.int64)
+            elif statistic == "mean":
+                totals = np.bincount(cells, weights=values, minlength=size)
+                result = np.full(size, np.nan)
+                result[has_values] = totals[has_values] / counts[has_values]
+            else:
+                if statistic == "min":
+                    q = 0.0
+                elif statistic == "max":
+                    q = 1.0
+                else:
+                    q = self._percentile(statistic) / 100
+                result = np.full(size, np.nan)
+                # Linear interpolation between order statistics, like
+                # Series.quantile
+                position = q * (counts[has_values] - 1)
+                low = np.floor(position).astype(np.int64)
+                high = np.ceil(position).astype(np.int64)
+                first = starts[has_values]
+                low_values = sorted_values[first + low]
+                high_values = sorted_values[first + high]
+                result[has_values] = low_values + (
+                    high_values - low_values
+                ) * (position - low)
+            results[statistic] = result.reshape(shape)
+        return results
+
+    @staticmethod
+    def _percentile(statistic: str) -> int:
+        """
+        Percentile of a 'pNN' statistic, 0 for the other statistics.
+
+        Raises:
+            ValueError: If the statistic is not supported.
+        """
+        if statistic in ("mean", "min", "max", "count"):
+            return 0
+        match = _PERCENTILE.match(statistic)
+        if match is None:
+            raise ValueError(
+                f"Unsupported aggregation statistic: '{statistic}'. "
+                f"Supported: mean, min, max, count and pNN percentiles"
+            )
+        return int(match.group(1))
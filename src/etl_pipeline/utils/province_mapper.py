@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Set
 
+import numpy as np
 import pandas as pd
 
 from common.utils import file_utils
@@ -47,6 +48,17 @@ class ProvinceMapper:
                 f"{num_provinces}."
             )
 
+    @staticmethod
+    def preload() -> None:
+        """
+        Load the mapping file unless it is already cached.
+
+        The mapping is kept on the class, so long-running processes load
+        it once and reuse it across pipeline runs.
+        """
+        if not ProvinceMapper.unified_province_dict:
+            ProvinceMapper._load_json_file()
+
     @staticmethod
     def map_province_name(df: pd.DataFrame) -> None:
         """
@@ -67,7 +79,7 @@ class ProvinceMapper:
         if "Province" not in df.columns:
             raise KeyError("Missing required column: 'Province'")
 
-        ProvinceMapper._load_json_file()
+        ProvinceMapper.preload()
         ProvinceMapper.logger.info("Mapping province names...")
 
         # Create flat mapping from all aliases to official names
@@ -79,13 +91,25 @@ class ProvinceMapper:
             for alias in aliases
         }
 
-        # Apply mapping and convert to category
-        df["Province"] = (
-            df["Province"]
-            .astype(str)
-            .replace(province_mapping)  # type: ignore
+        # Map each distinct name once and expand the result with
+        # categorical codes, instead of matching every alias on every row
+        codes, uniques = pd.factorize(df["Province"])
+        names = [str(name) for name in uniques]
+        missing = codes < 0
+        if missing.any():
+            # Missing values become 'nan' or 'None', like astype(str)
+            missing_codes, missing_names = pd.factorize(
+                df["Province"][missing].astype(str)
+            )
+            codes[missing] = missing_codes + len(names)
+            names += list(missing_names)
+        mapped = [province_mapping.get(name, name) for name in names]
+        categories = sorted(set(mapped))
+        positions = {name: i for i, name in enumerate(categories)}
+        remap = np.array([positions[name] for name in mapped], dtype=np.int64)
+        df["Province"] = pd.Categorical.from_codes(
+            remap[codes], categories=pd.Index(categories, dtype=object)
         )
-        df["Province"] = df["Province"].astype("category")
 
         ProvinceMapper._check_provinces(df)
 